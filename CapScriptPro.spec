@@ -14,11 +14,14 @@ a = Analysis(
         'PySide6.QtCore',
         'PySide6.QtWidgets',
         'cli',
+        'job_queue',
         'gui_utils',
         'gui_widgets',
         'gui_workers',
         'gui_styles',
         'gui_list_creator',
+        'gui_cache',
+        'youtube_api',
     ],
     hookspath=[],
     hooksconfig={},
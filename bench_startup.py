@@ -0,0 +1,147 @@
+"""Startup benchmark for the CLI.
+
+Runs each scenario in fresh interpreters and fails (exit code 1) when the
+median wall time exceeds the budget, when `import cli` pulls in one of the
+heavy libraries, or when the API key derivation is not cached.
+
+    python bench_startup.py [--runs 5] [--budget-ms 400]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_RUNS = 5
+DEFAULT_BUDGET_MS = 400
+
+# Must not be imported until a search actually needs them.
+HEAVY_MODULES = (
+    "googleapiclient",
+    "youtube_transcript_api",
+    "rich",
+    "cryptography",
+    "requests",
+)
+
+SCENARIOS = [
+    ("import cli", [sys.executable, "-c", "import cli"]),
+    ("cli.py --help", [sys.executable, "cli.py", "--help"]),
+    (
+        "cli.py --plan",
+        [
+            sys.executable, "cli.py", "--search-type", "video",
+            "--video-ids", "dQw4w9WgXcQ", "--keyword", "test", "--plan",
+        ],
+    ),
+]
+
+HEAVY_CHECK = (
+    "import sys, cli\n"
+    f"loaded = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+    "print(','.join(loaded))\n"
+)
+
+KEY_CACHE_CHECK = (
+    "import time, cli\n"
+    "start = time.perf_counter(); cli._get_encryption_key()\n"
+    "first = time.perf_counter() - start\n"
+    "start = time.perf_counter(); cli._get_encryption_key()\n"
+    "second = time.perf_counter() - start\n"
+    "print(f'{first * 1000:.1f} {second * 1000:.3f}')\n"
+)
+
+def time_command(command, runs):
+    """Return ``(median_ms, best_ms, error)``; ``error`` is set if any run exited non-zero."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=False
+        )
+        samples.append((time.perf_counter() - start) * 1000)
+        if result.returncode != 0:
+            lines = result.stderr.strip().splitlines()
+            return None, None, f"exit code {result.returncode}: {lines[-1] if lines else 'no output'}"
+    return statistics.median(samples), min(samples), None
+
+def check_heavy_imports():
+    result = subprocess.run(
+        [sys.executable, "-c", HEAVY_CHECK], cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return None, result.stderr.strip()
+    loaded = result.stdout.strip()
+    return [name for name in loaded.split(",") if name], None
+
+def has_cryptography():
+    result = subprocess.run(
+        [sys.executable, "-c", "import cryptography"], cwd=ROOT, capture_output=True, text=True
+    )
+    return result.returncode == 0
+
+def check_key_cache():
+    """Return ``(first_ms, second_ms, error)``."""
+    result = subprocess.run(
+        [sys.executable, "-c", KEY_CACHE_CHECK], cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        return None, None, lines[-1] if lines else f"exit code {result.returncode}"
+    first, second = (float(value) for value in result.stdout.split())
+    return first, second, None
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure CLI startup time against a budget.")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help=f"Runs per scenario (default: {DEFAULT_RUNS}).")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help=f"Maximum median wall time per scenario in ms (default: {DEFAULT_BUDGET_MS}).",
+    )
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'scenario':<20} {'median':>10} {'best':>10}")
+    for name, command in SCENARIOS:
+        median_ms, best_ms, error = time_command(command, args.runs)
+        if error:
+            print(f"{name:<20} {'FAILED':>10}")
+            failures.append(f"{name} failed ({error})")
+            continue
+        status = "" if median_ms <= args.budget_ms else "  OVER BUDGET"
+        print(f"{name:<20} {median_ms:>8.1f}ms {best_ms:>8.1f}ms{status}")
+        if status:
+            failures.append(f"{name} took {median_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    loaded, error = check_heavy_imports()
+    if loaded is None:
+        failures.append(f"import cli failed: {error}")
+    elif loaded:
+        failures.append(f"import cli loaded heavy modules: {', '.join(loaded)}")
+    else:
+        print("import cli loads none of: " + ", ".join(HEAVY_MODULES))
+
+    if not has_cryptography():
+        print("Key derivation: skipped (cryptography not installed).")
+    else:
+        first, second, error = check_key_cache()
+        if error:
+            failures.append(f"key derivation check failed: {error}")
+        else:
+            print(f"Key derivation: first call {first:.1f}ms, cached call {second:.3f}ms")
+            if second > 1.0:
+                failures.append(f"cached key derivation took {second:.3f} ms")
+
+    if failures:
+        print("\nFAILED:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\nAll startup checks passed.")
+
+if __name__ == "__main__":
+    main()
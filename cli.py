@@ -4,19 +4,31 @@ import time
 import configparser
 import argparse
 import base64
+import functools
+import math
 from datetime import timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from youtube_transcript_api import YouTubeTranscriptApi
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-from youtube_transcript_api._errors import NoTranscriptFound, TranscriptsDisabled
-from rich.table import Column
-from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+# youtube_transcript_api, googleapiclient, rich and cryptography are imported
+# inside the functions that use them so `--help`, `--plan` and argument
+# errors don't pay for loading them.
+from youtube_api import (
+    build_service,
+    get_service,
+    ServicePool,
+    QuotaBudgetExceeded,
+    get_quota_ledger,
+    set_quota_budget,
+    configure_api_keys,
+    describe_key,
+    KEY_STRATEGIES,
+    KEY_STRATEGY_REMAINING,
+    get_uploads_playlist_id,
+    iter_uploads,
+)
 
 MAX_WORKERS = 10
+# Any public video works; videos.list costs 1 unit where search.list costs 100.
+KEY_CHECK_VIDEO_ID = "dQw4w9WgXcQ"
 DEFAULT_OUTPUT_DIR = "transcripts"
 
 def _get_application_root_path():
@@ -28,12 +40,17 @@ def _get_application_root_path():
 PREFERENCES_FILE_PATH = os.path.join(_get_application_root_path(), "preferences.ini")
 _PREFERENCES_SECTION = "Preferences"
 _API_KEY_OPTION = "API_KEY"
+_API_KEYS_OPTION = "API_KEYS"
 
 def is_valid_api_key(api_key):
-    print(f"Attempting to validate API key: {api_key[:4]}...{api_key[-4:]}")
+    from googleapiclient.errors import HttpError
+
+    print(f"Attempting to validate API key: {describe_key(api_key)}")
     try:
-        youtube = build("youtube", "v3", developerKey=api_key)
-        youtube.search().list(part="id", maxResults=1, q="test").execute()
+        # Pinned to this key: with a key pool configured, a rotating client
+        # would send the check with whichever key the pool picks.
+        youtube = build_service(api_key, rotate_keys=False)
+        youtube.videos().list(part="id", id=KEY_CHECK_VIDEO_ID).execute()
         print("API key validation successful.")
         return True
     except HttpError as e:
@@ -44,9 +61,12 @@ def is_valid_api_key(api_key):
         return False
 
 def get_authenticated_service(api_key):
-    return build("youtube", "v3", developerKey=api_key)
+    return get_service(api_key)
 
 def has_captions(video_id, language_code):
+    from youtube_transcript_api import YouTubeTranscriptApi
+    from youtube_transcript_api._errors import NoTranscriptFound, TranscriptsDisabled
+
     try:
         ytt_api = YouTubeTranscriptApi()
         transcript_list = ytt_api.list(video_id)
@@ -90,8 +110,15 @@ def get_video_details(youtube, video_id):
 def format_views(views):
     return "{:,}".format(views)
 
+@functools.lru_cache(maxsize=1)
 def _get_encryption_key():
-    """Generate a consistent encryption key based on machine-specific data."""
+    """Generate a consistent encryption key based on machine-specific data.
+
+    The 100,000-iteration PBKDF2 runs once per process; the inputs don't
+    change while it runs.
+    """
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
     machine_id = os.environ.get('COMPUTERNAME', 'default') + os.environ.get('USERNAME', 'user')
     salt = machine_id.encode()[:16].ljust(16, b'0')  
@@ -110,6 +137,8 @@ def _encrypt_api_key(api_key):
     try:
         if not api_key:
             return ""
+        from cryptography.fernet import Fernet
+
         fernet = Fernet(_get_encryption_key())
         encrypted = fernet.encrypt(api_key.encode())
         return base64.urlsafe_b64encode(encrypted).decode()
@@ -122,6 +151,8 @@ def _decrypt_api_key(encrypted_key):
     try:
         if not encrypted_key:
             return ""
+        from cryptography.fernet import Fernet
+
         fernet = Fernet(_get_encryption_key())
         encrypted_bytes = base64.urlsafe_b64decode(encrypted_key.encode())
         decrypted = fernet.decrypt(encrypted_bytes)
@@ -131,7 +162,11 @@ def _decrypt_api_key(encrypted_key):
         print(f"Warning: Could not decrypt API key, using as-is: {e}")
         return encrypted_key
 
-def save_preferences(api_key):
+def parse_api_keys(keys_input):
+    """Split a comma-separated list of API keys, dropping blanks and duplicates."""
+    return list(dict.fromkeys(key.strip() for key in keys_input.split(",") if key.strip()))
+
+def save_api_keys(api_keys):
     config = configparser.ConfigParser()
     if not os.path.exists(os.path.dirname(PREFERENCES_FILE_PATH)):
         try:
@@ -140,8 +175,12 @@ def save_preferences(api_key):
             print(f"Error creating directory for preferences: {e}")
             return False
 
-    encrypted_key = _encrypt_api_key(api_key)
-    config[_PREFERENCES_SECTION] = {_API_KEY_OPTION: encrypted_key}
+    encrypted_keys = [_encrypt_api_key(key) for key in api_keys]
+    # API_KEY keeps the primary key where older versions look for it.
+    config[_PREFERENCES_SECTION] = {
+        _API_KEY_OPTION: encrypted_keys[0] if encrypted_keys else "",
+        _API_KEYS_OPTION: ",".join(encrypted_keys),
+    }
     try:
         with open(PREFERENCES_FILE_PATH, "w", encoding="utf-8") as configfile:
             config.write(configfile)
@@ -150,20 +189,30 @@ def save_preferences(api_key):
         print(f"Error writing preferences file '{PREFERENCES_FILE_PATH}': {e}")
         return False
 
-def load_preferences():
+def save_preferences(api_key):
+    """Store ``api_key`` as the primary key, keeping any other saved keys."""
+    return save_api_keys([api_key] + [key for key in load_api_keys() if key != api_key])
+
+def load_api_keys():
     config = configparser.ConfigParser()
     if not os.path.exists(PREFERENCES_FILE_PATH):
 
-        return ""
+        return []
     try:
         config.read(PREFERENCES_FILE_PATH, encoding="utf-8")
-        encrypted_key = config.get(_PREFERENCES_SECTION, _API_KEY_OPTION, fallback="")
+        encrypted_keys = config.get(_PREFERENCES_SECTION, _API_KEYS_OPTION, fallback="")
+        if not encrypted_keys:
+            encrypted_keys = config.get(_PREFERENCES_SECTION, _API_KEY_OPTION, fallback="")
 
-        api_key = _decrypt_api_key(encrypted_key)
-        return api_key
+        api_keys = [_decrypt_api_key(key) for key in encrypted_keys.split(",") if key]
+        return [key for key in api_keys if key]
     except (configparser.Error, IOError) as e:
         print(f"Error reading preferences file '{PREFERENCES_FILE_PATH}': {e}")
-        return ""
+        return []
+
+def load_preferences():
+    api_keys = load_api_keys()
+    return api_keys[0] if api_keys else ""
 
 def format_time(seconds):
     hours, remainder = divmod(seconds, 3600)
@@ -196,62 +245,90 @@ def parse_video_ids(video_ids_input):
     )
     return None
 
+def _channel_video_pages(youtube, channel_id, page_size):
+    """Yield the channel's video IDs a page at a time, newest first.
+
+    Walks the uploads playlist (1 unit per page) and only falls back to
+    search.list (100 units per page) when the channel has no such playlist.
+    """
+    playlist_id = get_uploads_playlist_id(youtube, channel_id)
+    if playlist_id:
+        page = []
+        for video_id, _, _ in iter_uploads(youtube, playlist_id, page_size):
+            page.append(video_id)
+            if len(page) == page_size:
+                yield page
+                page = []
+        if page:
+            yield page
+        return
+
+    nextPageToken = None
+    while True:
+        response = (
+            youtube.search()
+            .list(
+                part="id",
+                channelId=channel_id,
+                type="video",
+                maxResults=page_size,
+                order="date",
+                pageToken=nextPageToken,
+            )
+            .execute()
+        )
+        yield [
+            item["id"]["videoId"]
+            for item in response.get("items", [])
+            if "videoId" in item["id"]
+        ]
+        nextPageToken = response.get("nextPageToken")
+        if not nextPageToken:
+            return
+
 def get_channel_videos(youtube, channel_id, language_code="en", max_results=10):
+    from googleapiclient.errors import HttpError
+
     video_ids = []
-    nextPageToken = None
     fetched_count = 0
 
     print(
         f"Fetching up to {max_results} videos with '{language_code}' captions for channel {channel_id}..."
     )
 
-    while fetched_count < max_results:
-        try:
-            results_to_request = min(50, max_results * 2)
-            response = (
-                youtube.search()
-                .list(
-                    part="id",
-                    channelId=channel_id,
-                    type="video",
-                    maxResults=results_to_request,
-                    order="date",
-                    pageToken=nextPageToken,
+    try:
+        for page in _channel_video_pages(youtube, channel_id, min(50, max_results * 2)):
+            candidates = []
+            for video_id in page:
+                if video_id not in video_ids and video_id not in candidates:
+                    candidates.append(video_id)
+
+            # Caption checks don't touch the Data API client, so a page's
+            # worth can run at once; results stay in upload order.
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                caption_flags = executor.map(
+                    lambda vid: has_captions(vid, language_code), candidates
                 )
-                .execute()
-            )
-
-            items = response.get("items", [])
-            if not items and not nextPageToken:
-                print("No more videos found for the channel.")
-                break
-
-            for item in items:
-                if "videoId" in item["id"]:
-                    video_id = item["id"]["videoId"]
-                    if video_id not in video_ids:
-                        if has_captions(video_id, language_code):
-                            video_ids.append(video_id)
-                            fetched_count += 1
-                            print(
-                                f"Found video with captions: {video_id} ({fetched_count}/{max_results})"
-                            )
-                            if fetched_count >= max_results:
-                                break
+                for video_id, captioned in zip(candidates, caption_flags):
+                    if captioned:
+                        video_ids.append(video_id)
+                        fetched_count += 1
+                        print(
+                            f"Found video with captions: {video_id} ({fetched_count}/{max_results})"
+                        )
+                        if fetched_count >= max_results:
+                            break
 
             if fetched_count >= max_results:
                 break
-
-            nextPageToken = response.get("nextPageToken")
-            if not nextPageToken:
-                print("Reached end of channel videos.")
-                break
-        except HttpError as e:
-            print(f"An HTTP error {e.resp.status} occurred: {e.content}")
-            break
-        except Exception as e:
-            print(f"An unexpected error occurred during video fetching: {e}")
-            break
+        else:
+            print("Reached end of channel videos.")
+    except HttpError as e:
+        print(f"An HTTP error {e.resp.status} occurred: {e.content}")
+    except QuotaBudgetExceeded as e:
+        print(f"Stopping video fetching: {e}")
+    except Exception as e:
+        print(f"An unexpected error occurred during video fetching: {e}")
 
     if not video_ids:
         print(
@@ -261,33 +338,142 @@ def get_channel_videos(youtube, channel_id, language_code="en", max_results=10):
         print(f"Collected {len(video_ids)} video IDs with captions.")
     return video_ids[:max_results]
 
-def fetch_transcript(video_id, language_code, target_word):
+def get_transcript(video_id, language_code):
+    """Raw transcript entries for a video, or [] if it has none in that language."""
+    from youtube_transcript_api import YouTubeTranscriptApi
+    from youtube_transcript_api._errors import NoTranscriptFound, TranscriptsDisabled
+
     try:
         ytt_api = YouTubeTranscriptApi()
         fetched_transcript = ytt_api.fetch(video_id, languages=[language_code])
-        transcript = fetched_transcript.to_raw_data()
+        return fetched_transcript.to_raw_data()
+    except (NoTranscriptFound, TranscriptsDisabled):
+        return []
+
+def fetch_transcript(video_id, language_code, target_word):
+    try:
+        transcript = get_transcript(video_id, language_code)
         transcript_items = [
             item for item in transcript if target_word.lower() in item["text"].lower()
         ]
         return transcript_items
-    except (NoTranscriptFound, TranscriptsDisabled):
-        return []
     except Exception as e:
         print(f"Error fetching transcript for {video_id}: {e}")
         return []
 
+def estimate_quota(search_type, max_results=0, video_count=0, validate_keys=0):
+    """Return ``(min_units, max_units, calls)`` for a run; ``calls`` maps method to (min, max) calls.
+
+    The upper bound assumes every video matches and needs a videos.list
+    lookup. Channels with many uncaptioned uploads may need extra pages.
+    """
+    calls = {}
+    if validate_keys:
+        calls["videos.list"] = (validate_keys, validate_keys)
+    if search_type == "channel":
+        page_size = min(50, max_results * 2)
+        calls["channels.list"] = (1, 1)
+        calls["playlistItems.list"] = (max(1, math.ceil(max_results / page_size)), None)
+        video_count = max_results
+    low, high = calls.get("videos.list", (0, 0))
+    calls["videos.list"] = (low, high + video_count)
+
+    ledger = get_quota_ledger()
+    min_units = sum(ledger.cost_of(method) * low for method, (low, _) in calls.items())
+    max_units = sum(
+        ledger.cost_of(method) * (high if high is not None else low)
+        for method, (low, high) in calls.items()
+    )
+    return min_units, max_units, calls
+
+def print_quota_plan(min_units, max_units, calls, key_count=1):
+    ledger = get_quota_ledger()
+    print("Estimated Data API quota for this run:")
+    for method, (low, high) in sorted(calls.items()):
+        if high is None:
+            count = f"{low}+"
+        elif high == low:
+            count = f"{low}"
+        else:
+            count = f"{low}-{high}"
+        print(f"  {method:<20} {count:>8} call(s) x {ledger.cost_of(method)} unit(s)")
+    print(f"  Total: {min_units}-{max_units} units")
+    print(f"Used today: {ledger.used_today()} units, remaining: {ledger.remaining(key_count)} units across {max(1, key_count)} key(s).")
+
+def format_result_block(video_id, details, transcript_items):
+    """The text block written to the results file for one matching video."""
+    title, channel_title, channel_id, date_uploaded, views = details
+    video_text = f"Video Title: {title}\n"
+    video_text += f"Video ID: {video_id}\n"
+    video_text += f"Channel Name: {channel_title}\n"
+    video_text += f"Channel ID: {channel_id}\n"
+    video_text += f"Date Uploaded: {date_uploaded}\n"
+    video_text += f"Views: {format_views(views)}\n"
+    video_text += "Timestamps:\n"
+    for item in transcript_items:
+        time_str = format_time(item["start"])
+        video_text += f"╳ {time_str} - {item['text']}\n"
+    video_text += "\n══════════════════════════════════════════════\n\n"
+    return video_text
+
+def write_results(output_dir, target_word, result_blocks, file_prefix=""):
+    """Write ``result_blocks`` to ``<file_prefix><keyword>_matches.txt`` in ``output_dir``; returns the path."""
+    safe_keyword = (
+        "".join(
+            c if c.isalnum() or c in (" ", "_", "-") else "_" for c in target_word
+        )
+        .rstrip()
+        .replace(" ", "_")
+    )
+    output_file_name = f"{file_prefix}{safe_keyword}_matches.txt"
+    output_file_path = os.path.join(output_dir, output_file_name)
+    os.makedirs(output_dir, exist_ok=True)
+    with open(output_file_path, "w", encoding="utf-8") as output_file:
+        output_file.writelines(result_blocks)
+    return output_file_path
+
+def search_video(pool, video_id, language_code, target_word):
+    """Fetch matches for one video and, if there are any, its details."""
+    transcript_items = fetch_transcript(video_id, language_code, target_word)
+    if not transcript_items:
+        return transcript_items, None
+    with pool.client() as youtube:
+        return transcript_items, get_video_details(youtube, video_id)
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        from server import main as serve_main
+
+        serve_main(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == "queue":
+        from job_queue import main as queue_main
+
+        queue_main(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(
-        description="Search YouTube video captions for specific keywords."
+        description="Search YouTube video captions for specific keywords.",
+        epilog="Run 'cli.py serve --help' to keep a local search server running instead, "
+        "or 'cli.py queue --help' to queue searches and run them in the background.",
     )
 
     parser.add_argument(
-        "--api-key", type=str, help="Your YouTube Data API key. Overrides stored key."
+        "--api-key",
+        type=str,
+        help="Your YouTube Data API key, or several comma-separated keys to rotate between. Overrides stored keys.",
     )
     parser.add_argument(
         "--save-api-key",
         action="store_true",
-        help="Save the provided API key to preferences.ini.",
+        help="Save the provided API key(s) to preferences.ini.",
+    )
+    parser.add_argument(
+        "--key-strategy",
+        type=str,
+        default=KEY_STRATEGY_REMAINING,
+        choices=KEY_STRATEGIES,
+        help="How to pick between several API keys: the one with the most quota left today, or round-robin (default: remaining).",
     )
 
     parser.add_argument(
@@ -334,37 +520,76 @@ def main():
         help="Comma-separated list of Video IDs or path to a file containing Video IDs (required if search-type is 'video').",
     )
 
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="Print the estimated Data API quota cost of the search and exit.",
+    )
+    parser.add_argument(
+        "--quota-budget",
+        type=int,
+        help="Maximum Data API units to spend today; calls beyond it are refused.",
+    )
+
     args = parser.parse_args()
 
-    API_KEY = args.api_key
-    if not API_KEY:
-        API_KEY = load_preferences()
-        if not API_KEY:
+    if args.search_type == "channel":
+        if not args.channel_id:
+            parser.error("--channel-id is required when --search-type is 'channel'")
+        if args.max_results <= 0:
+            parser.error("--max-results must be a positive integer.")
+    elif args.search_type == "video":
+        if not args.video_ids:
+            parser.error("--video-ids is required when --search-type is 'video'")
+    if args.quota_budget is not None:
+        if args.quota_budget <= 0:
+            parser.error("--quota-budget must be a positive integer.")
+        set_quota_budget(args.quota_budget)
+
+    parsed_video_ids = None
+    if args.search_type == "video":
+        parsed_video_ids = parse_video_ids(args.video_ids)
+    min_units, max_units, calls = estimate_quota(
+        args.search_type,
+        max_results=args.max_results,
+        video_count=len(parsed_video_ids or []),
+        validate_keys=len(parse_api_keys(args.api_key)) if args.api_key else 0,
+    )
+    if args.plan:
+        key_count = len(parse_api_keys(args.api_key) if args.api_key else load_api_keys())
+        print_quota_plan(min_units, max_units, calls, key_count)
+        sys.exit(0)
+
+    api_keys = parse_api_keys(args.api_key) if args.api_key else []
+    if not api_keys:
+        api_keys = load_api_keys()
+        if not api_keys:
             print(
                 "Error: YouTube Data API key not found. Please provide one using --api-key or ensure it's in preferences.ini."
             )
             sys.exit(1)
         else:
-            print(f"Using API key from {PREFERENCES_FILE_PATH}.")
+            print(f"Using {len(api_keys)} API key(s) from {PREFERENCES_FILE_PATH}.")
     else:
-        print("Using API key provided via argument.")
-        if not is_valid_api_key(API_KEY):
-            print("Error: The provided API key is invalid.")
-            sys.exit(1)
+        print(f"Using {len(api_keys)} API key(s) provided via argument.")
+        for api_key in api_keys:
+            if not is_valid_api_key(api_key):
+                print(f"Error: The provided API key {describe_key(api_key)} is invalid.")
+                sys.exit(1)
         if args.save_api_key:
-            if save_preferences(API_KEY):
-                print(f"API key saved to {PREFERENCES_FILE_PATH}.")
+            if save_api_keys(api_keys):
+                print(f"API key(s) saved to {PREFERENCES_FILE_PATH}.")
             else:
-                print(f"Failed to save API key to {PREFERENCES_FILE_PATH}.")
+                print(f"Failed to save API key(s) to {PREFERENCES_FILE_PATH}.")
+    configure_api_keys(api_keys, args.key_strategy)
+    API_KEY = api_keys[0]
 
-    if args.search_type == "channel":
-        if not args.channel_id:
-            parser.error("--channel-id is required when --search-type is 'channel'")
-        if args.max_results <= 0:
-            parser.error("--max-results must be a positive integer.")
-    elif args.search_type == "video":
-        if not args.video_ids:
-            parser.error("--video-ids is required when --search-type is 'video'")
+    remaining = get_quota_ledger().remaining(len(api_keys))
+    if min_units > remaining:
+        print(
+            f"Error: This search needs at least {min_units} quota units but only {remaining} are left today."
+        )
+        sys.exit(1)
 
     try:
         youtube = get_authenticated_service(API_KEY)
@@ -381,7 +606,7 @@ def main():
             print("No suitable videos found for the channel to search.")
             sys.exit(0)
     else:
-        video_ids_to_search = parse_video_ids(args.video_ids)
+        video_ids_to_search = parsed_video_ids
         if video_ids_to_search is None or not video_ids_to_search:
             print("No valid video IDs provided or parsed.")
             sys.exit(1)
@@ -395,6 +620,8 @@ def main():
         f"Searching for '{target_word}' in {len(video_ids_to_search)} video(s) using language '{language_code}'..."
     )
 
+    from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
+
     all_video_details_text = []
     match_count = 0
 
@@ -413,64 +640,38 @@ def main():
             "Videos", total=len(video_ids_to_search), match_count=0
         )
 
+        pool = ServicePool(API_KEY, MAX_WORKERS)
         with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
             future_to_video_id = {
                 executor.submit(
-                    fetch_transcript, video_id, language_code, target_word
+                    search_video, pool, video_id, language_code, target_word
                 ): video_id
                 for video_id in video_ids_to_search
             }
             for future in as_completed(future_to_video_id):
                 video_id = future_to_video_id[future]
                 try:
-                    transcript_items = future.result()
+                    transcript_items, details = future.result()
                     if transcript_items:
                         current_matches = len(transcript_items)
                         match_count += current_matches
-                        (
-                            title,
-                            channel_title,
-                            channel_id_vid,
-                            date_uploaded,
-                            views,
-                        ) = get_video_details(youtube, video_id)
-                        video_text = f"Video Title: {title}\n"
-                        video_text += f"Video ID: {video_id}\n"
-                        video_text += f"Channel Name: {channel_title}\n"
-                        video_text += f"Channel ID: {channel_id_vid}\n"
-                        video_text += f"Date Uploaded: {date_uploaded}\n"
-                        video_text += f"Views: {format_views(views)}\n"
-                        video_text += "Timestamps:\n"
-                        for item in transcript_items:
-                            time_str = format_time(item["start"])
-                            video_text += f"╳ {time_str} - {item['text']}\n"
-                        video_text += (
-                            "\n══════════════════════════════════════════════\n\n"
+                        all_video_details_text.append(
+                            format_result_block(video_id, details, transcript_items)
                         )
-                        all_video_details_text.append(video_text)
                     progress_bar.update(search_task, advance=1, match_count=match_count)
                 except Exception as e:
                     print(f"\nError processing video ID {video_id}: {e}")
                     progress_bar.update(search_task, advance=1)
 
     print(f"\n\nSearch finished!")
+    print(f"Data API quota used today: {get_quota_ledger().used_today()} units.")
     if match_count > 0:
         print(
             f"Found a total of {match_count} match{'es' if match_count != 1 else ''} in the captions."
         )
 
-        safe_keyword = (
-            "".join(
-                c if c.isalnum() or c in (" ", "_", "-") else "_" for c in target_word
-            )
-            .rstrip()
-            .replace(" ", "_")
-        )
-        output_file_name = f"{safe_keyword}_matches.txt"
-        output_file_path = os.path.join(output_dir, output_file_name)
         try:
-            with open(output_file_path, "w", encoding="utf-8") as output_file:
-                output_file.writelines(all_video_details_text)
+            output_file_path = write_results(output_dir, target_word, all_video_details_text)
             print(f"Generated .txt file at: {output_file_path}")
         except Exception as e:
             print(f"\nError writing output file: {e}")
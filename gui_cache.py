@@ -0,0 +1,178 @@
+import hashlib
+import os
+import shutil
+import threading
+
+
+def link_or_copy(src, dst):
+    """Expose ``src`` at ``dst``, hard-linking when the filesystem allows it."""
+    if os.path.exists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+class ClipCache:
+    """Finished clips stored under a hash of everything that determines their content.
+
+    Like ``SourceVideoCache`` it is capped in size and evicts the least
+    recently used clips, tracking recency through file mtimes.
+    """
+
+    DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+    PARTIAL_SUFFIX = ".partial.mp4"
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = os.path.join(cache_dir, "clips")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(video_id, start, duration, profile):
+        raw = f"{video_id}|{start}|{duration}|{profile}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def path_for(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.mp4")
+
+    def lookup(self, key):
+        path = self.path_for(key)
+        if os.path.isfile(path) and os.path.getsize(path) > 0:
+            return path
+        return None
+
+    def restore(self, keys, dest_path):
+        """Materialize the first cached clip among ``keys`` at ``dest_path``; returns its key or None."""
+        with self._lock:
+            for key in keys:
+                path = self.lookup(key)
+                if path:
+                    os.utime(path, None)
+                    link_or_copy(path, dest_path)
+                    return key
+        return None
+
+    def partial_path_for(self, key):
+        """Where a clip is written before ``commit`` makes it visible to ``lookup``."""
+        path = self.path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return os.path.splitext(path)[0] + self.PARTIAL_SUFFIX
+
+    def commit(self, key, final_key=None):
+        """Publish the partial clip written for ``key``, under ``final_key`` if given."""
+        path = self.path_for(final_key or key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._lock:
+            os.replace(self.partial_path_for(key), path)
+        return path
+
+    def discard(self, key):
+        partial = self.partial_path_for(key)
+        if os.path.exists(partial):
+            os.remove(partial)
+
+    def materialize(self, key, dest_path):
+        with self._lock:
+            link_or_copy(self.path_for(key), dest_path)
+
+    def evict(self):
+        """Remove least recently used clips until the cache fits; returns the removed paths."""
+        removed = []
+        with self._lock:
+            entries = []
+            total = 0
+            for root, _, files in os.walk(self.cache_dir):
+                for name in files:
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    total += stat.st_size
+                    # Clips still being encoded aren't ours to remove.
+                    if not name.endswith(self.PARTIAL_SUFFIX):
+                        entries.append((stat.st_mtime, stat.st_size, path))
+
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                removed.append(path)
+        return removed
+
+
+class SourceVideoCache:
+    """Downloaded source videos kept on disk with a size cap and LRU eviction.
+
+    Recency is tracked through file mtimes so it survives restarts. Files
+    that are acquired by a running task are never evicted.
+    """
+
+    DEFAULT_MAX_BYTES = 5 * 1024 ** 3
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = os.path.join(cache_dir, "sources")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._in_use = {}
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def path_for(self, filename):
+        return os.path.join(self.cache_dir, filename)
+
+    def acquire(self, path):
+        """Pin ``path`` against eviction; returns True if it is already cached."""
+        with self._lock:
+            self._in_use[path] = self._in_use.get(path, 0) + 1
+        if os.path.isfile(path):
+            os.utime(path, None)
+            return True
+        return False
+
+    def release(self, path):
+        with self._lock:
+            count = self._in_use.get(path, 0) - 1
+            if count > 0:
+                self._in_use[path] = count
+            else:
+                self._in_use.pop(path, None)
+
+    def evict(self):
+        """Remove least recently used files until the cache fits; returns the removed paths."""
+        removed = []
+        with self._lock:
+            # yt-dlp's temporary files share the target's stem, so pinning a
+            # path also protects its in-progress fragments.
+            pinned = tuple(
+                os.path.splitext(os.path.basename(path))[0] for path in self._in_use
+            )
+            entries = []
+            total = 0
+            for entry in os.scandir(self.cache_dir):
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+                total += stat.st_size
+                if pinned and entry.name.startswith(pinned):
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                removed.append(path)
+        return removed
@@ -3,6 +3,7 @@ import os
 import configparser
 import re
 import html
+from concurrent.futures import ThreadPoolExecutor
 from PySide6.QtWidgets import (
     QApplication,
     QWidget,
@@ -31,8 +32,14 @@ from PySide6.QtGui import (
 from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 
 try:
-    from googleapiclient.discovery import build
     from googleapiclient.errors import HttpError
+    from youtube_api import (
+        get_service,
+        ServicePool,
+        get_uploads_playlist_id,
+        iter_uploads,
+        configure_api_keys,
+    )
 except ImportError:
     print("ERROR: Required Google API libraries not found.")
     print(
@@ -42,16 +49,22 @@ except ImportError:
 PREFERENCES_FILE = "preferences.ini"
 API_KEY = None
 YOUTUBE_SERVICE = None
+SERVICE_POOL = None
+MAX_DETAIL_WORKERS = 4
+# Uploads are listed roughly newest first; scheduled premieres can be a
+# little out of order, so keep reading this far past the start date.
+UPLOADS_LOOKBEHIND = 50
 
 def load_api_key():
     global API_KEY
 
     try:
-        from cli import load_preferences
-        loaded_key = load_preferences()
-        if loaded_key and loaded_key.strip():  
-            API_KEY = loaded_key
-            print(f"API key loaded successfully (length: {len(API_KEY)})")
+        from cli import load_api_keys
+        loaded_keys = load_api_keys()
+        if loaded_keys:
+            API_KEY = loaded_keys[0]
+            configure_api_keys(loaded_keys)
+            print(f"{len(loaded_keys)} API key(s) loaded successfully.")
             return True
         else:
             print("No API key found in preferences.")
@@ -64,7 +77,7 @@ def load_api_key():
 
 def initialize_youtube_service():
 
-    global YOUTUBE_SERVICE, API_KEY
+    global YOUTUBE_SERVICE, SERVICE_POOL, API_KEY
     if YOUTUBE_SERVICE:
         return True
 
@@ -79,7 +92,8 @@ def initialize_youtube_service():
 
     try:
         print("Initializing YouTube service...")
-        YOUTUBE_SERVICE = build("youtube", "v3", developerKey=API_KEY)
+        YOUTUBE_SERVICE = get_service(API_KEY)
+        SERVICE_POOL = ServicePool(API_KEY, MAX_DETAIL_WORKERS)
         print("YouTube service initialized successfully.")
         return True
     except HttpError as e:
@@ -135,6 +149,23 @@ def fetch_videos_by_channel_date(channel_id, start_date, end_date):
     )
 
     try:
+        playlist_id = get_uploads_playlist_id(YOUTUBE_SERVICE, channel_id)
+        if playlist_id:
+            # playlistItems.list costs 1 unit per page, search.list 100.
+            older_seen = 0
+            for video_id, published_at, title in iter_uploads(YOUTUBE_SERVICE, playlist_id):
+                if not published_at or published_at >= published_before:
+                    continue
+                if published_at < published_after:
+                    older_seen += 1
+                    if older_seen >= UPLOADS_LOOKBEHIND:
+                        break
+                    continue
+                older_seen = 0
+                videos.append({"id": video_id, "title": title or "No Title"})
+            print(f"Found {len(videos)} videos in date range.")
+            return videos
+
         page_count = 0
         while True:
             page_count += 1
@@ -277,14 +308,19 @@ def get_video_details_batch(video_ids):
     details = {}
     unique_ids = list(set(video_ids))
     print(f"Fetching details for {len(unique_ids)} unique video IDs...")
-    try:
-        for i in range(0, len(unique_ids), 50):
-            batch_ids = unique_ids[i : i + 50]
-            print(f"  Fetching batch {i//50 + 1} ({len(batch_ids)} IDs)...")
-            request = YOUTUBE_SERVICE.videos().list(
+
+    def fetch_batch(batch_ids):
+        with SERVICE_POOL.client() as youtube:
+            return youtube.videos().list(
                 part="snippet", id=",".join(batch_ids)
-            )
-            response = request.execute()
+            ).execute()
+
+    try:
+        batches = [unique_ids[i : i + 50] for i in range(0, len(unique_ids), 50)]
+        print(f"  Fetching {len(batches)} batch(es) of up to 50 IDs...")
+        with ThreadPoolExecutor(max_workers=MAX_DETAIL_WORKERS) as executor:
+            responses = list(executor.map(fetch_batch, batches))
+        for response in responses:
             for item in response.get("items", []):
                 vid_id = item.get("id")
                 title = item.get("snippet", {}).get("title", "Unknown Title")
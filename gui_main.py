@@ -1,5 +1,9 @@
 import os
 import sys
+import time
+
+# Taken before the Qt imports so the startup report covers them.
+STARTUP_STARTED_AT = time.perf_counter()
 
 os.environ["QT_OPENGL"] = "software"
 
@@ -39,13 +43,8 @@ from PySide6.QtWidgets import (
     QSplitter,
     QFrame,
     QProgressDialog,
+    QCheckBox,
 )
-try:
-    from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
-    from PySide6.QtMultimediaWidgets import QVideoWidget
-    MULTIMEDIA_AVAILABLE = True
-except ImportError:
-    MULTIMEDIA_AVAILABLE = False
 from PySide6.QtGui import (
     QFont,
     QIcon,
@@ -65,11 +64,9 @@ from PySide6.QtCore import (
     QUrl,
     QCoreApplication,
     QUrlQuery,
+    QTimer,
+    QPoint,
 )
-from PySide6.QtWebEngineWidgets import QWebEngineView
-from PySide6.QtWebEngineCore import QWebEngineSettings, QWebEnginePage
-
-from cli import is_valid_api_key, save_preferences, load_preferences
 
 from gui_utils import (
     format_log,
@@ -78,16 +75,24 @@ from gui_utils import (
     APP_NAME,
     SETTINGS_THEME,
     SETTINGS_SIDEBAR_COLLAPSED,
+    SETTINGS_LOG_LEVEL,
+    SETTINGS_PREFETCH_BUDGET,
+    DEFAULT_LOG_LEVEL,
+    LOG_LEVELS,
+    set_log_level,
+    is_log_enabled,
+    LogRecord,
     YTDLP_PATH,
     FFMPEG_PATH,
     check_dependency,
+    load_ytdlp_module,
     DependencyDownloader,
+    LogBuffer,
 )
-from gui_widgets import CustomTitleBar, DonateButton, GitHubButton
+from gui_widgets import CustomTitleBar, DonateButton, GitHubButton, JobQueuePanel
 
-from gui_workers import Worker, ClipDownloaderWorker, RenderWorker
+from gui_workers import Worker, ClipDownloaderWorker, RenderWorker, StreamResolver
 from gui_styles import get_theme_qss
-from gui_list_creator import ListCreatorWindow
 
 if getattr(sys, 'frozen', False):
 
@@ -128,12 +133,36 @@ COLOR_PROGRESS_CHUNK = COLOR_MEDIUM_RED
 COLOR_ERROR_BG = "#FFCCCC"
 COLOR_WHITE = "#FFFFFF"
 
-class YouTubeWebEnginePage(QWebEnginePage):
-    """Custom QWebEnginePage that adds Referer header for YouTube embeds."""
+# QtMultimedia, QtWebEngine, the Google API client and the list creator are
+# imported when the page that needs them is first shown, not at startup.
+MULTIMEDIA_AVAILABLE = False
+QMediaPlayer = QAudioOutput = QVideoWidget = None
+_multimedia_checked = False
+
+def load_multimedia():
+    """Import QtMultimedia on first use; returns whether it is available."""
+    global MULTIMEDIA_AVAILABLE, QMediaPlayer, QAudioOutput, QVideoWidget, _multimedia_checked
+    if not _multimedia_checked:
+        _multimedia_checked = True
+        try:
+            from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
+            from PySide6.QtMultimediaWidgets import QVideoWidget
+            MULTIMEDIA_AVAILABLE = True
+        except ImportError:
+            MULTIMEDIA_AVAILABLE = False
+    return MULTIMEDIA_AVAILABLE
+
+def create_youtube_web_page(parent):
+    from PySide6.QtWebEngineCore import QWebEnginePage
+
+    class YouTubeWebEnginePage(QWebEnginePage):
+        """Custom QWebEnginePage that adds Referer header for YouTube embeds."""
 
-    def acceptNavigationRequest(self, url, nav_type, is_main_frame):
-        """Override to add custom headers when navigating to YouTube."""
-        return super().acceptNavigationRequest(url, nav_type, is_main_frame)
+        def acceptNavigationRequest(self, url, nav_type, is_main_frame):
+            """Override to add custom headers when navigating to YouTube."""
+            return super().acceptNavigationRequest(url, nav_type, is_main_frame)
+
+    return YouTubeWebEnginePage(parent)
 
 class MainWindow(QMainWindow):
 
@@ -142,6 +171,17 @@ class MainWindow(QMainWindow):
     SIDEBAR_EXPANDED_WIDTH = 180
     SIDEBAR_COLLAPSED_WIDTH = 50
 
+    VIEWER_FLUSH_INTERVAL_MS = 250
+    # How many videos visible in the viewer get their stream URL resolved
+    # ahead of a click (overridable via the Player/PrefetchBudget setting).
+    DEFAULT_PREFETCH_BUDGET = 5
+    PREFETCH_DEBOUNCE_MS = 400
+
+    PAGE_SEARCH = 0
+    PAGE_VIEWER = 1
+    PAGE_RENDERER = 2
+    PAGE_LIST_CREATOR = 3
+
     GUI_COLOR_DEFAULT = "#6495ed"
     GUI_COLOR_SUCCESS = "#90ee90"
     GUI_COLOR_WARNING = "orange"
@@ -149,6 +189,7 @@ class MainWindow(QMainWindow):
     GUI_COLOR_MUTED = "#888888"
 
     _vid_regex = re.compile(r"^Video ID:\s*([a-zA-Z0-9_-]+)", re.MULTILINE)
+    _watch_link_regex = re.compile(r"youtube\.com/watch\?v=([a-zA-Z0-9_-]+)")
     _ts_regex = re.compile(r"^╳\s*(\d{1,2}:\d{2}:\d{2})\s*-\s*(.*)", re.MULTILINE)
 
     _block_separator_regex = re.compile(r"\n\n═{40}\n\n?")
@@ -172,6 +213,8 @@ class MainWindow(QMainWindow):
         self.render_thread = None
         self.dependency_downloader_worker = None
         self.dependency_downloader_thread = None
+        self.stream_resolver = None
+        self.page_build_seconds = {}
         self.pending_action = None
         self.dependency_progress_dialog = None
 
@@ -184,6 +227,18 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(700, 700)
         self.resize(850, 600)
         self.last_results = []
+        self._pending_viewer_blocks = []
+        self._streamed_result_count = 0
+
+        self.viewer_flush_timer = QTimer(self)
+        self.viewer_flush_timer.setSingleShot(True)
+        self.viewer_flush_timer.setInterval(self.VIEWER_FLUSH_INTERVAL_MS)
+        self.viewer_flush_timer.timeout.connect(self.flush_pending_results)
+
+        self.prefetch_timer = QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.setInterval(self.PREFETCH_DEBOUNCE_MS)
+        self.prefetch_timer.timeout.connect(self.prefetch_visible_streams)
 
         self.settings = QSettings(ORG_NAME, APP_NAME)
 
@@ -247,26 +302,20 @@ class MainWindow(QMainWindow):
         self._top_border.setGeometry(x_start, y, max(0, x_end - x_start), 1)
         self._top_border.raise_()
 
-    def log_gui_event(self, message, level="INFO", color=None, bold=False):
-
-        if color is not None:
-
-            html_message = format_log(message, level=level, color=color, bold=bold)
-        else:
-
-            html_message = format_log(message, level=level, bold=bold)
-
-        if hasattr(self, "log"):
-            self.append_log_message(html_message)
+    def log_gui_event(self, message, level="INFO", color=None, bold=False, always=False):
+        # ``always`` skips the level filter, for messages about the filter itself.
+        # Those go in pre-formatted because the buffer re-filters records on flush.
+        if not hasattr(self, "log_buffer"):
+            return
+        if always:
+            self.log_buffer.write(format_log(message, level=level, color=color, bold=bold))
+        elif is_log_enabled(level):
+            self.log_buffer.write(LogRecord(message, level=level, color=color, bold=bold))
 
     def append_log_message(self, html_message):
 
-        if hasattr(self, "log"):
-            self.log.append(html_message)
-
-            cursor = self.log.textCursor()
-            cursor.movePosition(QTextCursor.End)
-            self.log.setTextCursor(cursor)
+        if hasattr(self, "log_buffer"):
+            self.log_buffer.write(html_message)
 
     def init_sidebar(self):
 
@@ -373,27 +422,66 @@ class MainWindow(QMainWindow):
             )
 
     def init_pages(self):
+        """Add a placeholder per page; each page is built by ``ensure_page`` on first use."""
+        self._page_builders = {
+            self.PAGE_SEARCH: ("Search", self.build_search_page),
+            self.PAGE_VIEWER: ("Viewer", self.build_viewer_page),
+            self.PAGE_RENDERER: ("Renderer", self.build_renderer_page),
+            self.PAGE_LIST_CREATOR: ("List Creator", self.build_list_creator_page),
+        }
+        for _ in self._page_builders:
+            self.stacked_widget.addWidget(QWidget())
+        self.ensure_page(self.PAGE_SEARCH)
+
+    def ensure_page(self, index):
+        name, builder = self._page_builders.get(index, (None, None))
+        if builder is None or name in self.page_build_seconds:
+            return
 
+        started = time.perf_counter()
+        page = builder()
+        placeholder = self.stacked_widget.widget(index)
+        was_current = self.stacked_widget.currentIndex() == index
+        self.stacked_widget.insertWidget(index, page)
+        self.stacked_widget.removeWidget(placeholder)
+        placeholder.deleteLater()
+        if was_current:
+            self.stacked_widget.setCurrentIndex(index)
+
+        elapsed = time.perf_counter() - started
+        self.page_build_seconds[name] = elapsed
+        self.log_gui_event(
+            f"{name} page built in {elapsed * 1000:.0f} ms.",
+            color=self.GUI_COLOR_MUTED, level="DEBUG"
+        )
+
+    def build_search_page(self):
         self.search_page_widget = QWidget()
         search_page_layout = QVBoxLayout(self.search_page_widget)
         search_page_layout.setContentsMargins(15, 15, 15, 15)
         search_page_layout.setSpacing(12)
         self.init_search_page_ui(search_page_layout)
-        self.stacked_widget.addWidget(self.search_page_widget)
+        return self.search_page_widget
 
+    def build_viewer_page(self):
+        load_multimedia()
         self.viewer_page_widget = QWidget()
         viewer_page_layout = QVBoxLayout(self.viewer_page_widget)
         viewer_page_layout.setContentsMargins(15, 15, 15, 15)
         viewer_page_layout.setSpacing(10)
         self.init_viewer_page_ui(viewer_page_layout)
-        self.stacked_widget.addWidget(self.viewer_page_widget)
+        return self.viewer_page_widget
 
+    def build_renderer_page(self):
         self.renderer_page_widget = QWidget()
         renderer_page_layout = QVBoxLayout(self.renderer_page_widget)
         renderer_page_layout.setContentsMargins(15, 15, 15, 15)
         renderer_page_layout.setSpacing(12)
         self.init_renderer_page_ui(renderer_page_layout)
-        self.stacked_widget.addWidget(self.renderer_page_widget)
+        return self.renderer_page_widget
+
+    def build_list_creator_page(self):
+        from gui_list_creator import ListCreatorWindow
 
         self.list_creator_page_widget = QWidget()
 
@@ -404,7 +492,22 @@ class MainWindow(QMainWindow):
 
         self.list_creator_widget = ListCreatorWindow(self.list_creator_page_widget)
         list_creator_page_layout.addWidget(self.list_creator_widget)
-        self.stacked_widget.addWidget(self.list_creator_page_widget)
+        return self.list_creator_page_widget
+
+    def report_startup_timing(self, first_window_seconds):
+        self.log_gui_event(
+            f"Startup: first window after {first_window_seconds * 1000:.0f} ms.",
+            color=self.GUI_COLOR_MUTED,
+        )
+        for name, seconds in self.page_build_seconds.items():
+            self.log_gui_event(
+                f"Startup: {name} page built in {seconds * 1000:.0f} ms.",
+                color=self.GUI_COLOR_MUTED,
+            )
+        self.log_gui_event(
+            "Startup: other pages are built when first opened.",
+            color=self.GUI_COLOR_MUTED, level="DEBUG"
+        )
 
     def init_viewer_page_ui(self, viewer_page_layout):
 
@@ -429,6 +532,9 @@ class MainWindow(QMainWindow):
         self.viewer_display.setOpenExternalLinks(False)
         self.viewer_display.setOpenLinks(False)
         self.viewer_display.anchorClicked.connect(self.handle_timestamp_click)
+        self.viewer_display.verticalScrollBar().valueChanged.connect(
+            self.schedule_stream_prefetch
+        )
         viewer_font = QFont("Segoe UI", 10)
         self.viewer_display.setFont(viewer_font)
         self.viewer_splitter.addWidget(self.viewer_display)
@@ -489,12 +595,15 @@ class MainWindow(QMainWindow):
 
             self.log_gui_event("Video player initialized with QMediaPlayer.", color=self.GUI_COLOR_SUCCESS)
         else:
+            from PySide6.QtWebEngineWidgets import QWebEngineView
+            from PySide6.QtWebEngineCore import QWebEngineSettings
+
             self.video_player = QWebEngineView()
             self.video_player.setObjectName("videoPlayer")
             self.video_player.setMinimumHeight(200)
             self.video_player.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
-            custom_page = YouTubeWebEnginePage(self.video_player)
+            custom_page = create_youtube_web_page(self.video_player)
             self.video_player.setPage(custom_page)
 
             info_html = """
@@ -575,10 +684,49 @@ class MainWindow(QMainWindow):
         self.cancel_clips_btn.clicked.connect(self.on_cancel_download_clips)
         clip_header_layout.addWidget(self.cancel_clips_btn)
 
+        self.clip_sections_checkbox = QCheckBox("Sections only")
+        self.clip_sections_checkbox.setToolTip(
+            "Download only the time ranges around each timestamp instead of the whole video."
+        )
+        self.clip_sections_checkbox.setChecked(True)
+        clip_header_layout.addWidget(self.clip_sections_checkbox)
+
+        self.clip_smart_cut_checkbox = QCheckBox("Smart cut")
+        self.clip_smart_cut_checkbox.setToolTip(
+            "Stream-copy the keyframe-aligned middle of each clip and re-encode only the edges.\n"
+            "Much faster and smaller output; requires ffprobe."
+        )
+        clip_header_layout.addWidget(self.clip_smart_cut_checkbox)
+
+        clip_header_layout.addWidget(QLabel("Merge gap:"))
+        self.clip_merge_gap_input = QSpinBox()
+        self.clip_merge_gap_input.setRange(-1, 60)
+        self.clip_merge_gap_input.setSpecialValueText("Off")
+        self.clip_merge_gap_input.setSuffix(" s")
+        self.clip_merge_gap_input.setValue(ClipDownloaderWorker.DEFAULT_MERGE_GAP_SECONDS)
+        self.clip_merge_gap_input.setFixedHeight(28)
+        self.clip_merge_gap_input.setToolTip(
+            "Merge clips of the same video that overlap or are at most this many seconds apart."
+        )
+        clip_header_layout.addWidget(self.clip_merge_gap_input)
+
         clip_header_layout.addStretch()
 
         clip_layout.addLayout(clip_header_layout)
 
+        clip_progress_layout = QHBoxLayout()
+        self.clip_progress = QProgressBar()
+        self.clip_progress.setFixedHeight(18)
+        self.clip_progress.setTextVisible(True)
+        self.clip_progress.setValue(0)
+        clip_progress_layout.addWidget(self.clip_progress, 1)
+        self.clip_verbose_checkbox = QCheckBox("Log yt-dlp output")
+        self.clip_verbose_checkbox.setToolTip(
+            "Forward every yt-dlp output line to the log (DEBUG level)."
+        )
+        clip_progress_layout.addWidget(self.clip_verbose_checkbox)
+        clip_layout.addLayout(clip_progress_layout)
+
         clip_log_label = QLabel("Download Log:")
         clip_layout.addWidget(clip_log_label)
 
@@ -591,6 +739,7 @@ class MainWindow(QMainWindow):
         log_font = QFont("Consolas, Courier New, monospace")
         log_font.setPointSize(9)
         self.clip_log.setFont(log_font)
+        self.clip_log_buffer = LogBuffer(self.clip_log)
         clip_layout.addWidget(self.clip_log, 1)
 
         right_panel_layout.addWidget(self.clip_widget, 0)
@@ -657,6 +806,12 @@ class MainWindow(QMainWindow):
         self.cancel_render_btn.setEnabled(False)
         self.cancel_render_btn.setObjectName("cancel_btn")
         render_action_layout.addWidget(self.cancel_render_btn)
+        self.render_parallel_checkbox = QCheckBox("Parallel encode")
+        self.render_parallel_checkbox.setToolTip(
+            "When clips must be re-encoded, encode chunks of the clip list in parallel and join them losslessly."
+        )
+        self.render_parallel_checkbox.setChecked(True)
+        render_action_layout.addWidget(self.render_parallel_checkbox)
         render_action_layout.addStretch()
         layout.addLayout(render_action_layout)
 
@@ -675,6 +830,7 @@ class MainWindow(QMainWindow):
         render_log_font = QFont("Consolas, Courier New, monospace")
         render_log_font.setPointSize(9)
         self.render_log.setFont(render_log_font)
+        self.render_log_buffer = LogBuffer(self.render_log)
         layout.addWidget(self.render_log, 1)
 
     def init_search_page_ui(self, layout):
@@ -685,7 +841,7 @@ class MainWindow(QMainWindow):
         api_layout.addWidget(QLabel("Key:"))
         self.api_input = QLineEdit()
         self.api_input.setFixedHeight(24)
-        self.api_input.setPlaceholderText("Enter YouTube Data API v3 key")
+        self.api_input.setPlaceholderText("Enter YouTube Data API v3 key (comma-separate several to rotate)")
         self.api_input.setEchoMode(QLineEdit.Password)
         api_layout.addWidget(self.api_input)
 
@@ -835,8 +991,29 @@ class MainWindow(QMainWindow):
         self.progress.setTextVisible(True)
         layout.addWidget(self.progress)
 
+        self.job_queue_panel = JobQueuePanel()
+        layout.addWidget(self.job_queue_panel)
+
+        log_header_layout = QHBoxLayout()
+        log_header_layout.setSpacing(8)
         log_label = QLabel("Log Output:")
-        layout.addWidget(log_label)
+        log_header_layout.addWidget(log_label)
+        log_header_layout.addStretch()
+        log_header_layout.addWidget(QLabel("Level:"))
+        self.log_level_combo = QComboBox()
+        self.log_level_combo.setFixedHeight(24)
+        self.log_level_combo.addItems(["DEBUG", "INFO", "WARN", "ERROR"])
+        self.log_level_combo.setToolTip(
+            "Minimum level shown in the log panes. Lower-level messages are skipped before they are formatted."
+        )
+        saved_level = str(self.settings.value(SETTINGS_LOG_LEVEL, DEFAULT_LOG_LEVEL)).upper()
+        if saved_level not in LOG_LEVELS:
+            saved_level = DEFAULT_LOG_LEVEL
+        set_log_level(saved_level)
+        self.log_level_combo.setCurrentText(saved_level)
+        self.log_level_combo.currentTextChanged.connect(self.on_log_level_changed)
+        log_header_layout.addWidget(self.log_level_combo)
+        layout.addLayout(log_header_layout)
         self.log = QTextEdit()
         self.log.setObjectName("log")
         self.log.setMinimumHeight(150)
@@ -845,13 +1022,21 @@ class MainWindow(QMainWindow):
         log_font = QFont("Consolas, Courier New, monospace")
         log_font.setPointSize(9)
         self.log.setFont(log_font)
+        self.log_buffer = LogBuffer(self.log)
 
         layout.addWidget(self.log, 1)
 
-        self.load_api_key()
+        # Decrypting the stored key pulls in cryptography; leave it until
+        # the window is up.
+        QTimer.singleShot(0, self.load_api_key)
 
         self.on_type_change(self.type_combo.currentText())
 
+    def on_log_level_changed(self, level):
+        set_log_level(level)
+        self.settings.setValue(SETTINGS_LOG_LEVEL, level)
+        self.log_gui_event(f"Log level set to {level}.", color=self.GUI_COLOR_MUTED, always=True)
+
     def toggle_api_key_visibility(self):
 
         if not hasattr(self, "api_input") or not hasattr(self, "api_visibility_action"):
@@ -977,6 +1162,7 @@ class MainWindow(QMainWindow):
     def change_page(self, index):
 
         if index < self.stacked_widget.count():
+            self.ensure_page(index)
             current_index = self.stacked_widget.currentIndex()
             if index != current_index:
                 self.stacked_widget.setCurrentIndex(index)
@@ -1130,7 +1316,9 @@ class MainWindow(QMainWindow):
             self.dependency_downloader_thread
         )
 
-        self.dependency_downloader_worker.log.connect(self.on_dependency_download_log)
+        self.dependency_downloader_worker.log.connect(
+            self.log_buffer.write, Qt.DirectConnection
+        )
         self.dependency_downloader_worker.progress.connect(
             self.on_dependency_download_progress
         )
@@ -1158,10 +1346,6 @@ class MainWindow(QMainWindow):
         self.dependency_downloader_thread.start()
         self.dependency_progress_dialog.show()
 
-    def on_dependency_download_log(self, html_message):
-
-        self.append_log_message(html_message)
-
     def on_dependency_download_progress(self, value):
 
         if self.dependency_progress_dialog:
@@ -1281,11 +1465,8 @@ class MainWindow(QMainWindow):
 
     def append_render_log_message(self, html_message):
 
-        if hasattr(self, "render_log"):
-            self.render_log.append(html_message)
-            cursor = self.render_log.textCursor()
-            cursor.movePosition(QTextCursor.End)
-            self.render_log.setTextCursor(cursor)
+        if hasattr(self, "render_log_buffer"):
+            self.render_log_buffer.write(html_message)
 
     def on_start_render(self):
         self.log_gui_event("Start Render button clicked.", color=self.GUI_COLOR_MUTED)
@@ -1407,7 +1588,7 @@ class MainWindow(QMainWindow):
 
         full_output_path = os.path.join(output_dir, output_file)
 
-        self.render_log.clear()
+        self.render_log_buffer.clear()
         self.append_render_log_message(
             format_log(
                 "Starting video render process...",
@@ -1425,6 +1606,7 @@ class MainWindow(QMainWindow):
         self.start_render_btn.setEnabled(False)
         self.cancel_render_btn.setEnabled(True)
         self.render_progress.setValue(0)
+        self.render_progress.setFormat("%p%")
 
         self.render_thread = QThread()
 
@@ -1432,12 +1614,16 @@ class MainWindow(QMainWindow):
         self.render_worker = RenderWorker(
             clips_folder,
             full_output_path,
-            ffmpeg_path=ffmpeg_executable
+            ffmpeg_path=ffmpeg_executable,
+            ffprobe_path=check_dependency("ffprobe"),
+            parallel_chunks=self.render_parallel_checkbox.isChecked(),
         )
         self.render_worker.moveToThread(self.render_thread)
 
-        self.render_worker.log_output.connect(self.append_render_log_message)
-        self.render_worker.progress_update.connect(self.render_progress.setValue)
+        self.render_worker.log_output.connect(
+            self.render_log_buffer.write, Qt.DirectConnection
+        )
+        self.render_worker.progress_update.connect(self.on_render_progress)
         self.render_worker.error.connect(self.on_render_worker_error)
         self.render_worker.finished.connect(self.on_render_worker_finished)
 
@@ -1462,8 +1648,13 @@ class MainWindow(QMainWindow):
 
         if hasattr(self, "render_progress") and self.render_progress.value() != 100:
             self.render_progress.setValue(0)
+            self.render_progress.setFormat("%p%")
         self.log_gui_event("Render GUI controls reset.", color=self.GUI_COLOR_MUTED)
 
+    def on_render_progress(self, percent, details):
+        self.render_progress.setValue(percent)
+        self.render_progress.setFormat(f"%p%  ·  {details}" if details else "%p%")
+
     def on_render_worker_error(self, error_html_message):
 
         self.append_render_log_message(error_html_message)
@@ -1522,10 +1713,8 @@ class MainWindow(QMainWindow):
 
     def append_clip_log_message(self, html_message):
 
-        if hasattr(self, "clip_log"):
-            self.clip_log.moveCursor(QTextCursor.End)
-            self.clip_log.insertHtml(html_message)
-            self.clip_log.moveCursor(QTextCursor.End)
+        if hasattr(self, "clip_log_buffer"):
+            self.clip_log_buffer.write(html_message)
 
     def check_ffmpeg_for_clips(self):
         self.log_gui_event("Checking ffmpeg dependency for clip download...", color=self.GUI_COLOR_MUTED, level="DEBUG")
@@ -1652,7 +1841,7 @@ class MainWindow(QMainWindow):
             )
             return
 
-        self.clip_log.clear()
+        self.clip_log_buffer.clear()
         self.append_clip_log_message(
             format_log(
                 "Starting clip download process...",
@@ -1662,6 +1851,8 @@ class MainWindow(QMainWindow):
         )
         self.download_clips_btn.setEnabled(False)
         self.download_clips_btn.setText("Downloading...")
+        self.clip_progress.setValue(0)
+        self.clip_progress.setFormat("%p%")
         self.cancel_clips_btn.setEnabled(True)
 
         output_folder = os.path.join(self.out_input.text() or "transcripts", "clips")
@@ -1686,19 +1877,44 @@ class MainWindow(QMainWindow):
 
         self.clip_thread = QThread()
 
+        clip_mode = ClipDownloaderWorker.CLIP_MODE_REENCODE
+        ffprobe_executable = None
+        if self.clip_smart_cut_checkbox.isChecked():
+            ffprobe_executable = check_dependency("ffprobe")
+            if ffprobe_executable:
+                clip_mode = ClipDownloaderWorker.CLIP_MODE_SMART
+            else:
+                self.log_gui_event(
+                    "ffprobe not found; smart cut disabled, clips will be re-encoded.",
+                    level="WARN",
+                    color=self.GUI_COLOR_WARNING,
+                )
+
         self.log_gui_event(f"DEBUG: Passing to ClipDownloaderWorker: ytdlp='{ytdlp_executable}', ffmpeg='{ffmpeg_executable}'", level="DEBUG")
         self.clip_worker = ClipDownloaderWorker(
             html_content,
             output_folder,
             self._clip_duration_seconds,
             ytdlp_path=ytdlp_executable,
-            ffmpeg_path=ffmpeg_executable
+            ffmpeg_path=ffmpeg_executable,
+            download_mode=(
+                ClipDownloaderWorker.DOWNLOAD_MODE_SECTIONS
+                if self.clip_sections_checkbox.isChecked()
+                else ClipDownloaderWorker.DOWNLOAD_MODE_FULL
+            ),
+            clip_mode=clip_mode,
+            ffprobe_path=ffprobe_executable,
+            merge_gap_seconds=self.clip_merge_gap_input.value(),
+            log_ytdlp_output=self.clip_verbose_checkbox.isChecked(),
         )
         self.clip_worker.moveToThread(self.clip_thread)
 
-        self.clip_worker.log_output.connect(self.append_clip_log_message)
+        self.clip_worker.log_output.connect(
+            self.clip_log_buffer.write, Qt.DirectConnection
+        )
         self.clip_worker.error.connect(self.on_clip_worker_error)
         self.clip_worker.finished.connect(self.on_clip_worker_finished)
+        self.clip_worker.progress_update.connect(self.on_clip_progress)
 
         self.clip_thread.started.connect(self.clip_worker.run)
 
@@ -1790,12 +2006,20 @@ class MainWindow(QMainWindow):
             "Clip download GUI controls reset.", color=self.GUI_COLOR_MUTED
         )
 
+    def on_clip_progress(self, percent, details):
+        self.clip_progress.setValue(percent)
+        self.clip_progress.setFormat(f"%p%  ·  {details}" if details else "%p%")
+
     def load_api_key(self):
-        key = load_preferences()
-        if key:
-            self.api_input.setText(key)
+        from cli import load_api_keys
+        from youtube_api import configure_api_keys
+
+        keys = load_api_keys()
+        if keys:
+            self.api_input.setText(", ".join(keys))
+            configure_api_keys(keys)
             self.log_gui_event(
-                "Loaded API key from preferences.", color=self.GUI_COLOR_SUCCESS
+                f"Loaded {len(keys)} API key(s) from preferences.", color=self.GUI_COLOR_SUCCESS
             )
         else:
             self.log_gui_event(
@@ -1804,31 +2028,36 @@ class MainWindow(QMainWindow):
             )
 
     def on_save_key(self):
+        from cli import is_valid_api_key, parse_api_keys, save_api_keys
+        from youtube_api import configure_api_keys, describe_key
+
         self.log_gui_event("Save API Key button clicked.")
-        key = self.api_input.text().strip()
-        if not key:
+        keys = parse_api_keys(self.api_input.text())
+        if not keys:
             self.log_gui_event("API key field is empty.", color=self.GUI_COLOR_WARNING)
             return
-        if len(key) < 30:
+        if any(len(key) < 30 for key in keys):
             self.log_gui_event(
                 "Warning: API key seems short. Validating...",
                 color=self.GUI_COLOR_WARNING,
             )
 
-        self.log_gui_event("Validating API key...", color=self.GUI_COLOR_MUTED)
+        self.log_gui_event(f"Validating {len(keys)} API key(s)...", color=self.GUI_COLOR_MUTED)
 
         try:
-            if is_valid_api_key(key):
-                save_preferences(key)
+            invalid_keys = [key for key in keys if not is_valid_api_key(key)]
+            if not invalid_keys:
+                save_api_keys(keys)
+                configure_api_keys(keys)
                 self.log_gui_event(
-                    "API key validated and saved successfully.",
+                    f"{len(keys)} API key(s) validated and saved successfully.",
                     color=self.GUI_COLOR_SUCCESS,
                     bold=True,
                 )
             else:
 
                 self.log_gui_event(
-                    "API key validation failed (invalid key).",
+                    f"API key validation failed (invalid key: {', '.join(describe_key(key) for key in invalid_keys)}).",
                     color=self.GUI_COLOR_ERROR,
                     bold=True,
                 )
@@ -1941,13 +2170,18 @@ class MainWindow(QMainWindow):
             )
             return
 
-        api_key = self.api_input.text().strip()
-        if not api_key:
+        from cli import parse_api_keys
+        from youtube_api import configure_api_keys
+
+        api_keys = parse_api_keys(self.api_input.text())
+        if not api_keys:
             self.log_gui_event(
                 "Validation Error: API Key is required.", color=self.GUI_COLOR_ERROR
             )
             QMessageBox.warning(self, "Input Error", "API Key is required.")
             return
+        configure_api_keys(api_keys)
+        api_key = api_keys[0]
         search_type = self.type_combo.currentText()
         keyword = self.kw_input.text().strip()
         if not keyword:
@@ -2006,9 +2240,13 @@ class MainWindow(QMainWindow):
             video_ids_input,
         )
 
-        self.log.clear()
-        self.viewer_display.clear()
+        self.log_buffer.clear()
+        if hasattr(self, "viewer_display"):
+            self.viewer_display.clear()
         self.last_results = []
+        self.viewer_flush_timer.stop()
+        self._pending_viewer_blocks = []
+        self._streamed_result_count = 0
         self.log_gui_event("Starting new search worker thread...", bold=True)
         self.start_btn.setEnabled(False)
         self.cancel_btn.setEnabled(True)
@@ -2019,7 +2257,8 @@ class MainWindow(QMainWindow):
         self.worker.moveToThread(self.thread)
 
         self.worker.progress_update.connect(self.progress.setValue)
-        self.worker.log_output.connect(self.append_log_message)
+        self.worker.log_output.connect(self.log_buffer.write, Qt.DirectConnection)
+        self.worker.result_ready.connect(self.on_result_ready)
         self.worker.error.connect(self.on_worker_error)
         self.worker.finished.connect(self.on_worker_finished)
 
@@ -2061,11 +2300,45 @@ class MainWindow(QMainWindow):
             f"Worker finished signal received by GUI. Matches found: {count}.",
             color=self.GUI_COLOR_MUTED,
         )
+        self.flush_pending_results()
         self.last_results = results
         if hasattr(self, "progress"):
             self.progress.setValue(100)
 
-        self.update_viewer(results)
+        if not results or self._streamed_result_count != len(results):
+            self.update_viewer(results)
+
+    def on_result_ready(self, result_block):
+
+        self.last_results.append(result_block)
+        self._pending_viewer_blocks.append(result_block)
+        if not self.viewer_flush_timer.isActive():
+            self.viewer_flush_timer.start()
+
+    def flush_pending_results(self):
+        """Append streamed result blocks to the viewer in a single insert."""
+        self.viewer_flush_timer.stop()
+        if not self._pending_viewer_blocks:
+            return
+
+        blocks = self._pending_viewer_blocks
+        self._pending_viewer_blocks = []
+        html_blocks = [
+            block_html
+            for block_html in (self._generate_html_for_block(b) for b in blocks)
+            if block_html
+        ]
+        if not html_blocks:
+            return
+
+        self.ensure_page(self.PAGE_VIEWER)
+        cursor = QTextCursor(self.viewer_display.document())
+        cursor.movePosition(QTextCursor.End)
+        if self._streamed_result_count:
+            cursor.insertHtml("<br>")
+        cursor.insertHtml("<br>".join(html_blocks))
+        self._streamed_result_count += len(blocks)
+        self.schedule_stream_prefetch()
 
     def _generate_html_for_block(self, text_block):
 
@@ -2163,6 +2436,10 @@ class MainWindow(QMainWindow):
             f"Updating viewer with {len(results)} result block(s).",
             color=self.GUI_COLOR_MUTED,
         )
+        self.ensure_page(self.PAGE_VIEWER)
+        self.viewer_flush_timer.stop()
+        self._pending_viewer_blocks = []
+        self._streamed_result_count = len(results)
         self.viewer_display.clear()
         all_html_blocks = []
 
@@ -2185,6 +2462,51 @@ class MainWindow(QMainWindow):
 
         self.viewer_display.setHtml(full_html)
         self.log_gui_event("Viewer update complete.", color=self.GUI_COLOR_MUTED)
+        self.schedule_stream_prefetch()
+
+    def schedule_stream_prefetch(self, *_):
+        """Restart the prefetch debounce; queued prefetches for the old view are dropped."""
+        if self.stream_resolver is not None:
+            self.stream_resolver.cancel_prefetch()
+        self.prefetch_timer.start()
+
+    def visible_video_ids(self, limit):
+        viewport = self.viewer_display.viewport()
+        start = self.viewer_display.cursorForPosition(QPoint(0, 0)).position()
+        end = self.viewer_display.cursorForPosition(
+            QPoint(viewport.width() - 1, viewport.height() - 1)
+        ).position()
+        cursor = QTextCursor(self.viewer_display.document())
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+
+        video_ids = []
+        for video_id in self._watch_link_regex.findall(cursor.selection().toHtml()):
+            if video_id not in video_ids:
+                video_ids.append(video_id)
+                if len(video_ids) >= limit:
+                    break
+        return video_ids
+
+    def prefetch_visible_streams(self):
+        if not MULTIMEDIA_AVAILABLE or not self.viewer_display.isVisible():
+            return
+        try:
+            budget = int(self.settings.value(SETTINGS_PREFETCH_BUDGET, self.DEFAULT_PREFETCH_BUDGET))
+        except (TypeError, ValueError):
+            budget = self.DEFAULT_PREFETCH_BUDGET
+        if budget <= 0:
+            return
+        if load_ytdlp_module() is None and not check_dependency("yt-dlp"):
+            return
+
+        video_ids = self.visible_video_ids(budget)
+        if video_ids:
+            self.log_gui_event(
+                f"Prefetching stream URLs for {len(video_ids)} visible video(s).",
+                color=self.GUI_COLOR_MUTED, level="DEBUG"
+            )
+            self.get_stream_resolver().prefetch(video_ids)
 
     def on_update_ytdlp(self):
         """Update yt-dlp to the latest version."""
@@ -2300,6 +2622,11 @@ class MainWindow(QMainWindow):
 
     def on_media_error(self, error, error_string):
         """Handle media player errors."""
+        # A cached stream URL may have been revoked early; resolve it again next time.
+        current_video_id = getattr(self, '_current_video_id', None)
+        if current_video_id and self.stream_resolver is not None:
+            self.stream_resolver.invalidate(current_video_id)
+            self._current_video_id = None
         self.log_gui_event(
             f"Media player error: {error_string}",
             level="ERROR",
@@ -2309,6 +2636,13 @@ class MainWindow(QMainWindow):
             self.video_status_label.setText(f"Error: {error_string}")
             self.video_status_label.setStyleSheet("color: #ff6666;")
 
+    def get_stream_resolver(self):
+        if self.stream_resolver is None:
+            self.stream_resolver = StreamResolver(self)
+            self.stream_resolver.resolved.connect(self.on_stream_resolved)
+            self.stream_resolver.failed.connect(self.on_stream_failed)
+        return self.stream_resolver
+
     def load_youtube_stream(self, video_id, start_seconds):
         """Load YouTube video stream using yt-dlp."""
         if not MULTIMEDIA_AVAILABLE:
@@ -2319,8 +2653,7 @@ class MainWindow(QMainWindow):
             )
             return
 
-        ytdlp_path = check_dependency("yt-dlp")
-        if not ytdlp_path:
+        if load_ytdlp_module() is None and not check_dependency("yt-dlp"):
             self.log_gui_event(
                 "yt-dlp not found. Cannot fetch video stream.",
                 level="ERROR",
@@ -2352,106 +2685,57 @@ class MainWindow(QMainWindow):
 
         self.video_status_label.setText("Fetching video stream...")
         self.video_status_label.setStyleSheet("color: #888;")
+        self.log_gui_event(
+            f"Fetching stream URL for video {video_id}...",
+            color=self.GUI_COLOR_MUTED
+        )
+        self.get_stream_resolver().resolve(video_id)
 
-        import subprocess
-        import json
-
-        try:
-
-            format_options = [
-                "18",
-                "best[height<=480][ext=mp4]",
-                "best[height<=720][ext=mp4]",
-                "best",
-            ]
-
-            self.log_gui_event(
-                f"Fetching stream URL for video {video_id}...",
-                color=self.GUI_COLOR_MUTED
-            )
-
-            stream_url = None
-            last_error = None
-
-            for fmt in format_options:
-                cmd = [
-                    ytdlp_path,
-                    "-f", fmt,
-                    "-g",
-                    "--no-warnings",
-                    f"https://www.youtube.com/watch?v={video_id}"
-                ]
-
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=20,
-                    creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
-                )
-
-                if result.returncode == 0 and result.stdout.strip():
-                    stream_url = result.stdout.strip().split('\n')[0]
-                    break
-                else:
-                    last_error = result.stderr.strip() if result.stderr else "Unknown error"
-
-            if stream_url:
-                self.log_gui_event(
-                    f"Stream URL obtained. Loading video at {start_seconds}s...",
-                    color=self.GUI_COLOR_SUCCESS
-                )
-
-                self.media_player.setSource(QUrl(stream_url))
-                self.media_player.play()
-                self.play_pause_btn.setEnabled(True)
-                self.video_status_label.setText(f"Loading... will seek to {start_seconds}s")
-                self.video_status_label.setStyleSheet("color: #888;")
-
-            else:
-                self.log_gui_event(
-                    f"Could not fetch stream. YouTube may be blocking: {last_error[:200]}",
-                    level="WARN",
-                    color=self.GUI_COLOR_WARNING
-                )
-                self.video_status_label.setText("Stream unavailable - Click to open in browser")
-                self.video_status_label.setStyleSheet("color: #ffa500;")
-                self.play_pause_btn.setEnabled(False)
+    def on_stream_resolved(self, video_id, stream_url):
+        if video_id != getattr(self, '_current_video_id', None):
+            return
+        start_seconds = (self._pending_seek_position or 0) // 1000
+        self.log_gui_event(
+            f"Stream URL obtained. Loading video at {start_seconds}s...",
+            color=self.GUI_COLOR_SUCCESS
+        )
 
-                reply = QMessageBox.question(
-                    self,
-                    "Stream Unavailable",
-                    "Unable to fetch video stream from YouTube.\n\n"
-                    "This may be due to:\n"
-                    "• YouTube anti-bot measures\n"
-                    "• Video restrictions\n"
-                    "• yt-dlp needs updating\n\n"
-                    "Would you like to open the video in your browser instead?",
-                    QMessageBox.Yes | QMessageBox.No,
-                    QMessageBox.Yes
-                )
+        self.media_player.setSource(QUrl(stream_url))
+        self.media_player.play()
+        self.play_pause_btn.setEnabled(True)
+        self.video_status_label.setText(f"Loading... will seek to {start_seconds}s")
+        self.video_status_label.setStyleSheet("color: #888;")
 
-                if reply == QMessageBox.Yes:
-                    url = QUrl(f"https://www.youtube.com/watch?v={video_id}&t={start_seconds}s")
-                    QDesktopServices.openUrl(url)
+    def on_stream_failed(self, video_id, error_message):
+        if video_id != getattr(self, '_current_video_id', None):
+            return
+        start_seconds = (self._pending_seek_position or 0) // 1000
+        self._current_video_id = None
+        self.log_gui_event(
+            f"Could not fetch stream. YouTube may be blocking: {error_message[:200]}",
+            level="WARN",
+            color=self.GUI_COLOR_WARNING
+        )
+        self.video_status_label.setText("Stream unavailable - Click to open in browser")
+        self.video_status_label.setStyleSheet("color: #ffa500;")
+        self.play_pause_btn.setEnabled(False)
 
-        except subprocess.TimeoutExpired:
-            self.log_gui_event(
-                "Timeout while fetching video stream.",
-                level="ERROR",
-                color=self.GUI_COLOR_ERROR
-            )
-            self.video_status_label.setText("Timeout - Click timestamp again or open in browser")
-            self.video_status_label.setStyleSheet("color: #ff6666;")
-            self.play_pause_btn.setEnabled(False)
-        except Exception as e:
-            self.log_gui_event(
-                f"Error loading video stream: {e}",
-                level="ERROR",
-                color=self.GUI_COLOR_ERROR
-            )
-            self.video_status_label.setText(f"Error: {str(e)}")
-            self.video_status_label.setStyleSheet("color: #ff6666;")
+        reply = QMessageBox.question(
+            self,
+            "Stream Unavailable",
+            "Unable to fetch video stream from YouTube.\n\n"
+            "This may be due to:\n"
+            "• YouTube anti-bot measures\n"
+            "• Video restrictions\n"
+            "• yt-dlp needs updating\n\n"
+            "Would you like to open the video in your browser instead?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.Yes
+        )
+
+        if reply == QMessageBox.Yes:
+            url = QUrl(f"https://www.youtube.com/watch?v={video_id}&t={start_seconds}s")
+            QDesktopServices.openUrl(url)
 
     def handle_timestamp_click(self, url):
 
@@ -2609,12 +2893,16 @@ class MainWindow(QMainWindow):
                     self.render_worker.stop()
                 if self.dependency_downloader_worker:
                     self.dependency_downloader_worker.stop()
+                if self.stream_resolver is not None:
+                    self.stream_resolver.shutdown()
 
                 event.accept()
             else:
                 event.ignore()
         else:
             self.log_gui_event("Application closing.", color=self.GUI_COLOR_MUTED)
+            if self.stream_resolver is not None:
+                self.stream_resolver.shutdown()
             event.accept()
 
 if __name__ == "__main__":
@@ -2655,6 +2943,8 @@ if __name__ == "__main__":
 
         sys.exit(1)
 
+    # QtWebEngine is imported lazily, after the application exists.
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
 
     light_palette = QPalette()
@@ -2693,5 +2983,7 @@ if __name__ == "__main__":
 
     main_window = MainWindow()
     main_window.show()
+    first_window_seconds = time.perf_counter() - STARTUP_STARTED_AT
+    QTimer.singleShot(0, lambda: main_window.report_startup_timing(first_window_seconds))
 
     sys.exit(app.exec())
\ No newline at end of file
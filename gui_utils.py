@@ -1,16 +1,26 @@
+import concurrent.futures
+import glob
+import hashlib
 import html
+import json
 import shutil
 import requests
 import zipfile
 import os
 import sys
+import threading
+import time
+from urllib.parse import urlparse
+from collections import deque
 from datetime import datetime, timedelta
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, QTimer
 
 ORG_NAME = "bitArtisan1"
 APP_NAME = "CapScriptPro"
 SETTINGS_THEME = "Appearance/Theme"
 SETTINGS_SIDEBAR_COLLAPSED = "UI/SidebarCollapsed"
+SETTINGS_LOG_LEVEL = "Logging/Level"
+SETTINGS_PREFETCH_BUDGET = "Player/PrefetchBudget"
 
 if getattr(sys, 'frozen', False):
 
@@ -28,14 +38,71 @@ except OSError as e:
 
 YTDLP_PATH = os.path.join(BIN_DIR, "yt-dlp.exe")
 FFMPEG_PATH = os.path.join(BIN_DIR, "ffmpeg.exe")
+FFPROBE_PATH = os.path.join(BIN_DIR, "ffprobe.exe")
 
 YTDLP_URL = "https://github.com/yt-dlp/yt-dlp/releases/latest/download/yt-dlp.exe"
 FFMPEG_URL = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
+YTDLP_SHA256_URL = "https://github.com/yt-dlp/yt-dlp/releases/latest/download/SHA2-256SUMS"
+FFMPEG_SHA256_URL = FFMPEG_URL + ".sha256"
 
 FFMPEG_EXE_PATH_IN_ZIP = "bin/ffmpeg.exe"
+FFPROBE_EXE_PATH_IN_ZIP = "bin/ffprobe.exe"
+
+LOG_LEVELS = {
+    "DEBUG": 10,
+    "DETAIL": 15,
+    "CMD": 15,
+    "INFO": 20,
+    "SUCCESS": 25,
+    "WARN": 30,
+    "ERROR": 40,
+}
+DEFAULT_LOG_LEVEL = "INFO"
+
+_log_threshold = LOG_LEVELS[DEFAULT_LOG_LEVEL]
+
+_ytdlp_module = None
+_ytdlp_import_failed = False
+_ytdlp_import_lock = threading.Lock()
+
+def load_ytdlp_module():
+    """Import the yt_dlp package on first use; returns None if it is not installed."""
+    global _ytdlp_module, _ytdlp_import_failed
+    with _ytdlp_import_lock:
+        if _ytdlp_module is None and not _ytdlp_import_failed:
+            try:
+                import yt_dlp
+                _ytdlp_module = yt_dlp
+            except ImportError:
+                _ytdlp_import_failed = True
+    return _ytdlp_module
+
+def set_log_level(level):
+    global _log_threshold
+    _log_threshold = LOG_LEVELS.get(str(level).upper(), LOG_LEVELS[DEFAULT_LOG_LEVEL])
+
+def is_log_enabled(level):
+    return LOG_LEVELS.get(level.upper(), LOG_LEVELS["INFO"]) >= _log_threshold
+
+class LogRecord:
+    """A log line that is only rendered to HTML when it is displayed."""
+
+    __slots__ = ("created", "message", "level", "color", "bold")
+
+    def __init__(self, message, level="INFO", color=None, bold=False):
+        self.created = datetime.now()
+        self.message = message
+        self.level = level
+        self.color = color
+        self.bold = bold
+
+    def to_html(self):
+        return format_log(
+            self.message, self.level, self.color, self.bold, created=self.created
+        )
 
-def format_log(message, level="INFO", color=None, bold=False):
-    timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+def format_log(message, level="INFO", color=None, bold=False, created=None):
+    timestamp = (created or datetime.now()).strftime("%H:%M:%S.%f")[:-3]
     prefix = f"[{level.upper()}]"
 
     if color is None:
@@ -67,6 +134,61 @@ def format_log(message, level="INFO", color=None, bold=False):
         formatted_message = f'<p style="margin:0; padding:0;"><font color="{color}"><b>{log_entry}</b></font></p>'
     return formatted_message
 
+class LogBuffer(QObject):
+    """Coalesces log lines for a QTextEdit and flushes them in one insert.
+
+    ``write`` may be called from any thread, so workers can connect their
+    ``log_output`` signals with ``Qt.DirectConnection`` and skip the per-line
+    cross-thread event. It accepts pre-rendered HTML or ``LogRecord``s; records
+    are rendered at flush time and dropped if they fall below the current
+    log level. The document keeps at most ``max_lines`` blocks.
+    """
+
+    FLUSH_INTERVAL_MS = 100
+    MAX_LINES = 5000
+
+    def __init__(self, text_edit, max_lines=MAX_LINES, interval_ms=FLUSH_INTERVAL_MS):
+        super().__init__(text_edit)
+        self.text_edit = text_edit
+        self.text_edit.document().setMaximumBlockCount(max_lines)
+        self._pending = deque(maxlen=max_lines)
+        self._lock = threading.Lock()
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+        self._timer.start()
+
+    def write(self, message):
+        with self._lock:
+            self._pending.append(message)
+
+    def clear(self):
+        with self._lock:
+            self._pending.clear()
+        self.text_edit.clear()
+
+    def flush(self):
+        with self._lock:
+            if not self._pending:
+                return
+            batch = list(self._pending)
+            self._pending.clear()
+
+        batch = [
+            entry.to_html() if isinstance(entry, LogRecord) else entry
+            for entry in batch
+            if not isinstance(entry, LogRecord) or is_log_enabled(entry.level)
+        ]
+        if not batch:
+            return
+
+        scrollbar = self.text_edit.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+        self.text_edit.append("".join(batch))
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
 def time_str_to_seconds(time_str):
     try:
         parts = list(map(int, time_str.split(":")))
@@ -89,7 +211,7 @@ def seconds_to_hhmmss(seconds):
 
 def check_dependency(command_name):
     dep_name = command_name.lower()
-    local_path = FFMPEG_PATH if dep_name == "ffmpeg" else YTDLP_PATH
+    local_path = {"ffmpeg": FFMPEG_PATH, "ffprobe": FFPROBE_PATH}.get(dep_name, YTDLP_PATH)
 
     if os.path.isfile(local_path):
         if os.access(local_path, os.X_OK) or os.name == 'nt':
@@ -104,6 +226,16 @@ def check_dependency(command_name):
     return None
 
 class DependencyDownloader(QObject):
+    """Download yt-dlp or ffmpeg into BIN_DIR.
+
+    Downloads go to ``.part`` files that are resumed with HTTP Range
+    requests after a failure or cancel, are split into parallel segments
+    when the server allows it, and are checked against the published
+    SHA-256 before they replace the installed file. Partial files are only
+    resumed while the server reports the same ETag/Last-Modified and size.
+    ``url`` and ``checksum_url`` can point at another mirror (or a local
+    test server).
+    """
 
     progress = Signal(int)
     finished = Signal(bool, str)
@@ -115,253 +247,390 @@ class DependencyDownloader(QObject):
     COLOR_ERROR = "#ff6666"
     COLOR_MUTED = "#888888"
 
-    def __init__(self, dependency_name):
+    CHUNK_SIZE = 1024 * 1024
+    REQUEST_TIMEOUT = 60
+    MAX_RETRIES = 5
+    RETRY_BACKOFF_SECONDS = 2
+    DEFAULT_SEGMENTS = 4
+    MIN_SEGMENT_BYTES = 8 * 1024 * 1024
+
+    def __init__(self, dependency_name, url=None, checksum_url=None, segments=DEFAULT_SEGMENTS):
         super().__init__()
         self.dependency_name = dependency_name.lower()
         self._is_running = True
         self.url = None
+        self.checksum_url = None
         self.target_path = None
         self.download_dest_path = None
         self.is_zip = False
+        self.segments = max(1, segments)
+        self._progress_lock = threading.Lock()
+        self._downloaded = 0
+        self._total = 0
+        self._last_percent = -1
+        self._segment_failed = threading.Event()
+        self._validator = None
 
         if self.dependency_name == "ffmpeg":
             self.url = FFMPEG_URL
+            self.checksum_url = FFMPEG_SHA256_URL
             self.target_path = FFMPEG_PATH
             self.download_dest_path = os.path.join(BIN_DIR, "ffmpeg_download.zip")
             self.is_zip = True
         elif self.dependency_name == "yt-dlp":
             self.url = YTDLP_URL
+            self.checksum_url = YTDLP_SHA256_URL
             self.target_path = YTDLP_PATH
             self.download_dest_path = self.target_path
             self.is_zip = False
         else:
             raise ValueError(f"Unknown dependency: {dependency_name}")
 
+        if url:
+            self.url = url
+            self.checksum_url = checksum_url
+        elif checksum_url:
+            self.checksum_url = checksum_url
+
+    def _log(self, message, color=None, bold=False, level="INFO"):
+        self.log.emit(format_log(message, level=level, color=color, bold=bold))
+
     def stop(self):
         self._is_running = False
-        self.log.emit(
-            format_log(
-                f"Stop requested for {self.dependency_name} download.",
-                color=self.COLOR_WARNING,
+        self._log(
+            f"Stop requested for {self.dependency_name} download.",
+            color=self.COLOR_WARNING,
+        )
+
+    def _add_progress(self, byte_count):
+        with self._progress_lock:
+            self._downloaded += byte_count
+            percent = int(self._downloaded * 100 / self._total) if self._total else 0
+            if percent == self._last_percent:
+                return
+            self._last_percent = percent
+        self.progress.emit(max(0, min(percent, 99)))
+
+    def _probe_remote(self):
+        """Return ``(size, accepts_ranges, final_url, validator)`` for the download URL.
+
+        ``validator`` is the strong ETag or Last-Modified date, usable in
+        If-Range, or None when the server sends neither.
+        """
+        try:
+            response = requests.head(self.url, allow_redirects=True, timeout=self.REQUEST_TIMEOUT)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            self._log(f"HEAD request failed ({e}); downloading as a single stream.", color=self.COLOR_MUTED, level="DEBUG")
+            return 0, False, self.url, None
+        size = int(response.headers.get("content-length", 0) or 0)
+        accepts_ranges = response.headers.get("accept-ranges", "").lower() == "bytes"
+        etag = response.headers.get("etag")
+        # Weak ETags are not allowed in If-Range.
+        if etag and etag.startswith("W/"):
+            etag = None
+        return size, accepts_ranges, response.url, etag or response.headers.get("last-modified")
+
+    def _partial_paths(self, dest_path):
+        pattern = glob.escape(dest_path) + ".*.part*"
+        return [dest_path + ".part", *glob.glob(pattern)]
+
+    def _prepare_resume(self, dest_path, size, validator):
+        """Drop partial files left by a different release than the one on the server now."""
+        state_path = dest_path + ".part.json"
+        state = {"url": self.url, "size": size, "validator": validator}
+        try:
+            with open(state_path, "r", encoding="utf-8") as f:
+                previous = json.load(f)
+        except (OSError, ValueError):
+            previous = None
+        if previous != state or not (validator or size):
+            stale = [path for path in self._partial_paths(dest_path) if os.path.exists(path)]
+            if stale:
+                self._log(
+                    "Discarding a partial download that cannot be verified against the current release.",
+                    color=self.COLOR_MUTED,
+                )
+            for path in stale:
+                os.remove(path)
+        with open(state_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        return state_path
+
+    def _fetch_range(self, url, part_path, start=0, end=None):
+        """Download bytes ``start``..``end`` (inclusive, None for EOF) into ``part_path``.
+
+        Whatever ``part_path`` already holds is kept and only the rest is
+        requested. Transient network errors are retried with backoff.
+        """
+        expected = None if end is None else end - start + 1
+        for attempt in range(1, self.MAX_RETRIES + 1):
+            have = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            if expected is not None and have >= expected:
+                return
+            headers = {}
+            if start + have > 0 or end is not None:
+                headers["Range"] = f"bytes={start + have}-{'' if end is None else end}"
+                if self._validator:
+                    # If the file changed since the probe the server sends it whole.
+                    headers["If-Range"] = self._validator
+            try:
+                with requests.get(url, headers=headers, stream=True, timeout=self.REQUEST_TIMEOUT) as response:
+                    response.raise_for_status()
+                    mode = "ab"
+                    if headers and response.status_code != 206:
+                        if end is not None or start > 0:
+                            # A segment can't take the whole body; a 200 here means
+                            # the range was ignored or If-Range failed.
+                            raise RuntimeError("Server ignored the range request or the file changed during the download")
+                        # Single stream and resume not supported; the body is the whole file.
+                        self._add_progress(-have)
+                        mode = "wb"
+                    with open(part_path, mode) as f:
+                        for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                            if not self._is_running or self._segment_failed.is_set():
+                                raise InterruptedError("Download cancelled")
+                            if chunk:
+                                f.write(chunk)
+                                self._add_progress(len(chunk))
+                if expected is None or os.path.getsize(part_path) >= expected:
+                    return
+                raise requests.exceptions.ConnectionError("Connection closed before the range was complete")
+            except requests.exceptions.RequestException as e:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                delay = self.RETRY_BACKOFF_SECONDS * attempt
+                self._log(
+                    f"Download interrupted ({e}); resuming in {delay}s (attempt {attempt + 1}/{self.MAX_RETRIES})...",
+                    color=self.COLOR_WARNING, level="WARN"
+                )
+                time.sleep(delay)
+
+    def _download(self, dest_path):
+        """Download into ``dest_path + ".part"`` and return that path; ``dest_path`` is not touched."""
+        size, accepts_ranges, url, validator = self._probe_remote()
+        part_path = dest_path + ".part"
+        self._total = size
+        self._validator = validator
+        self._segment_failed.clear()
+        state_path = self._prepare_resume(dest_path, size, validator)
+
+        segment_count = 1
+        if accepts_ranges and size:
+            segment_count = min(self.segments, size // self.MIN_SEGMENT_BYTES)
+
+        if segment_count > 1:
+            bounds = [
+                (index * size // segment_count, (index + 1) * size // segment_count - 1)
+                for index in range(segment_count)
+            ]
+            # The total size is part of the name so segments of a different
+            # release are never mixed in.
+            segment_paths = [f"{dest_path}.{size}.part{index}" for index in range(segment_count)]
+            self._downloaded = sum(
+                min(os.path.getsize(path), end - start + 1)
+                for path, (start, end) in zip(segment_paths, bounds)
+                if os.path.exists(path)
             )
+            self._log(
+                f"Downloading {size / 1e6:.1f} MB in {segment_count} parallel segments...",
+                color=self.COLOR_MUTED,
+            )
+            with concurrent.futures.ThreadPoolExecutor(max_workers=segment_count) as executor:
+                futures = [
+                    executor.submit(self._fetch_range, url, path, start, end)
+                    for path, (start, end) in zip(segment_paths, bounds)
+                ]
+                try:
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    self._segment_failed.set()
+                    raise
+            with open(part_path, "wb") as out:
+                for path in segment_paths:
+                    with open(path, "rb") as segment:
+                        shutil.copyfileobj(segment, out, self.CHUNK_SIZE)
+            for path in segment_paths:
+                os.remove(path)
+        else:
+            have = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            if size and have > size:
+                os.remove(part_path)
+                have = 0
+            if have:
+                self._log(f"Resuming from {have / 1e6:.1f} MB.", color=self.COLOR_MUTED)
+            self._downloaded = have
+            self._fetch_range(url, part_path, 0, size - 1 if size else None)
+
+        os.remove(state_path)
+        return part_path
+
+    def _expected_checksum(self):
+        if not self.checksum_url:
+            return None
+        try:
+            response = requests.get(self.checksum_url, timeout=self.REQUEST_TIMEOUT)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            self._log(f"Could not fetch checksum ({e}); skipping verification.", color=self.COLOR_WARNING, level="WARN")
+            return None
+        file_name = os.path.basename(urlparse(self.url).path)
+        for line in response.text.splitlines():
+            fields = line.split()
+            if not fields:
+                continue
+            # Either a bare digest file or "<digest>  <name>" lines.
+            if len(fields) == 1 or fields[-1].lstrip("*") == file_name:
+                return fields[0].lower()
+        self._log(f"No checksum listed for {file_name}; skipping verification.", color=self.COLOR_WARNING, level="WARN")
+        return None
+
+    def _sha256(self, path):
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(self.CHUNK_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _extract_member(self, zip_ref, suffix, target_path):
+        """Stream the single archive member ending in ``suffix`` to ``target_path``."""
+        member = next(
+            (name for name in zip_ref.namelist() if name.replace("\\", "/").endswith(suffix)),
+            None,
         )
+        if member is None:
+            return False
+        temp_path = target_path + ".tmp"
+        with zip_ref.open(member) as src, open(temp_path, "wb") as dst:
+            shutil.copyfileobj(src, dst, self.CHUNK_SIZE)
+        os.replace(temp_path, target_path)
+        return True
 
     def run(self):
-        self.log.emit(
-            format_log(
-                f"Starting download for {self.dependency_name} from {self.url}",
-                color=self.COLOR_INFO,
-            )
+        self._log(
+            f"Starting download for {self.dependency_name} from {self.url}",
+            color=self.COLOR_INFO,
         )
         self.progress.emit(0)
 
         try:
-            self.log.emit(
-                format_log(
-                    f"Downloading to: {self.download_dest_path}", color=self.COLOR_MUTED
-                )
-            )
-            response = requests.get(self.url, stream=True, timeout=60)
-            response.raise_for_status()
-
-            total_size = int(response.headers.get("content-length", 0))
-            downloaded_size = 0
-            chunk_size = 8192
-
-            with open(self.download_dest_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=chunk_size):
-                    if not self._is_running:
-                        self.log.emit(
-                            format_log(
-                                f"{self.dependency_name} download cancelled.",
-                                color=self.COLOR_WARNING,
-                            )
-                        )
-                        if os.path.exists(self.download_dest_path):
-                            os.remove(self.download_dest_path)
-                        self.finished.emit(False, self.dependency_name)
-                        return
-
-                    if chunk:
-                        f.write(chunk)
-                        downloaded_size += len(chunk)
-                        if total_size > 0:
-                            percent = int((downloaded_size / total_size) * 100)
-                            self.progress.emit(percent)
+            self._log(f"Downloading to: {self.download_dest_path}", color=self.COLOR_MUTED)
+            expected_checksum = self._expected_checksum()
+            part_path = self._download(self.download_dest_path)
+
+            # Verify before replacing: for yt-dlp the destination is the
+            # installed executable, which must survive a bad download.
+            if expected_checksum:
+                actual_checksum = self._sha256(part_path)
+                if actual_checksum != expected_checksum:
+                    os.remove(part_path)
+                    self._log(
+                        f"Error: checksum mismatch for {self.dependency_name} (expected {expected_checksum}, got {actual_checksum}). The download was discarded.",
+                        color=self.COLOR_ERROR,
+                        bold=True,
+                    )
+                    self.finished.emit(False, self.dependency_name)
+                    return
+                self._log("SHA-256 checksum verified.", color=self.COLOR_SUCCESS)
+            os.replace(part_path, self.download_dest_path)
 
             self.progress.emit(100)
-            self.log.emit(
-                format_log(
-                    f"{self.dependency_name} download complete.",
-                    color=self.COLOR_SUCCESS,
-                )
-            )
+            self._log(f"{self.dependency_name} download complete.", color=self.COLOR_SUCCESS)
 
             if self.is_zip:
-                self.log.emit(
-                    format_log(
-                        f"Extracting {self.dependency_name} from {self.download_dest_path}...",
-                        color=self.COLOR_INFO,
-                    )
+                self._log(
+                    f"Extracting {self.dependency_name} from {self.download_dest_path}...",
+                    color=self.COLOR_INFO,
                 )
-                extracted = False
                 try:
                     with zipfile.ZipFile(self.download_dest_path, "r") as zip_ref:
-                        member_to_extract = None
-                        self.log.emit(
-                            format_log(
-                                f"DEBUG: Zip contents: {zip_ref.namelist()}",
-                                level="DEBUG",
-                                color=self.COLOR_MUTED
-                            )
+                        self._log(
+                            f"DEBUG: Zip contents: {zip_ref.namelist()}",
+                            level="DEBUG",
+                            color=self.COLOR_MUTED,
                         )
-                        for member in zip_ref.namelist():
-                            if member.replace("\\\\", "/").endswith(
-                                FFMPEG_EXE_PATH_IN_ZIP.replace("\\\\", "/")
-                            ):
-                                member_to_extract = member
-                                break
-
-                        if member_to_extract:
-                            zip_ref.extract(member_to_extract, path=BIN_DIR)
-                            extracted_path = os.path.join(BIN_DIR, member_to_extract)
-                            os.makedirs(
-                                os.path.dirname(self.target_path), exist_ok=True
-                            )
-                            if os.path.exists(self.target_path):
-                                os.remove(self.target_path)
-                            shutil.move(extracted_path, self.target_path)
-                            extracted_root_folder = os.path.join(
-                                BIN_DIR, member_to_extract.split("/")[0]
-                            )
-                            if os.path.isdir(extracted_root_folder):
-                                try:
-                                    shutil.rmtree(extracted_root_folder)
-                                except OSError as e:
-                                    self.log.emit(
-                                        format_log(
-                                            f"Warning: Could not remove temporary extraction folder {extracted_root_folder}: {e}",
-                                            color=self.COLOR_WARNING,
-                                        )
-                                    )
-
-                            self.log.emit(
-                                format_log(
-                                    f"{self.dependency_name} extracted successfully to {self.target_path}.",
-                                    color=self.COLOR_SUCCESS,
-                                )
-                            )
-                            extracted = True
-                        else:
-                            self.log.emit(
-                                format_log(
-                                    f"Error: Could not find '{FFMPEG_EXE_PATH_IN_ZIP}' within the downloaded zip.",
-                                    color=self.COLOR_ERROR,
-                                    bold=True,
-                                )
+                        os.makedirs(os.path.dirname(self.target_path), exist_ok=True)
+                        if not self._extract_member(zip_ref, FFMPEG_EXE_PATH_IN_ZIP, self.target_path):
+                            self._log(
+                                f"Error: Could not find '{FFMPEG_EXE_PATH_IN_ZIP}' within the downloaded zip.",
+                                color=self.COLOR_ERROR,
+                                bold=True,
                             )
                             self.finished.emit(False, self.dependency_name)
                             return
-
-                except zipfile.BadZipFile:
-                    self.log.emit(
-                        format_log(
-                            f"Error: Downloaded file is not a valid zip file: {self.download_dest_path}",
-                            color=self.COLOR_ERROR,
-                            bold=True,
-                        )
-                    )
-                    self.finished.emit(False, self.dependency_name)
-                    return
-                except FileNotFoundError as e:
-                    self.log.emit(
-                        format_log(
-                            f"Error during extraction (file not found): {e}",
-                            color=self.COLOR_ERROR,
-                            bold=True,
-                        )
-                    )
-                    self.finished.emit(False, self.dependency_name)
-                    return
-                except Exception as e:
-                    self.log.emit(
-                        format_log(
-                            f"Error during extraction: {e}",
-                            color=self.COLOR_ERROR,
-                            bold=True,
+                        self._log(
+                            f"{self.dependency_name} extracted successfully to {self.target_path}.",
+                            color=self.COLOR_SUCCESS,
                         )
+                        # ffprobe ships in the same archive; it is optional
+                        # (only the smart-cut clip mode needs it).
+                        self._extract_member(zip_ref, FFPROBE_EXE_PATH_IN_ZIP, FFPROBE_PATH)
+                except zipfile.BadZipFile:
+                    self._log(
+                        f"Error: Downloaded file is not a valid zip file: {self.download_dest_path}",
+                        color=self.COLOR_ERROR,
+                        bold=True,
                     )
                     self.finished.emit(False, self.dependency_name)
                     return
                 finally:
                     if os.path.exists(self.download_dest_path):
                         os.remove(self.download_dest_path)
-                        self.log.emit(
-                            format_log(
-                                f"Removed temporary file: {self.download_dest_path}",
-                                color=self.COLOR_MUTED,
-                            )
+                        self._log(
+                            f"Removed temporary file: {self.download_dest_path}",
+                            color=self.COLOR_MUTED,
                         )
 
-                if not extracted:
-                    self.finished.emit(False, self.dependency_name)
-                    return
-
             if os.path.exists(self.target_path):
-                self.log.emit(
-                    format_log(
-                        f"{self.dependency_name} is ready at {self.target_path}.",
-                        color=self.COLOR_SUCCESS,
-                        bold=True,
-                    )
+                self._log(
+                    f"{self.dependency_name} is ready at {self.target_path}.",
+                    color=self.COLOR_SUCCESS,
+                    bold=True,
                 )
                 self.finished.emit(True, self.dependency_name)
             else:
-                self.log.emit(
-                    format_log(
-                        f"Error: {self.dependency_name} executable not found at expected location after download/extraction: {self.target_path}",
-                        color=self.COLOR_ERROR,
-                        bold=True,
-                    )
+                self._log(
+                    f"Error: {self.dependency_name} executable not found at expected location after download/extraction: {self.target_path}",
+                    color=self.COLOR_ERROR,
+                    bold=True,
                 )
                 self.finished.emit(False, self.dependency_name)
 
+        except InterruptedError:
+            self._log(
+                f"{self.dependency_name} download cancelled; the partial file is kept and will be resumed next time.",
+                color=self.COLOR_WARNING,
+            )
+            self.finished.emit(False, self.dependency_name)
         except requests.exceptions.Timeout:
-            self.log.emit(
-                format_log(
-                    f"Error: Download timed out for {self.dependency_name}.",
-                    color=self.COLOR_ERROR,
-                    bold=True,
-                )
+            self._log(
+                f"Error: Download timed out for {self.dependency_name}.",
+                color=self.COLOR_ERROR,
+                bold=True,
             )
             self.finished.emit(False, self.dependency_name)
         except requests.exceptions.RequestException as e:
-            self.log.emit(
-                format_log(
-                    f"Error downloading {self.dependency_name}: {e}",
-                    color=self.COLOR_ERROR,
-                    bold=True,
-                )
+            self._log(
+                f"Error downloading {self.dependency_name}: {e}",
+                color=self.COLOR_ERROR,
+                bold=True,
             )
             self.finished.emit(False, self.dependency_name)
         except IOError as e:
-            self.log.emit(
-                format_log(
-                    f"Error writing file during download: {e}",
-                    color=self.COLOR_ERROR,
-                    bold=True,
-                )
+            self._log(
+                f"Error writing file during download: {e}",
+                color=self.COLOR_ERROR,
+                bold=True,
             )
             self.finished.emit(False, self.dependency_name)
         except Exception as e:
-            self.log.emit(
-                format_log(
-                    f"An unexpected error occurred: {e}",
-                    color=self.COLOR_ERROR,
-                    bold=True,
-                )
+            self._log(
+                f"An unexpected error occurred: {e}",
+                color=self.COLOR_ERROR,
+                bold=True,
             )
             self.finished.emit(False, self.dependency_name)
         finally:
             if self._is_running:
-                self.progress.emit(100)
\ No newline at end of file
+                self.progress.emit(100)
@@ -1,10 +1,23 @@
 import os
 import sys
-from PySide6.QtWidgets import QWidget, QLabel, QPushButton, QHBoxLayout
+from PySide6.QtWidgets import (
+    QWidget,
+    QLabel,
+    QPushButton,
+    QHBoxLayout,
+    QVBoxLayout,
+    QGroupBox,
+    QCheckBox,
+    QTableWidget,
+    QTableWidgetItem,
+    QHeaderView,
+    QAbstractItemView,
+)
 from PySide6.QtCore import (
     QPropertyAnimation,
     QEasingCurve,
     QSize,
+    QTimer,
     Qt
 )
 from PySide6.QtGui import QPainter, QPen, QColor, QIcon
@@ -196,4 +209,120 @@ class CustomTitleBar(QWidget):
         pen.setCosmetic(True)
         painter.setPen(pen)
         painter.drawLine(x_start, y, x_end, y)
-        painter.end()
\ No newline at end of file
+        painter.end()
+
+class JobQueuePanel(QGroupBox):
+    """The job queue that `cli.py queue run` works through, with a way to cancel jobs."""
+
+    REFRESH_INTERVAL_MS = 3000
+    COLUMNS = ("ID", "Status", "Priority", "Progress", "Matches", "Search")
+
+    def __init__(self, parent=None):
+        super().__init__("Job Queue", parent)
+        self._queue = None
+
+        layout = QVBoxLayout(self)
+        layout.setSpacing(6)
+
+        header_layout = QHBoxLayout()
+        self.summary_label = QLabel("No jobs.")
+        header_layout.addWidget(self.summary_label, 1)
+        self.show_finished_check = QCheckBox("Show finished")
+        self.show_finished_check.toggled.connect(self.refresh)
+        header_layout.addWidget(self.show_finished_check)
+        self.cancel_job_btn = QPushButton("Cancel Job")
+        self.cancel_job_btn.setFixedHeight(24)
+        self.cancel_job_btn.setToolTip("Cancel the selected queued or running job")
+        self.cancel_job_btn.clicked.connect(self.cancel_selected)
+        header_layout.addWidget(self.cancel_job_btn)
+        layout.addLayout(header_layout)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setMaximumHeight(140)
+        layout.addWidget(self.table)
+
+        # Only poll the database while the panel is on screen.
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.refresh_timer.start()
+
+    def hideEvent(self, event):
+        self.refresh_timer.stop()
+        super().hideEvent(event)
+
+    def _get_queue(self):
+        if self._queue is None:
+            from job_queue import JobQueue
+
+            self._queue = JobQueue()
+        return self._queue
+
+    def refresh(self):
+        from job_queue import STATUS_QUEUED, STATUS_RUNNING, describe_job, format_progress
+
+        try:
+            queue = self._get_queue()
+            jobs = queue.jobs(include_finished=self.show_finished_check.isChecked())
+            counts = queue.counts()
+        except Exception as e:
+            self.summary_label.setText(f"Job queue unavailable: {e}")
+            self.refresh_timer.stop()
+            return
+
+        selected_id = self.selected_job_id()
+        self.table.setRowCount(len(jobs))
+        for row, job in enumerate(jobs):
+            values = (
+                str(job["id"]),
+                job["status"],
+                str(job["priority"]),
+                format_progress(job),
+                str(job["matches"]),
+                describe_job(job),
+            )
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column == len(values) - 1 and job["output_path"]:
+                    item.setToolTip(job["output_path"])
+                elif column == len(values) - 1 and job["error"]:
+                    item.setToolTip(job["error"])
+                self.table.setItem(row, column, item)
+            if job["id"] == selected_id:
+                self.table.selectRow(row)
+
+        running = counts.get(STATUS_RUNNING, 0)
+        queued = counts.get(STATUS_QUEUED, 0)
+        if running or queued:
+            self.summary_label.setText(f"{running} running, {queued} queued")
+        else:
+            self.summary_label.setText("No jobs waiting. Queue searches with 'cli.py queue add'.")
+
+    def selected_job_id(self):
+        rows = self.table.selectionModel().selectedRows()
+        if not rows:
+            return None
+        item = self.table.item(rows[0].row(), 0)
+        return int(item.text()) if item else None
+
+    def cancel_selected(self):
+        job_id = self.selected_job_id()
+        if job_id is None:
+            return
+        try:
+            self._get_queue().cancel(job_id)
+        except Exception as e:
+            self.summary_label.setText(f"Could not cancel job {job_id}: {e}")
+            return
+        self.refresh()
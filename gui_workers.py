@@ -1,30 +1,39 @@
+import json
 import os
 import re
+import shutil
 import subprocess
+import tempfile
 import threading
+import time
 import concurrent.futures
+from collections import Counter
 from concurrent.futures import FIRST_COMPLETED
 from datetime import datetime
 from PySide6.QtCore import QObject, Signal
-from cli import (
-    get_authenticated_service,
-    parse_video_ids,
-    get_channel_videos,
-    get_video_details,
-    format_time,
-    format_views,
+from gui_utils import (
+    format_log,
+    is_log_enabled,
+    LogRecord,
+    seconds_to_hhmmss,
+    YTDLP_PATH,
+    FFMPEG_PATH,
+    check_dependency,
+    load_ytdlp_module,
 )
-from youtube_transcript_api import (
-    YouTubeTranscriptApi,
-    NoTranscriptFound,
-    TranscriptsDisabled,
-)
-from googleapiclient.errors import HttpError
-from gui_utils import format_log, seconds_to_hhmmss, YTDLP_PATH, FFMPEG_PATH
+from gui_cache import ClipCache, SourceVideoCache
+
+class LoggingWorker(QObject):
+    """Base for workers that report through a ``log_output`` signal."""
 
-class Worker(QObject):
+    def _log(self, message, level="INFO", color=None, bold=False):
+        if is_log_enabled(level):
+            self.log_output.emit(LogRecord(message, level, color, bold))
+
+class Worker(LoggingWorker):
     progress_update = Signal(int)
-    log_output = Signal(str)
+    log_output = Signal(object)
+    result_ready = Signal(str)
     finished = Signal(int, list)
     error = Signal(str)
 
@@ -42,14 +51,29 @@ class Worker(QObject):
         self._is_running = True
 
     def stop(self):
-        self.log_output.emit(
-            format_log(
-                "Stop request received by worker.", color=self.COLOR_WARNING, bold=True, level="WARN"
-            )
+        self._log(
+            "Stop request received by worker.", color=self.COLOR_WARNING, bold=True, level="WARN"
         )
         self._is_running = False
 
     def run(self):
+        # The API client and transcript libraries load with the first search
+        # rather than with the GUI.
+        from cli import (
+            get_authenticated_service,
+            parse_video_ids,
+            get_channel_videos,
+            get_video_details,
+            format_time,
+            format_views,
+        )
+        from youtube_transcript_api import (
+            YouTubeTranscriptApi,
+            NoTranscriptFound,
+            TranscriptsDisabled,
+        )
+        from googleapiclient.errors import HttpError
+
         (
             api_key,
             search_type,
@@ -63,21 +87,17 @@ class Worker(QObject):
         match_count = 0
         results = []
         start_time_total = datetime.now()
-        self.log_output.emit(
-            format_log(
-                f"Worker thread started. Search Type: '{search_type}', Keyword: '{keyword}', Lang: '{language}'.",
-                color=self.COLOR_INFO, level="INFO"
-            )
+        self._log(
+            f"Worker thread started. Search Type: '{search_type}', Keyword: '{keyword}', Lang: '{language}'.",
+            color=self.COLOR_INFO, level="INFO"
         )
 
         try:
             search_pattern = re.compile(
                 r"\b" + re.escape(keyword) + r"\b", re.IGNORECASE
             )
-            self.log_output.emit(
-                format_log(
-                    f"Compiled regex: {search_pattern.pattern}", color=self.COLOR_MUTED, level="DEBUG"
-                )
+            self._log(
+                f"Compiled regex: {search_pattern.pattern}", color=self.COLOR_MUTED, level="DEBUG"
             )
         except re.error as e:
             self.error.emit(
@@ -92,34 +112,26 @@ class Worker(QObject):
 
         try:
             if not self._is_running:
-                self.log_output.emit(
-                    format_log(
-                        "Worker cancelled before initialization.",
-                        color=self.COLOR_WARNING, level="WARN"
-                    )
+                self._log(
+                    "Worker cancelled before initialization.",
+                    color=self.COLOR_WARNING, level="WARN"
                 )
                 self.finished.emit(match_count, results)
                 return
 
-            self.log_output.emit(
-                format_log("Initializing YouTube service...", color=self.COLOR_DEFAULT, level="INFO")
-            )
+            self._log("Initializing YouTube service...", color=self.COLOR_DEFAULT, level="INFO")
             init_start_time = datetime.now()
             youtube = get_authenticated_service(api_key)
             init_duration = (datetime.now() - init_start_time).total_seconds()
-            self.log_output.emit(
-                format_log(
-                    f"YouTube service initialized in {init_duration:.3f}s.",
-                    color=self.COLOR_SUCCESS, level="SUCCESS"
-                )
+            self._log(
+                f"YouTube service initialized in {init_duration:.3f}s.",
+                color=self.COLOR_SUCCESS, level="SUCCESS"
             )
 
             if not self._is_running:
-                self.log_output.emit(
-                    format_log(
-                        "Worker cancelled after initialization.",
-                        color=self.COLOR_WARNING, level="WARN"
-                    )
+                self._log(
+                    "Worker cancelled after initialization.",
+                    color=self.COLOR_WARNING, level="WARN"
                 )
                 self.finished.emit(match_count, results)
                 return
@@ -127,97 +139,75 @@ class Worker(QObject):
             vids = []
             fetch_start_time = datetime.now()
             if search_type == "channel":
-                self.log_output.emit(
-                    format_log(
-                        f"Fetching channel videos for '{channel_id}' (max: {max_results})...",
-                        color=self.COLOR_DEFAULT, level="INFO"
-                    )
+                self._log(
+                    f"Fetching channel videos for '{channel_id}' (max: {max_results})...",
+                    color=self.COLOR_DEFAULT, level="INFO"
                 )
                 vids = get_channel_videos(youtube, channel_id, language, max_results)
                 fetch_duration = (datetime.now() - fetch_start_time).total_seconds()
                 if not self._is_running:
-                    self.log_output.emit(
-                        format_log(
-                            "Worker cancelled during/after channel video fetch.",
-                            color=self.COLOR_WARNING, level="WARN"
-                        )
+                    self._log(
+                        "Worker cancelled during/after channel video fetch.",
+                        color=self.COLOR_WARNING, level="WARN"
                     )
                     self.finished.emit(match_count, results)
                     return
-                self.log_output.emit(
-                    format_log(
-                        f"Found {len(vids)} videos with captions in {fetch_duration:.2f}s.",
-                        color=self.COLOR_INFO, level="INFO"
-                    )
+                self._log(
+                    f"Found {len(vids)} videos with captions in {fetch_duration:.2f}s.",
+                    color=self.COLOR_INFO, level="INFO"
                 )
             else:
-                self.log_output.emit(
-                    format_log(
-                        f"Parsing video IDs from input: '{video_ids_input[:50]}...'...",
-                        color=self.COLOR_DEFAULT, level="INFO"
-                    )
+                self._log(
+                    f"Parsing video IDs from input: '{video_ids_input[:50]}...'...",
+                    color=self.COLOR_DEFAULT, level="INFO"
                 )
                 vids = parse_video_ids(video_ids_input) or []
                 fetch_duration = (datetime.now() - fetch_start_time).total_seconds()
                 if not self._is_running:
-                    self.log_output.emit(
-                        format_log(
-                            "Worker cancelled during/after video ID parsing.",
-                            color=self.COLOR_WARNING, level="WARN"
-                        )
+                    self._log(
+                        "Worker cancelled during/after video ID parsing.",
+                        color=self.COLOR_WARNING, level="WARN"
                     )
                     self.finished.emit(match_count, results)
                     return
-                self.log_output.emit(
-                    format_log(
-                        f"Parsed {len(vids)} video IDs in {fetch_duration:.2f}s.",
-                        color=self.COLOR_INFO, level="INFO"
-                    )
+                self._log(
+                    f"Parsed {len(vids)} video IDs in {fetch_duration:.2f}s.",
+                    color=self.COLOR_INFO, level="INFO"
                 )
 
             if not vids:
-                self.log_output.emit(
-                    format_log("No videos found to process.", color=self.COLOR_WARNING, level="WARN")
-                )
+                self._log("No videos found to process.", color=self.COLOR_WARNING, level="WARN")
                 self.finished.emit(match_count, results)
                 return
 
             if not self._is_running:
-                self.log_output.emit(
-                    format_log(
-                        "Worker cancelled before search phase.",
-                        color=self.COLOR_WARNING, level="WARN"
-                    )
+                self._log(
+                    "Worker cancelled before search phase.",
+                    color=self.COLOR_WARNING, level="WARN"
                 )
                 self.finished.emit(match_count, results)
                 return
 
             total = len(vids)
-            self.log_output.emit(
-                format_log(
-                    f"Starting transcript search for exact word '{keyword}' in {total} videos...",
-                    color=self.COLOR_INFO,
-                    bold=True, level="INFO"
-                )
+            self._log(
+                f"Starting transcript search for exact word '{keyword}' in {total} videos...",
+                color=self.COLOR_INFO,
+                bold=True, level="INFO"
             )
             search_start_time = datetime.now()
 
             for i, vid in enumerate(vids, 1):
                 if not self._is_running:
-                    self.log_output.emit(
-                        format_log(
-                            f"Cancellation detected before processing video {i}/{total} ({vid}).",
-                            color=self.COLOR_WARNING, level="WARN"
-                        )
+                    self._log(
+                        f"Cancellation detected before processing video {i}/{total} ({vid}).",
+                        color=self.COLOR_WARNING, level="WARN"
                     )
                     break
 
                 proc_start_time = datetime.now()
-                self.log_output.emit(
-                    format_log(
-                        f"Processing video {i}/{total} ({vid})...",
-                        color=self.COLOR_DEFAULT, level="INFO"
-                    )
+                self._log(
+                    f"Processing video {i}/{total} ({vid})...",
+                    color=self.COLOR_DEFAULT, level="INFO"
                 )
                 try:
 
@@ -235,11 +225,9 @@ class Worker(QObject):
                     if transcript_items:
                         current_matches = len(transcript_items)
                         match_count += current_matches
-                        self.log_output.emit(
-                            format_log(
-                                f"Found {current_matches} match(es) in video {vid}.",
-                                color=self.COLOR_SUCCESS, level="SUCCESS"
-                            )
+                        self._log(
+                            f"Found {current_matches} match(es) in video {vid}.",
+                            color=self.COLOR_SUCCESS, level="SUCCESS"
                         )
 
                         details_start_time = datetime.now()
@@ -253,11 +241,9 @@ class Worker(QObject):
                         details_duration = (
                             datetime.now() - details_start_time
                         ).total_seconds()
-                        self.log_output.emit(
-                            format_log(
-                                f"Fetched details for {vid} in {details_duration:.3f}s.",
-                                color=self.COLOR_MUTED, level="DEBUG"
-                            )
+                        self._log(
+                            f"Fetched details for {vid} in {details_duration:.3f}s.",
+                            color=self.COLOR_MUTED, level="DEBUG"
                         )
 
                         video_details_str = f"Video Title: {title}\n"
@@ -273,58 +259,45 @@ class Worker(QObject):
                             video_details_str += f"╳ {time_str} - {item['text']}\n"
                         video_details_str += "\n" + "═" * 40 + "\n\n"
                         results.append(video_details_str)
+                        self.result_ready.emit(video_details_str)
                     else:
-                        self.log_output.emit(
-                            format_log(
-                                f"No matches found in video {vid}.",
-                                color=self.COLOR_MUTED, level="DEBUG"
-                            )
+                        self._log(
+                            f"No matches found in video {vid}.",
+                            color=self.COLOR_MUTED, level="DEBUG"
                         )
 
                 except (NoTranscriptFound, TranscriptsDisabled):
-                    self.log_output.emit(
-                        format_log(
-                            f"No transcript found or disabled for video {vid} (Lang: {language}).",
-                            color=self.COLOR_WARNING, level="WARN"
-                        )
+                    self._log(
+                        f"No transcript found or disabled for video {vid} (Lang: {language}).",
+                        color=self.COLOR_WARNING, level="WARN"
                     )
                 except HttpError as e:
-                    self.log_output.emit(
-                        format_log(
-                            f"API Error fetching details for {vid}: {e}",
-                            color=self.COLOR_ERROR, level="ERROR"
-                        )
+                    self._log(
+                        f"API Error fetching details for {vid}: {e}",
+                        color=self.COLOR_ERROR, level="ERROR"
                     )
                 except Exception as e:
-                    self.log_output.emit(
-                        format_log(
-                            f"Error processing video {vid}: {e}", color=self.COLOR_ERROR, level="ERROR"
-                        )
+                    self._log(
+                        f"Error processing video {vid}: {e}", color=self.COLOR_ERROR, level="ERROR"
                     )
 
                 proc_duration = (datetime.now() - proc_start_time).total_seconds()
-                self.log_output.emit(
-                    format_log(
-                        f"Finished video {vid} in {proc_duration:.2f}s.",
-                        color=self.COLOR_MUTED, level="DEBUG"
-                    )
+                self._log(
+                    f"Finished video {vid} in {proc_duration:.2f}s.",
+                    color=self.COLOR_MUTED, level="DEBUG"
                 )
                 self.progress_update.emit(int((i / total) * 100))
 
             search_duration = (datetime.now() - search_start_time).total_seconds()
             if self._is_running:
-                self.log_output.emit(
-                    format_log(
-                        f"Transcript search phase completed in {search_duration:.2f}s.",
-                        color=self.COLOR_INFO, level="INFO"
-                    )
+                self._log(
+                    f"Transcript search phase completed in {search_duration:.2f}s.",
+                    color=self.COLOR_INFO, level="INFO"
                 )
 
             if self._is_running and match_count > 0:
-                self.log_output.emit(
-                    format_log(
-                        f"Saving {match_count} results...", color=self.COLOR_DEFAULT, level="INFO"
-                    )
+                self._log(
+                    f"Saving {match_count} results...", color=self.COLOR_DEFAULT, level="INFO"
                 )
                 save_start_time = datetime.now()
                 try:
@@ -346,27 +319,21 @@ class Worker(QObject):
                         f.write("\n".join(results))
                     save_duration = (datetime.now() - save_start_time).total_seconds()
                     if not self._is_running:
-                        self.log_output.emit(
-                            format_log(
-                                "Worker cancelled during/after saving results.",
-                                color=self.COLOR_WARNING, level="WARN"
-                            )
+                        self._log(
+                            "Worker cancelled during/after saving results.",
+                            color=self.COLOR_WARNING, level="WARN"
                         )
                     else:
-                        self.log_output.emit(
-                            format_log(
-                                f"Results saved to: {out} in {save_duration:.3f}s.",
-                                color=self.COLOR_SUCCESS,
-                                bold=True, level="SUCCESS"
-                            )
+                        self._log(
+                            f"Results saved to: {out} in {save_duration:.3f}s.",
+                            color=self.COLOR_SUCCESS,
+                            bold=True, level="SUCCESS"
                         )
                 except Exception as e:
                     if not self._is_running:
-                        self.log_output.emit(
-                            format_log(
-                                "Cancellation detected after error during save.",
-                                color=self.COLOR_WARNING, level="WARN"
-                            )
+                        self._log(
+                            "Cancellation detected after error during save.",
+                            color=self.COLOR_WARNING, level="WARN"
                         )
                     else:
                         self.error.emit(
@@ -377,25 +344,19 @@ class Worker(QObject):
                             )
                         )
             elif self._is_running and match_count == 0:
-                self.log_output.emit(
-                    format_log(
-                        "No matches found across all videos.", color=self.COLOR_WARNING, level="WARN"
-                    )
+                self._log(
+                    "No matches found across all videos.", color=self.COLOR_WARNING, level="WARN"
                 )
             elif not self._is_running:
-                self.log_output.emit(
-                    format_log(
-                        "Skipping save due to cancellation.", color=self.COLOR_WARNING, level="WARN"
-                    )
+                self._log(
+                    "Skipping save due to cancellation.", color=self.COLOR_WARNING, level="WARN"
                 )
 
         except Exception as e:
             if not self._is_running:
-                self.log_output.emit(
-                    format_log(
-                        f"Cancellation detected after unexpected error: {e}",
-                        color=self.COLOR_WARNING, level="WARN"
-                    )
+                self._log(
+                    f"Cancellation detected after unexpected error: {e}",
+                    color=self.COLOR_WARNING, level="WARN"
                 )
             else:
                 self.error.emit(
@@ -408,17 +369,17 @@ class Worker(QObject):
         finally:
             total_duration = (datetime.now() - start_time_total).total_seconds()
             final_status = "cancelled" if not self._is_running else "finished"
-            self.log_output.emit(
-                format_log(
-                    f"Worker thread {final_status}. Total time: {total_duration:.2f}s. Found {match_count} total matches.",
-                    color=self.COLOR_INFO,
-                    bold=True, level="INFO"
-                )
+            self._log(
+                f"Worker thread {final_status}. Total time: {total_duration:.2f}s. Found {match_count} total matches.",
+                color=self.COLOR_INFO,
+                bold=True, level="INFO"
             )
             self.finished.emit(match_count, results)
 
-class ClipDownloaderWorker(QObject):
-    log_output = Signal(str)
+class ClipDownloaderWorker(LoggingWorker):
+    log_output = Signal(object)
+    # percent of clips finished, plus "clips · MB/s · ETA" details
+    progress_update = Signal(int, str)
     finished = Signal(bool, str)
     error = Signal(str)
 
@@ -436,19 +397,109 @@ class ClipDownloaderWorker(QObject):
     _time_text_regex = re.compile(r">(\d{1,2}:\d{2}:\d{2})<")
 
     MAX_CONCURRENT_DOWNLOADS = 4
-
-    def __init__(self, html_content, output_dir, clip_duration, ytdlp_path, ffmpeg_path):
+    # One ffmpeg per four cores: each batch runs several libx264 outputs,
+    # so more processes than that would only fight over the same cores.
+    MAX_CONCURRENT_ENCODES = max(1, min(4, (os.cpu_count() or 1) // 4))
+
+    DOWNLOAD_MODE_FULL = "full"
+    DOWNLOAD_MODE_SECTIONS = "sections"
+    SECTION_PADDING_SECONDS = 2
+    YTDLP_FORMAT = "bestvideo[vcodec^=avc1]+bestaudio[ext=m4a]/bestvideo[ext=mp4][vcodec^=avc1]+bestaudio/best[ext=mp4]/best"
+    # yt-dlp prints one machine-readable line per progress tick; the filename
+    # goes last because it may contain spaces.
+    PROGRESS_PREFIX = "[capscript-progress]"
+    YTDLP_PROGRESS_TEMPLATE = (
+        "download:" + PROGRESS_PREFIX
+        + " %(progress.downloaded_bytes)s %(progress.total_bytes)s"
+        + " %(progress.total_bytes_estimate)s %(progress.speed)s %(progress.filename)s"
+    )
+    PROGRESS_INTERVAL_SECONDS = 0.25
+
+    YTDLP_ENGINE_AUTO = "auto"
+    YTDLP_ENGINE_MODULE = "module"
+    YTDLP_ENGINE_EXE = "exe"
+
+    CLIP_BATCH_SIZE = 16
+    CLIP_ENCODE_ARGS = [
+        "-c:v", "libx264",
+        "-preset", "ultrafast",
+        "-crf", "23",
+        "-c:a", "aac",
+        "-b:a", "128k",
+    ]
+
+    CLIP_MODE_REENCODE = "reencode"
+    CLIP_MODE_SMART = "smart"
+    # Partial GOPs at the clip edges are re-encoded at near-source quality so
+    # they blend with the stream-copied interior.
+    SMART_CUT_EDGE_ARGS = [
+        "-c:v", "libx264",
+        "-preset", "veryfast",
+        "-crf", "18",
+        "-c:a", "aac",
+        "-b:a", "128k",
+    ]
+    SMART_CUT_COPY_ARGS = ["-c", "copy"]
+    SMART_CUT_MIN_COPY_SECONDS = 1.0
+    SMART_CUT_CODECS = ("h264",)
+    # The edges are joined to the copied interior without re-encoding, so
+    # they must be encoded with the source's profile; other profiles (High 10,
+    # 4:2:2, ...) cannot be matched by an 8-bit libx264 and get a full encode.
+    SMART_CUT_PROFILES = {
+        "Constrained Baseline": "baseline",
+        "Baseline": "baseline",
+        "Main": "main",
+        "High": "high",
+    }
+
+    DEFAULT_MERGE_GAP_SECONDS = 2
+
+    def __init__(
+        self,
+        html_content,
+        output_dir,
+        clip_duration,
+        ytdlp_path,
+        ffmpeg_path,
+        download_mode=DOWNLOAD_MODE_SECTIONS,
+        batch_clips=True,
+        clip_mode=CLIP_MODE_REENCODE,
+        ffprobe_path=None,
+        merge_gap_seconds=DEFAULT_MERGE_GAP_SECONDS,
+        cache_dir=None,
+        source_cache_bytes=SourceVideoCache.DEFAULT_MAX_BYTES,
+        log_ytdlp_output=False,
+        ytdlp_engine=YTDLP_ENGINE_AUTO,
+    ):
         super().__init__()
         self.html_content = html_content
         self.base_output_dir = output_dir
         self.clip_duration = clip_duration
+        self.download_mode = download_mode
+        self.batch_clips = batch_clips
+        self.clip_mode = clip_mode
+        self.merge_gap_seconds = merge_gap_seconds
+        self.cache_dir = cache_dir or os.path.join(output_dir, "cache")
+        self.source_cache_bytes = source_cache_bytes
+        self.clip_cache = None
+        self.source_cache = None
+        self.log_ytdlp_output = log_ytdlp_output
+        self._download_progress = {}
+        self._clips_total = 0
+        self._clips_done = 0
+        self._last_progress_emit = 0.0
         self._is_running = True
-        self.executor = None
+        self.download_executor = None
+        self.encode_executor = None
+        # Split the cores between the concurrent encodes instead of letting
+        # every ffmpeg size its own thread pool to the whole machine.
+        self.encode_threads = max(1, (os.cpu_count() or 1) // self.MAX_CONCURRENT_ENCODES)
         self.active_processes = {}
         self.ytdlp_executable = ytdlp_path
         self.ffmpeg_executable = ffmpeg_path
+        self.ffprobe_executable = ffprobe_path
         self.ydl_opts_base = {
-            "format": "bestvideo+bestaudio/best",
+            "format": self.YTDLP_FORMAT,
             "merge_output_format": "mp4",
             "quiet": True,
             "no_warnings": True,
@@ -460,25 +511,71 @@ class ClipDownloaderWorker(QObject):
         }
         self.lock = threading.Lock()
 
+        self.ytdlp_module = None
+        if ytdlp_engine != self.YTDLP_ENGINE_EXE:
+            self.ytdlp_module = load_ytdlp_module()
+        self._ydl_local = threading.local()
+        self._ydl_instances = []
+
+    @staticmethod
+    def _parse_progress_number(value):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    def _update_download_progress(self, task_key, filename, downloaded, total, speed):
+        with self.lock:
+            self._download_progress[(task_key, filename)] = (downloaded or 0, total, speed or 0)
+        self._emit_progress()
+
+    def _emit_progress(self, force=False):
+        """Aggregate per-file download progress and clip counts into one update."""
+        now = time.monotonic()
+        with self.lock:
+            if not force and now - self._last_progress_emit < self.PROGRESS_INTERVAL_SECONDS:
+                return
+            self._last_progress_emit = now
+            downloaded = 0
+            remaining = 0
+            speed = 0
+            for done_bytes, total_bytes, rate in self._download_progress.values():
+                downloaded += done_bytes
+                if total_bytes and done_bytes < total_bytes:
+                    remaining += total_bytes - done_bytes
+                    speed += rate
+            clips_done = self._clips_done
+            clips_total = self._clips_total
+
+        details = [f"{clips_done}/{clips_total} clips", f"{downloaded / 1e6:.1f} MB"]
+        if speed > 0:
+            details.append(f"{speed / 1e6:.1f} MB/s")
+            if remaining:
+                details.append(f"ETA {seconds_to_hhmmss(int(remaining / speed))}")
+        percent = int(100 * clips_done / clips_total) if clips_total else 0
+        self.progress_update.emit(percent, " · ".join(details))
+
+    def _record_clips_done(self, count):
+        with self.lock:
+            self._clips_done += count
+        self._emit_progress(force=True)
+
     def stop(self):
         if not self._is_running:
             return
         self._is_running = False
-        self.log_output.emit(
-            format_log(
-                "Stop request received by clip downloader.",
-                color=self.COLOR_WARNING,
-                bold=True, level="WARN"
-            )
+        self._log(
+            "Stop request received by clip downloader.",
+            color=self.COLOR_WARNING,
+            bold=True, level="WARN"
         )
 
-        if self.executor:
-            self.executor.shutdown(wait=False)
-            self.log_output.emit(
-                format_log(
-                    "ThreadPoolExecutor shutdown initiated.", color=self.COLOR_WARNING, level="WARN"
-                )
-            )
+        for executor in (self.download_executor, self.encode_executor):
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+        self._log(
+            "Download and encode pools shutdown initiated.", color=self.COLOR_WARNING, level="WARN"
+        )
 
         processes_to_terminate = []
         with self.lock:
@@ -487,85 +584,62 @@ class ClipDownloaderWorker(QObject):
 
         active_count = len(processes_to_terminate)
         if active_count > 0:
-            self.log_output.emit(
-                format_log(
-                    f"Attempting to terminate {active_count} active download process(es)...",
-                    color=self.COLOR_WARNING, level="WARN"
-                )
+            self._log(
+                f"Attempting to terminate {active_count} active download/clip process(es)...",
+                color=self.COLOR_WARNING, level="WARN"
             )
             for process in processes_to_terminate:
                 if process and process.poll() is None:
                     pid = process.pid
-                    self.log_output.emit(
-                        format_log(
-                            f"Terminating yt-dlp process {pid}...",
-                            color=self.COLOR_MUTED, level="DEBUG"
-                        )
+                    self._log(
+                        f"Terminating process {pid}...",
+                        color=self.COLOR_MUTED, level="DEBUG"
                     )
                     try:
                         process.terminate()
                         try:
                             process.wait(timeout=1)
-                            self.log_output.emit(
-                                format_log(
-                                    f"Process {pid} terminated.", color=self.COLOR_MUTED, level="DEBUG"
-                                )
+                            self._log(
+                                f"Process {pid} terminated.", color=self.COLOR_MUTED, level="DEBUG"
                             )
                         except subprocess.TimeoutExpired:
-                            self.log_output.emit(
-                                format_log(
-                                    f"Process {pid} did not terminate quickly, killing...",
-                                    color=self.COLOR_WARNING, level="WARN"
-                                )
+                            self._log(
+                                f"Process {pid} did not terminate quickly, killing...",
+                                color=self.COLOR_WARNING, level="WARN"
                             )
                             process.kill()
                             process.wait(timeout=1)
-                            self.log_output.emit(
-                                format_log(
-                                    f"Process {pid} killed.", color=self.COLOR_WARNING, level="WARN"
-                                )
+                            self._log(
+                                f"Process {pid} killed.", color=self.COLOR_WARNING, level="WARN"
                             )
                     except Exception as e:
-                        self.log_output.emit(
-                            format_log(
-                                f"Error stopping process {pid}: {e}",
-                                color=self.COLOR_ERROR, level="ERROR"
-                            )
+                        self._log(
+                            f"Error stopping process {pid}: {e}",
+                            color=self.COLOR_ERROR, level="ERROR"
                         )
         else:
-            self.log_output.emit(
-                format_log(
-                    "No active download processes found to terminate.",
-                    color=self.COLOR_MUTED, level="DEBUG"
-                )
+            self._log(
+                "No active download processes found to terminate.",
+                color=self.COLOR_MUTED, level="DEBUG"
             )
 
-    def _download_and_clip_task(self, video_id, starts):
-        video_dir = os.path.join(self.base_output_dir, "videos")
-        clips_dir = os.path.join(self.base_output_dir, "clips")
-        os.makedirs(video_dir, exist_ok=True)
-        os.makedirs(clips_dir, exist_ok=True)
-
-        video_path = os.path.join(video_dir, f"{video_id}.mp4")
-        url = f"https://youtu.be/{video_id}"
-
-        self.log_output.emit(
-            format_log(f"Downloading {video_id}", color=self.COLOR_INFO, level="INFO")
-        )
-
+    def _run_ytdlp(self, task_key, url, output_path, extra_args=()):
         ytdlp_command = [
             self.ytdlp_executable,
             url,
             "-f",
-            "bestvideo[vcodec^=avc1]+bestaudio[ext=m4a]/bestvideo[ext=mp4][vcodec^=avc1]+bestaudio/best[ext=mp4]/best",
+            self.YTDLP_FORMAT,
             "--merge-output-format",
             "mp4",
             "-o",
-            video_path,
+            output_path,
             "--ffmpeg-location", self.ffmpeg_executable,
             "--no-warnings",
+            "--newline",
+            "--progress-template", self.YTDLP_PROGRESS_TEMPLATE,
+            *extra_args,
         ]
-        self.log_output.emit(format_log(f"DEBUG: Running yt-dlp command: {' '.join(ytdlp_command)}", level="DEBUG"))
+        self._log(f"DEBUG: Running yt-dlp command: {' '.join(ytdlp_command)}", level="DEBUG")
 
         proc = None
         try:
@@ -584,7 +658,7 @@ class ClipDownloaderWorker(QObject):
                  if not self._is_running:
                      proc.terminate()
                      raise InterruptedError("Download cancelled before process start")
-                 self.active_processes[video_id] = proc
+                 self.active_processes[task_key] = proc
 
             process_output = []
             if proc.stdout:
@@ -595,15 +669,28 @@ class ClipDownloaderWorker(QObject):
                             proc.terminate()
                         raise InterruptedError("Download cancelled during execution")
                     line_strip = line.strip()
-                    if line_strip:
+                    if line_strip.startswith(self.PROGRESS_PREFIX):
+                        fields = line_strip[len(self.PROGRESS_PREFIX):].strip().split(" ", 4)
+                        if len(fields) == 5:
+                            downloaded, total, estimate, speed, filename = fields
+                            self._update_download_progress(
+                                task_key,
+                                filename,
+                                self._parse_progress_number(downloaded),
+                                self._parse_progress_number(total)
+                                or self._parse_progress_number(estimate),
+                                self._parse_progress_number(speed),
+                            )
+                    elif line_strip:
                         process_output.append(line_strip)
-                        self.log_output.emit(format_log(f"[yt-dlp] {line_strip}", color=self.COLOR_MUTED, level="DEBUG"))
+                        if self.log_ytdlp_output:
+                            self._log(f"[yt-dlp] {line_strip}", color=self.COLOR_MUTED, level="DEBUG")
                 proc.stdout.close()
 
             return_code = proc.wait()
 
             with self.lock:
-                self.active_processes.pop(video_id, None)
+                self.active_processes.pop(task_key, None)
 
             if return_code != 0:
 
@@ -614,82 +701,526 @@ class ClipDownloaderWorker(QObject):
 
             raise
         except InterruptedError as e:
-             self.log_output.emit(format_log(f"Download for {video_id} cancelled.", level="WARN", color=self.COLOR_WARNING))
+             self._log(f"Download for {task_key} cancelled.", level="WARN", color=self.COLOR_WARNING)
              raise
         except Exception as e:
-            self.log_output.emit(format_log(f"Error during yt-dlp execution for {video_id}: {e}", level="ERROR", color=self.COLOR_ERROR))
+            self._log(f"Error during yt-dlp execution for {task_key}: {e}", level="ERROR", color=self.COLOR_ERROR)
 
             with self.lock:
-                self.active_processes.pop(video_id, None)
+                self.active_processes.pop(task_key, None)
             raise
 
-        clipped = 0
-        for start in starts:
+    @staticmethod
+    def plan_clip_windows(starts, clip_duration, merge_gap_seconds):
+        """Turn clip start times into sorted, merged ``(start, end)`` windows.
+
+        Windows that overlap or are separated by no more than
+        ``merge_gap_seconds`` become a single clip. A negative gap disables
+        merging; duplicate starts are always collapsed.
+        """
+        windows = []
+        for start in sorted(set(starts)):
+            end = start + clip_duration
+            if (
+                windows
+                and merge_gap_seconds is not None
+                and merge_gap_seconds >= 0
+                and start <= windows[-1][1] + merge_gap_seconds
+            ):
+                windows[-1] = (windows[-1][0], max(windows[-1][1], end))
+            else:
+                windows.append((start, end))
+        return windows
+
+    class _YdlLogger:
+        """Route YoutubeDL's messages into the worker log."""
+
+        def __init__(self, worker):
+            self.worker = worker
+
+        def debug(self, message):
+            if self.worker.log_ytdlp_output:
+                self.worker._log(f"[yt-dlp] {message}", color=self.worker.COLOR_MUTED, level="DEBUG")
+
+        def info(self, message):
+            self.debug(message)
+
+        def warning(self, message):
+            self.worker._log(f"[yt-dlp] {message}", color=self.worker.COLOR_WARNING, level="WARN")
+
+        def error(self, message):
+            self.worker._log(f"[yt-dlp] {message}", color=self.worker.COLOR_ERROR, level="ERROR")
+
+    def _get_ydl(self):
+        """Return this thread's YoutubeDL, creating it on first use.
+
+        YoutubeDL is not safe for concurrent downloads, so each download
+        thread keeps its own instance and reuses it (extractor cache,
+        cookies, HTTP connections) for every task it runs.
+        """
+        ydl = getattr(self._ydl_local, "ydl", None)
+        if ydl is None:
+            options = dict(self.ydl_opts_base)
+            options["logger"] = self._YdlLogger(self)
+            options["progress_hooks"] = [self._ydl_progress_hook]
+            ydl = self.ytdlp_module.YoutubeDL(options)
+            self._ydl_local.ydl = ydl
+            with self.lock:
+                self._ydl_instances.append(ydl)
+        return ydl
+
+    def _ydl_progress_hook(self, status):
+        if not self._is_running:
+            raise self.ytdlp_module.utils.DownloadCancelled("Download cancelled")
+        if status.get("status") not in ("downloading", "finished"):
+            return
+        self._update_download_progress(
+            getattr(self._ydl_local, "task_key", None),
+            status.get("filename"),
+            status.get("downloaded_bytes"),
+            status.get("total_bytes") or status.get("total_bytes_estimate"),
+            0 if status.get("status") == "finished" else status.get("speed"),
+        )
+
+    def _run_ytdlp_module(self, task_key, url, output_path, section=None):
+        ydl = self._get_ydl()
+        ydl.params["outtmpl"]["default"] = output_path.replace("%", "%%")
+        if section:
+            ydl.params["download_ranges"] = self.ytdlp_module.utils.download_range_func(None, [section])
+            ydl.params["force_keyframes_at_cuts"] = True
+        else:
+            ydl.params.pop("download_ranges", None)
+            ydl.params["force_keyframes_at_cuts"] = False
+        self._ydl_local.task_key = task_key
+        self._log(f"DEBUG: Downloading {url} in-process to {output_path}", level="DEBUG")
+        try:
+            return_code = ydl.download([url])
+        except self.ytdlp_module.utils.DownloadCancelled:
+            self._log(f"Download for {task_key} cancelled.", level="WARN", color=self.COLOR_WARNING)
+            raise InterruptedError("Download cancelled during execution")
+        finally:
+            self._ydl_local.task_key = None
+        if return_code:
+            raise RuntimeError(f"yt-dlp could not download {url}")
+
+    def _fetch(self, task_key, url, output_path, section=None):
+        """Download ``url`` (optionally only the ``(start, end)`` section) with the configured engine."""
+        if self.ytdlp_module is not None:
+            self._run_ytdlp_module(task_key, url, output_path, section)
+            return
+        extra_args = []
+        if section:
+            extra_args = ["--download-sections", f"*{section[0]}-{section[1]}", "--force-keyframes-at-cuts"]
+        self._run_ytdlp(task_key, url, output_path, extra_args)
+
+    def _close_ydl_instances(self):
+        with self.lock:
+            instances = list(self._ydl_instances)
+            self._ydl_instances.clear()
+        for ydl in instances:
+            close = getattr(ydl, "close", None)
+            if close:
+                try:
+                    close()
+                except Exception:
+                    pass
+
+    def _download_sources(self, video_id, windows, sources):
+        """Fetch what is needed to cut ``(start, end)`` windows from ``video_id``.
+
+        Appends one ``(source_path, offset)`` pair per window to ``sources``,
+        where ``offset`` is the clip start relative to the beginning of the
+        source file. Every path is pinned in the source cache before it is
+        appended, and the caller releases them once clipping is done. Files
+        already in the cache are reused without downloading.
+        """
+        url = f"https://youtu.be/{video_id}"
+
+        if self.download_mode != self.DOWNLOAD_MODE_SECTIONS:
+            video_path = self.source_cache.path_for(f"{video_id}.mp4")
+            cached = self.source_cache.acquire(video_path)
+            sources.extend((video_path, start) for start, _ in windows)
+            if cached:
+                self._log(f"Using cached download of {video_id}", color=self.COLOR_MUTED, level="DETAIL")
+                return
+            self._log(f"Downloading {video_id}", color=self.COLOR_INFO, level="INFO")
+            self._fetch(video_id, url, video_path)
+            return
+
+        for start, end in windows:
             if not self._is_running:
-                break
-            start_str = seconds_to_hhmmss(start)
-            end_str = seconds_to_hhmmss(start + self.clip_duration)
-            out_file = os.path.join(
-                clips_dir,
-                f"{video_id}_{start_str.replace(':','-')}-{end_str.replace(':','-')}.mp4",
+                raise InterruptedError("Download cancelled between sections")
+            range_start = max(0, start - self.SECTION_PADDING_SECONDS)
+            range_end = end + self.SECTION_PADDING_SECONDS
+            section_path = self.source_cache.path_for(
+                f"{video_id}_{range_start}-{range_end}.mp4"
             )
-            self.log_output.emit(
-                format_log(
-                    f"Clipping {video_id} {start_str}→{end_str}", color=self.COLOR_INFO, level="INFO"
+            cached = self.source_cache.acquire(section_path)
+            sources.append((section_path, start - range_start))
+            if cached:
+                self._log(
+                    f"Using cached section {seconds_to_hhmmss(range_start)}→{seconds_to_hhmmss(range_end)} of {video_id}",
+                    color=self.COLOR_MUTED, level="DETAIL"
                 )
+                continue
+            self._log(
+                f"Downloading {video_id} section {seconds_to_hhmmss(range_start)}→{seconds_to_hhmmss(range_end)}",
+                color=self.COLOR_INFO, level="INFO"
+            )
+            self._fetch(f"{video_id}@{range_start}", url, section_path, (range_start, range_end))
+
+    def _build_clip_command(self, segments):
+        """Build one ffmpeg command that writes every ``(source, offset, duration, codec_args, out_file)`` segment.
+
+        Each segment is a separately seeked input, so ffmpeg only demuxes and
+        decodes the few seconds it needs from each source.
+        """
+        command = [self.ffmpeg_executable, "-y", "-hide_banner", "-loglevel", "error"]
+        for source_path, offset, duration, _, _ in segments:
+            command += ["-ss", f"{offset:.3f}", "-t", f"{duration:.3f}", "-i", source_path]
+        # The outputs of one command encode side by side, so they share this
+        # process's thread budget; stream-copied pieces need no encoder threads.
+        encoded = sum(1 for segment in segments if segment[3] != self.SMART_CUT_COPY_ARGS)
+        output_threads = max(1, self.encode_threads // max(1, encoded))
+        for index, (_, _, _, codec_args, out_file) in enumerate(segments):
+            command += ["-map", f"{index}:v:0", "-map", f"{index}:a:0?"]
+            command += codec_args
+            if codec_args != self.SMART_CUT_COPY_ARGS:
+                command += ["-threads", str(output_threads)]
+            command.append(out_file)
+        return command
+
+    def _probe_source(self, source_path):
+        """Return the video stream's codec settings and keyframe times, or None if it cannot be probed.
+
+        Keyframe times come from packet flags, so only the container is read;
+        nothing is decoded. Times are relative to the start of the file, which
+        is what input ``-ss`` expects.
+        """
+        if not self.ffprobe_executable:
+            return None
+        creationflags = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+        try:
+            stream_info = subprocess.run(
+                [
+                    self.ffprobe_executable, "-v", "error",
+                    "-select_streams", "v:0",
+                    "-show_entries", "stream=codec_name,profile,level,pix_fmt,time_base:format=start_time",
+                    "-of", "default=noprint_wrappers=1",
+                    source_path,
+                ],
+                capture_output=True, text=True, check=True, creationflags=creationflags,
+            )
+            fields = dict(
+                line.split("=", 1) for line in stream_info.stdout.splitlines() if "=" in line
+            )
+            try:
+                start_time = float(fields.get("start_time", 0))
+            except ValueError:
+                start_time = 0.0
+
+            packets = subprocess.run(
+                [
+                    self.ffprobe_executable, "-v", "error",
+                    "-select_streams", "v:0",
+                    "-show_entries", "packet=pts_time,flags",
+                    "-of", "csv=p=0",
+                    source_path,
+                ],
+                capture_output=True, text=True, check=True, creationflags=creationflags,
             )
-            clip_proc = subprocess.run(
+        except (OSError, subprocess.CalledProcessError) as e:
+            self._log(f"Could not probe {os.path.basename(source_path)}: {e}", color=self.COLOR_WARNING, level="WARN")
+            return None
+
+        keyframes = []
+        for line in packets.stdout.splitlines():
+            pts_time, _, flags = line.partition(",")
+            if "K" not in flags:
+                continue
+            try:
+                keyframes.append(float(pts_time) - start_time)
+            except ValueError:
+                continue
+        keyframes.sort()
+        return {
+            "codec": fields.get("codec_name", ""),
+            "profile": fields.get("profile", ""),
+            "level": fields.get("level", ""),
+            "pix_fmt": fields.get("pix_fmt", ""),
+            "time_base": fields.get("time_base", ""),
+            "keyframes": keyframes,
+        }
+
+    def _smart_cut_edge_args(self, probe):
+        """Return encoder args whose output can be joined to a stream copy of the source, or None.
+
+        None means the source's stream parameters cannot be reproduced and the
+        clip should be re-encoded whole instead.
+        """
+        if probe["codec"] not in self.SMART_CUT_CODECS:
+            return None
+        x264_profile = self.SMART_CUT_PROFILES.get(probe["profile"])
+        try:
+            level = int(probe["level"])
+        except ValueError:
+            return None
+        if x264_profile is None or level <= 0 or not probe["pix_fmt"]:
+            return None
+        # ffprobe reports H.264 levels as level_idc (31 for 3.1, 9 for 1b).
+        level_name = "1b" if level == 9 else f"{level // 10}.{level % 10}"
+        return self.SMART_CUT_EDGE_ARGS + [
+            "-profile:v", x264_profile,
+            "-level", level_name,
+            "-pix_fmt", probe["pix_fmt"],
+        ]
+
+    @staticmethod
+    def _track_timescale(probe):
+        """Return the source's video time base denominator (e.g. 90000 for 1/90000), or None."""
+        _, _, denominator = probe["time_base"].partition("/")
+        return int(denominator) if denominator.isdigit() else None
+
+    @classmethod
+    def _plan_smart_cut(cls, keyframes, start, end):
+        """Split ``start``-``end`` into ``(seg_start, seg_end, copy)`` pieces on keyframe boundaries.
+
+        Returns None when the clip contains too little GOP-aligned interior to
+        be worth stream copying.
+        """
+        epsilon = 0.001
+        first_key = next((k for k in keyframes if k >= start - epsilon), None)
+        last_key = next((k for k in reversed(keyframes) if k <= end + epsilon), None)
+        if first_key is None or last_key is None:
+            return None
+        if last_key - first_key < cls.SMART_CUT_MIN_COPY_SECONDS:
+            return None
+
+        pieces = []
+        if first_key - start > epsilon:
+            pieces.append((start, first_key, False))
+        pieces.append((first_key, last_key, True))
+        if end - last_key > epsilon:
+            pieces.append((last_key, end, False))
+        return pieces
+
+    def _clip_profile(self, clip_mode):
+        """Describe the encode settings that shape a clip, for cache keys."""
+        profile = [clip_mode, *self.CLIP_ENCODE_ARGS]
+        if clip_mode == self.CLIP_MODE_SMART:
+            profile += self.SMART_CUT_EDGE_ARGS
+        return " ".join(profile)
+
+    def _clip_segments(self, job, probe, parts_dir):
+        """Return ``(segments, parts)`` for one clip job.
+
+        ``parts`` is None when the clip is written directly by a full
+        re-encode, otherwise it lists the .ts pieces that must be joined.
+        """
+        source_path = job["source"]
+        offset = job["offset"]
+        duration = job["duration"]
+        out_file = job["output"]
+        direct = [(source_path, offset, duration, self.CLIP_ENCODE_ARGS, out_file)]
+        if probe is None:
+            return direct, None
+
+        edge_args = self._smart_cut_edge_args(probe)
+        if edge_args is None:
+            return direct, None
+        pieces = self._plan_smart_cut(probe["keyframes"], offset, offset + duration)
+        if pieces is None:
+            return direct, None
+
+        stem = os.path.splitext(os.path.basename(out_file))[0]
+        segments = []
+        parts = []
+        for index, (seg_start, seg_end, copy) in enumerate(pieces):
+            part_path = os.path.join(parts_dir, f"{stem}.{index}.ts")
+            codec_args = self.SMART_CUT_COPY_ARGS if copy else edge_args
+            segments.append((source_path, seg_start, seg_end - seg_start, codec_args, part_path))
+            parts.append(part_path)
+        return segments, parts
+
+    def _join_parts(self, task_key, parts, out_file, timescale=None):
+        # The .ts parts all carry 90 kHz timestamps; the joined track gets the
+        # source's own timescale back so copied frames keep their exact times.
+        timescale_args = ["-video_track_timescale", str(timescale)] if timescale else []
+        list_path = os.path.splitext(parts[0])[0] + ".txt"
+        try:
+            with open(list_path, "w", encoding="utf-8") as f:
+                for part in parts:
+                    f.write(f"file '{os.path.abspath(part)}'\n")
+            self._run_ffmpeg(
+                task_key,
                 [
-                    self.ffmpeg_executable,
-                    "-y",
-                    "-ss",
-                    str(start),
-                    "-i",
-                    video_path,
-                    "-t",
-                    str(self.clip_duration),
-                    "-c:v",
-                    "libx264",           
-                    "-preset",
-                    "ultrafast",         
-                    "-crf",
-                    "23",                
-                    "-c:a",
-                    "aac",               
-                    "-b:a",
-                    "128k",
+                    self.ffmpeg_executable, "-y", "-hide_banner", "-loglevel", "error",
+                    "-f", "concat", "-safe", "0", "-i", list_path,
+                    "-c", "copy", "-bsf:a", "aac_adtstoasc",
+                    *timescale_args,
+                    "-movflags", "+faststart",
                     out_file,
-                    "-loglevel",
-                    "error",
-                    "-hide_banner",
                 ],
-                check=True,
-                capture_output=True,
-                text=True,
-                creationflags=(subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0),
             )
-            if clip_proc.stderr:
-                 self.log_output.emit(format_log(f"[ffmpeg clip stderr] {clip_proc.stderr.strip()}", color=self.COLOR_WARNING, level="WARN"))
+        finally:
+            for path in [list_path, *parts]:
+                try:
+                    if os.path.exists(path):
+                        os.remove(path)
+                except OSError:
+                    pass
+
+    def _run_ffmpeg(self, task_key, command):
+        self._log(f"CMD: {' '.join(command)}", color=self.COLOR_CMD, level="DEBUG")
+        proc = subprocess.Popen(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            creationflags=(subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0),
+        )
+        with self.lock:
+            if not self._is_running:
+                proc.terminate()
+                raise InterruptedError("Clipping cancelled before process start")
+            self.active_processes[task_key] = proc
+        try:
+            _, stderr = proc.communicate()
+        finally:
+            with self.lock:
+                self.active_processes.pop(task_key, None)
 
-            self.log_output.emit(
-                format_log(f"Saved clip: {os.path.basename(out_file)}", color=self.COLOR_SUCCESS, level="SUCCESS")
+        if not self._is_running:
+            raise InterruptedError("Clipping cancelled during execution")
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, command, stderr=stderr)
+        if stderr and stderr.strip():
+            self._log(f"[ffmpeg clip stderr] {stderr.strip()}", color=self.COLOR_WARNING, level="WARN")
+
+    def _release_sources(self, sources):
+        for source_path in {path for path, _ in sources}:
+            self.source_cache.release(source_path)
+        for removed in self.source_cache.evict():
+            self._log(f"Evicted cached video: {os.path.basename(removed)}", color=self.COLOR_MUTED, level="DEBUG")
+
+    def _download_task(self, video_id, windows):
+        """Download stage: reuse cached clips and fetch sources for the rest.
+
+        Returns ``(video_id, reused, jobs, sources)``; the sources stay pinned
+        in the cache until ``_encode_task`` (or the caller) releases them.
+        """
+        clips_dir = os.path.join(self.base_output_dir, "clips")
+        os.makedirs(clips_dir, exist_ok=True)
+
+        profile = self._clip_profile(self.clip_mode)
+        # Smart cut falls back to a full re-encode for clips it can't split,
+        # and those are cached under the re-encode profile.
+        reencode_profile = self._clip_profile(self.CLIP_MODE_REENCODE)
+        clipped = 0
+        jobs = []
+        for start, end in windows:
+            start_str = seconds_to_hhmmss(start)
+            end_str = seconds_to_hhmmss(end)
+            clip_path = os.path.join(
+                clips_dir,
+                f"{video_id}_{start_str.replace(':','-')}-{end_str.replace(':','-')}.mp4",
             )
-            clipped += 1
+            key = ClipCache.make_key(video_id, start, end - start, profile)
+            reencode_key = ClipCache.make_key(video_id, start, end - start, reencode_profile)
+            if self.clip_cache.restore(dict.fromkeys((key, reencode_key)), clip_path):
+                self._log(f"Reused cached clip: {os.path.basename(clip_path)}", color=self.COLOR_SUCCESS, level="SUCCESS")
+                clipped += 1
+                continue
+            jobs.append(
+                {
+                    "window": (start, end),
+                    "duration": end - start,
+                    "label": f"{start_str}→{end_str}",
+                    "key": key,
+                    "reencode_key": reencode_key,
+                    "output": self.clip_cache.partial_path_for(key),
+                    "clip_path": clip_path,
+                }
+            )
+        if not jobs:
+            return video_id, clipped, jobs, []
 
+        sources = []
         try:
-            if os.path.exists(video_path):
-                os.remove(video_path)
-                self.log_output.emit(format_log(f"Removed temporary video: {os.path.basename(video_path)}", color=self.COLOR_MUTED, level="DEBUG"))
-        except Exception as e:
-            self.log_output.emit(format_log(f"Warning: Could not remove temp video {video_path}: {e}", color=self.COLOR_WARNING, level="WARN"))
+            self._download_sources(video_id, [job["window"] for job in jobs], sources)
+        except BaseException:
+            self._release_sources(sources)
+            raise
+        for job, (source_path, offset) in zip(jobs, sources):
+            job["source"] = source_path
+            job["offset"] = offset
+        return video_id, clipped, jobs, sources
+
+    def _encode_task(self, video_id, jobs, sources):
+        """Encode stage: cut every job from its downloaded source."""
+        video_dir = os.path.join(self.base_output_dir, "videos")
+        parts_dir = os.path.join(video_dir, f"{video_id}_parts")
+        clipped = 0
+        try:
+            probes = {}
+            if self.clip_mode == self.CLIP_MODE_SMART:
+                for source_path in dict.fromkeys(path for path, _ in sources):
+                    probes[source_path] = self._probe_source(source_path)
+                os.makedirs(parts_dir, exist_ok=True)
+
+            batch_size = self.CLIP_BATCH_SIZE if self.batch_clips else 1
+            for i in range(0, len(jobs), batch_size):
+                if not self._is_running:
+                    break
+                batch = jobs[i : i + batch_size]
+                self._log(
+                    f"Clipping {video_id} {', '.join(job['label'] for job in batch)}",
+                    color=self.COLOR_INFO, level="INFO"
+                )
+                segments = []
+                joins = []
+                for job in batch:
+                    job_segments, parts = self._clip_segments(job, probes.get(job["source"]), parts_dir)
+                    segments += job_segments
+                    if parts:
+                        timescale = self._track_timescale(probes[job["source"]])
+                        joins.append((parts, job["output"], timescale))
+                        job["cache_key"] = job["key"]
+                    else:
+                        job["cache_key"] = job["reencode_key"]
+                if joins:
+                    self._log(
+                        f"Smart cut: stream-copying {len(joins)}/{len(batch)} clip(s) of {video_id}",
+                        color=self.COLOR_MUTED, level="DEBUG"
+                    )
+                self._run_ffmpeg(f"{video_id}#clip{i}", self._build_clip_command(segments))
+                for parts, out_file, timescale in joins:
+                    self._join_parts(f"{video_id}#join{i}", parts, out_file, timescale)
+                for job in batch:
+                    self.clip_cache.commit(job["key"], job["cache_key"])
+                    self.clip_cache.materialize(job["cache_key"], job["clip_path"])
+                    self._log(f"Saved clip: {os.path.basename(job['clip_path'])}", color=self.COLOR_SUCCESS, level="SUCCESS")
+                clipped += len(batch)
+                self._record_clips_done(len(batch))
+        finally:
+            for job in jobs:
+                try:
+                    self.clip_cache.discard(job["key"])
+                except OSError:
+                    pass
+            self._release_sources(sources)
+            for removed in self.clip_cache.evict():
+                self._log(f"Evicted cached clip: {os.path.basename(removed)}", color=self.COLOR_MUTED, level="DEBUG")
+            if os.path.isdir(parts_dir):
+                shutil.rmtree(parts_dir, ignore_errors=True)
 
         return video_id, clipped
 
     def run(self):
         run_start = datetime.now()
-        self.log_output.emit(
-            format_log("Clip Downloader started.", color=self.COLOR_INFO, bold=True, level="INFO")
-        )
+        self._log("Clip Downloader started.", color=self.COLOR_INFO, bold=True, level="INFO")
         clips_found = 0
         clips_downloaded = 0
         clips_failed = 0
@@ -700,6 +1231,8 @@ class ClipDownloaderWorker(QObject):
             os.makedirs(self.base_output_dir, exist_ok=True)
             os.makedirs(os.path.join(self.base_output_dir, "videos"), exist_ok=True)
             os.makedirs(os.path.join(self.base_output_dir, "clips"), exist_ok=True)
+            self.clip_cache = ClipCache(self.cache_dir)
+            self.source_cache = SourceVideoCache(self.cache_dir, self.source_cache_bytes)
         except Exception as e:
             self.error.emit(
                 format_log(
@@ -736,46 +1269,65 @@ class ClipDownloaderWorker(QObject):
                 }
             )
 
-        clips_found = len(tasks_to_run)
-        if clips_found == 0:
-            self.log_output.emit(
-                format_log(
-                    "No valid timestamp links found in viewer content.",
-                    color=self.COLOR_WARNING, level="WARN"
-                )
+        if not tasks_to_run:
+            self._log(
+                "No valid timestamp links found in viewer content.",
+                color=self.COLOR_WARNING, level="WARN"
             )
             self.finished.emit(False, "No clips found")
             return
 
-        self.log_output.emit(
-            format_log(
-                f"Found {clips_found} clips from {len(unique_video_ids)} unique video(s). Starting up to {self.MAX_CONCURRENT_DOWNLOADS} parallel downloads...",
-                color=self.COLOR_INFO, level="INFO"
+        starts_by_video = {}
+        for t in tasks_to_run:
+            starts_by_video.setdefault(t["video_id"], []).append(t["start_seconds"])
+        videos = {
+            vid: self.plan_clip_windows(starts, self.clip_duration, self.merge_gap_seconds)
+            for vid, starts in starts_by_video.items()
+        }
+        clips_found = sum(len(windows) for windows in videos.values())
+        with self.lock:
+            self._clips_total = clips_found
+            self._clips_done = 0
+            self._download_progress.clear()
+        self._emit_progress(force=True)
+        if clips_found < len(tasks_to_run):
+            self._log(
+                f"Merged {len(tasks_to_run)} timestamps into {clips_found} clips (gap ≤ {self.merge_gap_seconds}s).",
+                color=self.COLOR_MUTED, level="INFO"
             )
+
+        self._log(
+            f"Found {clips_found} clips from {len(unique_video_ids)} unique video(s). Starting up to {self.MAX_CONCURRENT_DOWNLOADS} parallel downloads and {self.MAX_CONCURRENT_ENCODES} encodes ({self.encode_threads} threads each)...",
+            color=self.COLOR_INFO, level="INFO"
         )
-        self.log_output.emit(
-            format_log(
-                f"Note: Download speed depends on network, disk I/O, and potential merging time per clip.",
-                color=self.COLOR_MUTED, level="DEBUG"
-            )
+        self._log(
+            f"yt-dlp engine: {'in-process module' if self.ytdlp_module is not None else self.ytdlp_executable}",
+            color=self.COLOR_MUTED, level="DETAIL"
+        )
+        self._log(
+            f"Note: Download speed depends on network, disk I/O, and potential merging time per clip.",
+            color=self.COLOR_MUTED, level="DEBUG"
         )
 
         with self.lock:
             self.active_processes.clear()
-        self.executor = None
+        self.download_executor = None
+        self.encode_executor = None
 
         try:
-            self.executor = concurrent.futures.ThreadPoolExecutor(
+            self.download_executor = concurrent.futures.ThreadPoolExecutor(
                 max_workers=self.MAX_CONCURRENT_DOWNLOADS
             )
+            self.encode_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.MAX_CONCURRENT_ENCODES
+            )
 
-            videos = {}
-            for t in tasks_to_run:
-                videos.setdefault(t["video_id"], []).append(t["start_seconds"])
-
+            # future -> (stage, video_id, clips riding on it, pinned sources)
             future_map = {
-                self.executor.submit(self._download_and_clip_task, vid, starts): vid
-                for vid, starts in videos.items()
+                self.download_executor.submit(self._download_task, vid, windows): (
+                    "download", vid, len(windows), []
+                )
+                for vid, windows in videos.items()
             }
             pending = set(future_map)
 
@@ -784,61 +1336,93 @@ class ClipDownloaderWorker(QObject):
                     pending, timeout=0.5, return_when=FIRST_COMPLETED
                 )
                 for fut in done:
-                    vid = future_map[fut]
+                    stage, vid, task_clips, pinned = future_map.pop(fut)
                     try:
+                        if stage == "download":
+                            _, reused, jobs, sources = fut.result()
+                            clips_downloaded += reused
+                            self._record_clips_done(reused)
+                            if jobs and not self._is_running:
+                                # Stopped while downloading; the encode pool is gone.
+                                self._release_sources(sources)
+                                clips_failed += len(jobs)
+                            elif jobs:
+                                self._log(
+                                    f"Queued {len(jobs)} clips of {vid} for encoding",
+                                    color=self.COLOR_MUTED, level="DETAIL"
+                                )
+                                try:
+                                    encode_future = self.encode_executor.submit(
+                                        self._encode_task, vid, jobs, sources
+                                    )
+                                except RuntimeError:
+                                    # stop() shut the pool down after the check above.
+                                    self._release_sources(sources)
+                                    clips_failed += len(jobs)
+                                    continue
+                                future_map[encode_future] = ("encode", vid, len(jobs), sources)
+                                pending.add(encode_future)
+                            else:
+                                self._log(
+                                    f"Completed {reused} clips for {vid}",
+                                    color=self.COLOR_SUCCESS, level="SUCCESS"
+                                )
+                            continue
                         _, count = fut.result()
                         clips_downloaded += count
-                        self.log_output.emit(
-                            format_log(
-                                f"Completed {count} clips for {vid}",
-                                color=self.COLOR_SUCCESS, level="SUCCESS"
-                            )
+                        self._log(
+                            f"Completed {count} clips for {vid}",
+                            color=self.COLOR_SUCCESS, level="SUCCESS"
                         )
+                    except concurrent.futures.CancelledError:
+                        # Cancelled by stop() before it started: _encode_task
+                        # never ran, so its sources are still pinned.
+                        clips_failed += task_clips
+                        if stage == "encode":
+                            self._release_sources(pinned)
                     except Exception as e:
-                        failed_count = len(videos.get(vid, []))
+                        failed_count = task_clips
                         clips_failed += failed_count
-                        self.log_output.emit(
-                            format_log(
-                                f"Error processing {vid} (failed {failed_count} clips): {e}", color=self.COLOR_ERROR, level="ERROR"
-                            )
+                        self._log(
+                            f"Error processing {vid} (failed {failed_count} clips): {e}", color=self.COLOR_ERROR, level="ERROR"
                         )
                         if isinstance(e, subprocess.CalledProcessError):
                             if e.stdout:
-                                self.log_output.emit(format_log(f"--> stdout: {e.stdout.strip()}", color=self.COLOR_ERROR, level="ERROR"))
+                                self._log(f"--> stdout: {e.stdout.strip()}", color=self.COLOR_ERROR, level="ERROR")
                             if e.stderr:
-                                self.log_output.emit(format_log(f"--> stderr: {e.stderr.strip()}", color=self.COLOR_ERROR, level="ERROR"))
+                                self._log(f"--> stderr: {e.stderr.strip()}", color=self.COLOR_ERROR, level="ERROR")
 
             if not self._is_running and pending:
                 cancelled_count = 0
                 for fut in pending:
-                    vid = future_map[fut]
-                    cancelled_count += len(videos.get(vid, []))
-                    fut.cancel()
+                    stage, _, task_clips, sources = future_map[fut]
+                    cancelled_count += task_clips
+                    if fut.cancel() and stage == "encode":
+                        self._release_sources(sources)
                 clips_failed += cancelled_count
                 pending.clear()
-                self.log_output.emit(
-                    format_log(
-                        f"Cancelled {cancelled_count} pending clip tasks.",
-                        color=self.COLOR_WARNING, level="WARN"
-                    )
+                self._log(
+                    f"Cancelled {cancelled_count} pending clip tasks.",
+                    color=self.COLOR_WARNING, level="WARN"
                 )
 
         except Exception as e:
-            self.log_output.emit(
-                format_log(
-                    f"Error during download task management: {e}",
-                    color=self.COLOR_ERROR,
-                    bold=True, level="ERROR"
-                )
+            self._log(
+                f"Error during download task management: {e}",
+                color=self.COLOR_ERROR,
+                bold=True, level="ERROR"
             )
             remaining_clips = clips_found - clips_downloaded - clips_failed
             clips_failed += remaining_clips
             self._is_running = False
 
         finally:
-            if self.executor:
-                self.executor.shutdown(wait=False)
-                self.executor = None
+            for executor in (self.download_executor, self.encode_executor):
+                if executor:
+                    executor.shutdown(wait=False)
+            self.download_executor = None
+            self.encode_executor = None
+            self._close_ydl_instances()
 
             total_run_duration = (datetime.now() - run_start).total_seconds()
 
@@ -856,18 +1440,17 @@ class ClipDownloaderWorker(QObject):
                 log_color = self.COLOR_SUCCESS if success_flag else self.COLOR_WARNING
                 log_level = "SUCCESS" if success_flag else "WARN"
 
-            self.log_output.emit(
-                format_log(
-                    f"{final_message} (Total Time: {total_run_duration:.2f}s)",
-                    color=log_color,
-                    bold=True, level=log_level
-                )
+            self._log(
+                f"{final_message} (Total Time: {total_run_duration:.2f}s)",
+                color=log_color,
+                bold=True, level=log_level
             )
             self.finished.emit(success_flag, final_message)
 
-class RenderWorker(QObject):
-    log_output = Signal(str)
-    progress_update = Signal(int)
+class RenderWorker(LoggingWorker):
+    log_output = Signal(object)
+    # percent, plus a short "speed · ETA" description (may be empty)
+    progress_update = Signal(int, str)
     finished = Signal(bool, str)
     error = Signal(str)
     COLOR_DEFAULT = "#aaaaaa"
@@ -878,74 +1461,440 @@ class RenderWorker(QObject):
     COLOR_CMD = "lightblue"
     COLOR_MUTED = "#888888"
 
-    def __init__(self, clips_folder, output_path, ffmpeg_path):
+    RENDER_MODE_AUTO = "auto"
+    RENDER_MODE_REENCODE = "reencode"
+    RENDER_ENCODE_ARGS = [
+        "-c:v", "libx264",
+        "-preset", "medium",
+        "-crf", "23",
+        "-c:a", "aac",
+        "-b:a", "128k",
+    ]
+    # Mismatched clips are normalized with the clip downloader's own settings
+    # so they sit next to its output in a stream-copy concat.
+    NORMALIZE_ENCODE_ARGS = ClipDownloaderWorker.CLIP_ENCODE_ARGS
+    MAX_PROBE_WORKERS = 8
+    # Chunks get at least this many cores each; fewer clips than this per
+    # chunk are not worth a separate process.
+    CORES_PER_CHUNK = 4
+    MIN_CLIPS_PER_CHUNK = 4
+    # Share of the progress bar taken by the parallel chunk encodes; the
+    # stream-copy join that follows them gets the rest.
+    CHUNK_STAGE_WEIGHT = 0.95
+
+    _progress_line_regex = re.compile(r"^(\w+)=(.*)$")
+    # Probe results survive between renders, keyed by path, mtime and size.
+    _probe_cache = {}
+    _probe_cache_lock = threading.Lock()
+
+    def __init__(
+        self,
+        clips_folder,
+        output_path,
+        ffmpeg_path,
+        ffprobe_path=None,
+        render_mode=RENDER_MODE_AUTO,
+        parallel_chunks=True,
+    ):
         super().__init__()
         self.clips_folder = clips_folder
         self.output_path = output_path
+        self.render_mode = render_mode
+        self.parallel_chunks = parallel_chunks
         self._is_running = True
         self.process = None
+        self.lock = threading.Lock()
+        self.chunk_processes = []
+        self.total_duration = None
+        self._stage = (0.0, 1.0)
+        self._stage_progress = {}
+        self._start_time = None
         self.ffmpeg_executable = ffmpeg_path
+        self.ffprobe_executable = ffprobe_path
 
     def stop(self):
         if not self._is_running:
             return
-        self.log_output.emit(
-            format_log(
-                "Stop request received by render worker.",
-                color=self.COLOR_WARNING,
-                bold=True, level="WARN"
-            )
+        self._log(
+            "Stop request received by render worker.",
+            color=self.COLOR_WARNING,
+            bold=True, level="WARN"
         )
         self._is_running = False
+        with self.lock:
+            chunk_processes = list(self.chunk_processes)
+        for process in chunk_processes:
+            if process.poll() is None:
+                self._log(f"Terminating chunk encode {process.pid}...", color=self.COLOR_WARNING, level="WARN")
+                try:
+                    process.terminate()
+                except Exception as e:
+                    self._log(f"Error stopping chunk encode {process.pid}: {e}", color=self.COLOR_ERROR, level="ERROR")
         if self.process and self.process.poll() is None:
             pid = self.process.pid
-            self.log_output.emit(
-                format_log(
-                    f"Terminating ffmpeg process {pid}...", color=self.COLOR_WARNING, level="WARN"
-                )
+            self._log(
+                f"Terminating ffmpeg process {pid}...", color=self.COLOR_WARNING, level="WARN"
             )
             try:
                 self.process.terminate()
                 try:
                     self.process.wait(timeout=2)
-                    self.log_output.emit(
-                        format_log(
-                            f"ffmpeg process {pid} terminated gracefully.",
-                            color=self.COLOR_WARNING, level="WARN"
-                        )
+                    self._log(
+                        f"ffmpeg process {pid} terminated gracefully.",
+                        color=self.COLOR_WARNING, level="WARN"
                     )
                 except subprocess.TimeoutExpired:
-                    self.log_output.emit(
-                        format_log(
-                            f"ffmpeg process {pid} did not terminate, killing...",
-                            color=self.COLOR_ERROR, level="ERROR"
-                        )
+                    self._log(
+                        f"ffmpeg process {pid} did not terminate, killing...",
+                        color=self.COLOR_ERROR, level="ERROR"
                     )
                     self.process.kill()
                     self.process.wait(timeout=1)
-                    self.log_output.emit(
-                        format_log(
-                            f"ffmpeg process {pid} killed.", color=self.COLOR_ERROR, level="ERROR"
-                        )
+                    self._log(
+                        f"ffmpeg process {pid} killed.", color=self.COLOR_ERROR, level="ERROR"
                     )
             except Exception as e:
-                self.log_output.emit(
-                    format_log(
-                        f"Error trying to stop ffmpeg process {pid}: {e}",
-                        color=self.COLOR_ERROR, level="ERROR"
-                    )
+                self._log(
+                    f"Error trying to stop ffmpeg process {pid}: {e}",
+                    color=self.COLOR_ERROR, level="ERROR"
                 )
         else:
-            self.log_output.emit(
-                format_log(
-                    "No active ffmpeg process found to stop.", color=self.COLOR_MUTED, level="DEBUG"
-                )
+            self._log(
+                "No active ffmpeg process found to stop.", color=self.COLOR_MUTED, level="DEBUG"
             )
 
-    def run(self):
-        self.log_output.emit(
-            format_log("Render Worker started.", color=self.COLOR_INFO, bold=True, level="INFO")
+    def _probe_clip(self, clip_path):
+        """Return ``{"signature", "duration"}`` for a clip.
+
+        ``signature`` holds the stream parameters that must match for a
+        stream-copy concat, or None if the clip has no video.
+        """
+        stat = os.stat(clip_path)
+        cache_key = (clip_path, stat.st_mtime_ns, stat.st_size)
+        with self._probe_cache_lock:
+            cached = self._probe_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = subprocess.run(
+            [
+                self.ffprobe_executable, "-v", "error",
+                "-show_entries",
+                "stream=codec_type,codec_name,profile,width,height,pix_fmt,r_frame_rate,sample_rate,channels"
+                ":format=duration",
+                "-of", "json",
+                clip_path,
+            ],
+            capture_output=True, text=True, check=True,
+            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
         )
+        info = json.loads(result.stdout or "{}")
+        streams = info.get("streams", [])
+        video = next((st for st in streams if st.get("codec_type") == "video"), None)
+        audio = next((st for st in streams if st.get("codec_type") == "audio"), None)
+        signature = None
+        if video is not None:
+            signature = (
+                tuple(video.get(k) for k in ("codec_name", "profile", "width", "height", "pix_fmt", "r_frame_rate")),
+                tuple(audio.get(k) for k in ("codec_name", "sample_rate", "channels")) if audio else None,
+            )
+        try:
+            duration = float(info.get("format", {}).get("duration"))
+        except (TypeError, ValueError):
+            duration = None
+
+        probe = {"signature": signature, "duration": duration}
+        with self._probe_cache_lock:
+            self._probe_cache[cache_key] = probe
+        return probe
+
+    def _probe_clips(self, clip_paths):
+        probes = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.MAX_PROBE_WORKERS) as executor:
+            future_map = {executor.submit(self._probe_clip, path): path for path in clip_paths}
+            for fut in concurrent.futures.as_completed(future_map):
+                path = future_map[fut]
+                try:
+                    probes[path] = fut.result()
+                except Exception as e:
+                    self._log(f"Could not probe {os.path.basename(path)}: {e}", color=self.COLOR_WARNING, level="WARN")
+                    probes[path] = None
+        return probes
+
+    def _begin_stage(self, base, weight):
+        with self.lock:
+            self._stage = (base, weight)
+            self._stage_progress = {}
+
+    def _report_progress(self, key, out_seconds, speed, ended):
+        """Fold one process's ``-progress`` update into the overall percent and ETA."""
+        with self.lock:
+            self._stage_progress[key] = (out_seconds, 0.0 if ended else speed)
+            done = sum(seconds for seconds, _ in self._stage_progress.values())
+            total_speed = sum(rate for _, rate in self._stage_progress.values())
+            base, weight = self._stage
+
+        details = []
+        if total_speed > 0:
+            details.append(f"{total_speed:.1f}x")
+        if self.total_duration:
+            fraction = min(1.0, done / self.total_duration)
+            percent = int(100 * (base + weight * fraction))
+            if total_speed > 0:
+                remaining = (self.total_duration - done) / total_speed
+                details.append(f"ETA {seconds_to_hhmmss(int(remaining))}")
+        else:
+            # Without clip durations only elapsed time is known.
+            elapsed = (datetime.now() - self._start_time).total_seconds() if self._start_time else 0
+            percent = min(90, 10 + int(elapsed))
+            details.append(f"{seconds_to_hhmmss(int(done))} encoded")
+        self.progress_update.emit(min(99, percent), " · ".join(details))
+
+    def _consume_ffmpeg_output(self, process, key, output_lines):
+        """Read ``-progress pipe:1`` blocks and ordinary log lines from ``process``."""
+        fields = {}
+        for line in iter(process.stdout.readline, ""):
+            stripped_line = line.strip()
+            if not stripped_line:
+                continue
+            match = self._progress_line_regex.match(stripped_line)
+            if not match:
+                output_lines.append(stripped_line)
+                self._log(f"[ffmpeg] {stripped_line}", color=self.COLOR_MUTED, level="DEBUG")
+                continue
+            name, value = match.groups()
+            fields[name] = value
+            if name != "progress":
+                continue
+            try:
+                out_seconds = int(fields.get("out_time_us", "0")) / 1_000_000
+            except ValueError:
+                out_seconds = 0.0
+            try:
+                speed = float(fields.get("speed", "0").rstrip("x"))
+            except ValueError:
+                speed = 0.0
+            self._report_progress(key, max(0.0, out_seconds), speed, value == "end")
+            fields = {}
+
+    def _run_quiet(self, command):
+        """Run an auxiliary ffmpeg command as the current (cancellable) process."""
+        self._log(f"CMD: {' '.join(command)}", color=self.COLOR_CMD, level="DEBUG")
+        self.process = subprocess.Popen(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+        )
+        try:
+            _, stderr = self.process.communicate()
+            return_code = self.process.returncode
+        finally:
+            self.process = None
+        if not self._is_running:
+            raise InterruptedError("Render cancelled")
+        if return_code != 0:
+            raise subprocess.CalledProcessError(return_code, command, stderr=stderr)
+
+    @staticmethod
+    def _conform_args(reference):
+        """Output options that bring any clip to the ``reference`` signature's format."""
+        (_, _, width, height, pix_fmt, frame_rate), audio = reference
+        args = [
+            "-vf",
+            f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1,fps={frame_rate}",
+            "-pix_fmt", pix_fmt,
+        ]
+        if audio:
+            args += ["-ar", str(audio[1]), "-ac", str(audio[2])]
+        return args
+
+    def _normalize_clip(self, clip_path, out_path, reference, has_audio):
+        audio = reference[1]
+        command = [self.ffmpeg_executable, "-y", "-hide_banner", "-loglevel", "error", "-i", clip_path]
+        if audio and not has_audio:
+            _, sample_rate, channels = audio
+            layout = "mono" if channels == 1 else "stereo"
+            command += ["-f", "lavfi", "-i", f"anullsrc=r={sample_rate}:cl={layout}", "-shortest"]
+            command += ["-map", "0:v:0", "-map", "1:a:0"]
+        elif audio:
+            command += ["-map", "0:v:0", "-map", "0:a:0?"]
+        else:
+            # The reference clips are silent, so this one must be too.
+            command += ["-map", "0:v:0", "-an"]
+        command += self.NORMALIZE_ENCODE_ARGS
+        command += self._conform_args(reference)
+        command.append(out_path)
+        self._run_quiet(command)
+
+    def _prepare_copy_concat(self, clip_paths, probes, normalize_dir):
+        """Return ``(paths, copy_ok)`` for a stream-copy concat of ``clip_paths``.
+
+        Clips whose parameters differ from the most common ones are
+        re-encoded into ``normalize_dir``; ``copy_ok`` is False when the
+        majority format cannot be reproduced and a full re-encode is needed.
+        """
+        signatures = {
+            path: probe["signature"] if probe else None for path, probe in probes.items()
+        }
+        counts = Counter(sig for sig in signatures.values() if sig is not None)
+        if not counts:
+            return clip_paths, False
+        reference, _ = counts.most_common(1)[0]
+        video, audio = reference
+        if video[0] != "h264" or (audio is not None and audio[0] != "aac"):
+            self._log(
+                f"Clips use {video[0]}/{audio[0] if audio else 'no audio'}; falling back to re-encode.",
+                color=self.COLOR_MUTED, level="DEBUG"
+            )
+            return clip_paths, False
+
+        mismatched = [path for path in clip_paths if signatures.get(path) != reference]
+        if not mismatched:
+            self._log("All clips share codec parameters; joining with stream copy.", color=self.COLOR_INFO, level="INFO")
+            return clip_paths, True
+
+        self._log(
+            f"{len(clip_paths) - len(mismatched)}/{len(clip_paths)} clips match; re-encoding {len(mismatched)} mismatched clip(s) before stream copy.",
+            color=self.COLOR_INFO, level="INFO"
+        )
+        os.makedirs(normalize_dir, exist_ok=True)
+        replacements = {}
+        for index, path in enumerate(mismatched):
+            if not self._is_running:
+                raise InterruptedError("Render cancelled")
+            out_path = os.path.join(normalize_dir, f"{index:05d}.mp4")
+            signature = signatures.get(path)
+            has_audio = signature is None or signature[1] is not None
+            self._log(f"Normalizing {os.path.basename(path)}", color=self.COLOR_MUTED, level="DETAIL")
+            self._normalize_clip(path, out_path, reference, has_audio)
+            replacements[path] = out_path
+        return [replacements.get(path, path) for path in clip_paths], True
+
+    @staticmethod
+    def _write_concat_list(list_path, clip_paths):
+        with open(list_path, "w", encoding="utf-8") as f:
+            for abs_clip_path in clip_paths:
+                sanitized_path = abs_clip_path.replace("'", "'\\''")
+                f.write(f"file '{sanitized_path}'\n")
+
+    def _plan_chunks(self, clip_count):
+        cpu_count = os.cpu_count() or 1
+        chunk_count = min(
+            max(1, cpu_count // self.CORES_PER_CHUNK),
+            clip_count // self.MIN_CLIPS_PER_CHUNK,
+        )
+        return max(1, chunk_count), max(1, cpu_count // max(1, chunk_count))
+
+    def _chunk_target(self, clip_paths, probes):
+        """The signature every parallel chunk is encoded to, or None if chunks can't be made uniform.
+
+        Chunks are joined with stream copy, so each must come out with the
+        same resolution, frame rate, pixel format and audio layout whatever
+        clips it happens to start with.
+        """
+        signatures = [
+            probes[path]["signature"] if probes.get(path) else None for path in clip_paths
+        ]
+        if not signatures or None in signatures:
+            return None
+        target = Counter(signatures).most_common(1)[0][0]
+        (_, _, width, height, pix_fmt, frame_rate), audio = target
+        if not (width and height and pix_fmt) or frame_rate in (None, "0/0"):
+            return None
+        if audio is not None and (None in audio or any(sig[1] is None for sig in signatures)):
+            # A chunk of silent clips would have no audio stream to join.
+            return None
+        return target
+
+    def _encode_chunk(self, index, clip_paths, chunk_dir, threads, target):
+        list_path = os.path.join(chunk_dir, f"chunk_{index:03d}.txt")
+        out_path = os.path.join(chunk_dir, f"chunk_{index:03d}.mp4")
+        self._write_concat_list(list_path, clip_paths)
+        command = [
+            self.ffmpeg_executable, "-y", "-hide_banner", "-loglevel", "error",
+            "-f", "concat", "-safe", "0", "-i", list_path,
+            "-map", "0:v:0",
+            *(["-map", "0:a:0"] if target[1] else ["-an"]),
+            *self.RENDER_ENCODE_ARGS,
+            *self._conform_args(target),
+            "-threads", str(threads),
+            "-progress", "pipe:1", "-nostats",
+            out_path,
+        ]
+        self._log(f"CMD: {' '.join(command)}", color=self.COLOR_CMD, level="DEBUG")
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+        )
+        with self.lock:
+            if not self._is_running:
+                process.terminate()
+            self.chunk_processes.append(process)
+        output_lines = []
+        try:
+            self._consume_ffmpeg_output(process, f"chunk{index}", output_lines)
+            process.wait()
+        finally:
+            with self.lock:
+                self.chunk_processes.remove(process)
+        if not self._is_running:
+            raise InterruptedError("Render cancelled")
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(
+                process.returncode, command, stderr="\n".join(output_lines)
+            )
+        return out_path
+
+    def _render_chunks(self, clip_paths, chunk_dir, target):
+        """Re-encode ``clip_paths`` as parallel, ordered chunks; returns the chunk files.
+
+        The chunks share encoder settings and are all conformed to ``target``,
+        so they can be joined losslessly with a stream-copy concat afterwards.
+        """
+        chunk_count, threads = self._plan_chunks(len(clip_paths))
+        size, remainder = divmod(len(clip_paths), chunk_count)
+        chunks = []
+        start = 0
+        for index in range(chunk_count):
+            end = start + size + (1 if index < remainder else 0)
+            chunks.append(clip_paths[start:end])
+            start = end
+
+        self._log(
+            f"Encoding {len(clip_paths)} clips as {chunk_count} parallel chunks ({threads} threads each)...",
+            color=self.COLOR_INFO, level="INFO"
+        )
+        os.makedirs(chunk_dir, exist_ok=True)
+        self._begin_stage(0.0, self.CHUNK_STAGE_WEIGHT)
+        outputs = [None] * chunk_count
+        with concurrent.futures.ThreadPoolExecutor(max_workers=chunk_count) as executor:
+            future_map = {
+                executor.submit(self._encode_chunk, index, paths, chunk_dir, threads, target): index
+                for index, paths in enumerate(chunks)
+            }
+            done_count = 0
+            for fut in concurrent.futures.as_completed(future_map):
+                index = future_map[fut]
+                outputs[index] = fut.result()
+                done_count += 1
+                self._log(
+                    f"Chunk {index + 1}/{chunk_count} encoded ({done_count}/{chunk_count} done).",
+                    color=self.COLOR_MUTED, level="DETAIL"
+                )
+        return outputs
+
+    def run(self):
+        self._log("Render Worker started.", color=self.COLOR_INFO, bold=True, level="INFO")
 
         try:
             clip_files_unsorted = [
@@ -989,19 +1938,15 @@ class RenderWorker(QObject):
                 )
                 self.finished.emit(False, "No clips found.")
                 return
-            self.log_output.emit(
-                format_log(
-                    f"Found and sorted {len(clip_files)} .mp4 clips.",
-                    color=self.COLOR_INFO, level="INFO"
-                )
+            self._log(
+                f"Found and sorted {len(clip_files)} .mp4 clips.",
+                color=self.COLOR_INFO, level="INFO"
             )
             log_limit = min(5, len(clip_files))
             for i in range(log_limit):
-                self.log_output.emit(
-                    format_log(f"  Clip {i+1}: {clip_files[i]}", color=self.COLOR_MUTED, level="DEBUG")
-                )
+                self._log(f"  Clip {i+1}: {clip_files[i]}", color=self.COLOR_MUTED, level="DEBUG")
             if len(clip_files) > log_limit:
-                self.log_output.emit(format_log(f"  ...", color=self.COLOR_MUTED, level="DEBUG"))
+                self._log(f"  ...", color=self.COLOR_MUTED, level="DEBUG")
 
         except Exception as e:
             self.error.emit(
@@ -1018,21 +1963,89 @@ class RenderWorker(QObject):
             self.finished.emit(False, "Cancelled")
             return
 
+        clip_paths = [
+            os.path.abspath(os.path.join(self.clips_folder, clip_file))
+            for clip_file in clip_files
+        ]
+        # Scratch space next to the output, unique per render so nothing of
+        # the user's is ever removed with it.
+        try:
+            work_dir = tempfile.mkdtemp(prefix="capscript_render_", dir=os.path.dirname(self.output_path) or None)
+        except OSError as e:
+            self.error.emit(
+                format_log(
+                    f"Error creating a temporary folder next to the output: {e}",
+                    color=self.COLOR_ERROR,
+                    bold=True, level="ERROR"
+                )
+            )
+            self.finished.emit(False, "Error creating temporary folder.")
+            return
+        normalize_dir = os.path.join(work_dir, "normalized")
+        chunk_dir = os.path.join(work_dir, "chunks")
+        self._start_time = datetime.now()
+        self.progress_update.emit(0, "Probing clips...")
+
+        probes = {}
+        if self.ffprobe_executable:
+            probes = self._probe_clips(clip_paths)
+            durations = [probe["duration"] if probe else None for probe in probes.values()]
+            if durations and None not in durations:
+                self.total_duration = sum(durations)
+                self._log(
+                    f"Total clip duration: {seconds_to_hhmmss(int(self.total_duration))}",
+                    color=self.COLOR_MUTED, level="DETAIL"
+                )
+
+        copy_concat = False
+        if self.render_mode == self.RENDER_MODE_AUTO and self.ffprobe_executable:
+            try:
+                clip_paths, copy_concat = self._prepare_copy_concat(clip_paths, probes, normalize_dir)
+            except InterruptedError:
+                shutil.rmtree(work_dir, ignore_errors=True)
+                self.finished.emit(False, "Cancelled")
+                return
+            except Exception as e:
+                self._log(
+                    f"Stream-copy preparation failed, falling back to re-encode: {e}",
+                    color=self.COLOR_WARNING, level="WARN"
+                )
+                clip_paths = [
+                    os.path.abspath(os.path.join(self.clips_folder, clip_file))
+                    for clip_file in clip_files
+                ]
+                copy_concat = False
+
+        chunk_target = None
+        if not copy_concat and self.parallel_chunks and self._plan_chunks(len(clip_paths))[0] > 1:
+            chunk_target = self._chunk_target(clip_paths, probes)
+            if chunk_target is None:
+                self._log(
+                    "Clip formats could not be probed or cannot be made uniform; using a single encode.",
+                    color=self.COLOR_MUTED, level="DETAIL"
+                )
+        if chunk_target is not None:
+            try:
+                clip_paths = self._render_chunks(clip_paths, chunk_dir, chunk_target)
+                copy_concat = True
+            except InterruptedError:
+                shutil.rmtree(work_dir, ignore_errors=True)
+                self.finished.emit(False, "Cancelled")
+                return
+            except Exception as e:
+                self._log(
+                    f"Parallel chunk encode failed, falling back to a single encode: {e}",
+                    color=self.COLOR_WARNING, level="WARN"
+                )
+                shutil.rmtree(chunk_dir, ignore_errors=True)
+
         filelist_path = os.path.join(
             os.path.dirname(self.output_path), "ffmpeg_filelist.txt"
         )
         try:
-            with open(filelist_path, "w", encoding="utf-8") as f:
-                for clip_file in clip_files:
-                    abs_clip_path = os.path.abspath(
-                        os.path.join(self.clips_folder, clip_file)
-                    )
-                    sanitized_path = abs_clip_path.replace("'", "'\\''")
-                    f.write(f"file '{sanitized_path}'\n")
-            self.log_output.emit(
-                format_log(
-                    f"Created ffmpeg file list: {filelist_path}", color=self.COLOR_MUTED, level="DEBUG"
-                )
+            self._write_concat_list(filelist_path, clip_paths)
+            self._log(
+                f"Created ffmpeg file list: {filelist_path}", color=self.COLOR_MUTED, level="DEBUG"
             )
         except Exception as e:
             self.error.emit(
@@ -1042,12 +2055,14 @@ class RenderWorker(QObject):
                     bold=True, level="ERROR"
                 )
             )
+            shutil.rmtree(work_dir, ignore_errors=True)
             self.finished.emit(False, "Error creating file list.")
             return
 
         if not self._is_running:
             if os.path.exists(filelist_path):
                 os.remove(filelist_path)
+            shutil.rmtree(work_dir, ignore_errors=True)
             self.finished.emit(False, "Cancelled")
             return
 
@@ -1059,30 +2074,20 @@ class RenderWorker(QObject):
             "0",
             "-i",
             filelist_path,
-            "-c:v",
-            "libx264",           
-            "-preset",
-            "medium",            
-            "-crf",
-            "23",                
-            "-c:a",
-            "aac",               
-            "-b:a",
-            "128k",              
+            *(["-c", "copy"] if copy_concat else self.RENDER_ENCODE_ARGS),
             "-movflags",
             "+faststart",        
             "-y",
             "-hide_banner",
             "-loglevel",
             "warning",
+            "-progress",
+            "pipe:1",
+            "-nostats",
             self.output_path,
         ]
-        self.log_output.emit(
-            format_log("Starting ffmpeg process...", color=self.COLOR_INFO, bold=True, level="INFO")
-        )
-        self.log_output.emit(
-            format_log(f"CMD: {' '.join(command)}", color=self.COLOR_CMD, level="DEBUG")
-        )
+        self._log("Starting ffmpeg process...", color=self.COLOR_INFO, bold=True, level="INFO")
+        self._log(f"CMD: {' '.join(command)}", color=self.COLOR_CMD, level="DEBUG")
 
         success = False
         start_time = datetime.now()
@@ -1098,28 +2103,20 @@ class RenderWorker(QObject):
                 universal_newlines=True,
                 creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
             )
-            self.progress_update.emit(10)
+            if os.path.isdir(chunk_dir):
+                self._begin_stage(self.CHUNK_STAGE_WEIGHT, 1.0 - self.CHUNK_STAGE_WEIGHT)
+            else:
+                self._begin_stage(0.0, 1.0)
 
             output_lines = []
-            while self._is_running:
-                line = self.process.stdout.readline()
-                if not line:
-                    break
-                stripped_line = line.strip()
-                if stripped_line:
-                    output_lines.append(stripped_line)
-                    self.log_output.emit(
-                        format_log(f"[ffmpeg] {stripped_line}", color=self.COLOR_MUTED, level="DEBUG")
-                    )
-                if self.process.poll() is None:
-                     current_progress = self.progress_update.emit(min(90, 10 + int((datetime.now() - start_time).total_seconds())))
+            self._consume_ffmpeg_output(self.process, "final", output_lines)
 
             self.process.wait()
             return_code = self.process.returncode
 
             if self._is_running:
                 if return_code == 0:
-                    self.progress_update.emit(100)
+                    self.progress_update.emit(100, "Done")
                     success = True
                 else:
                     full_output = "\n".join(output_lines)
@@ -1151,61 +2148,205 @@ class RenderWorker(QObject):
             success = False
         finally:
             self.process = None
+            shutil.rmtree(work_dir, ignore_errors=True)
             if os.path.exists(filelist_path):
                 try:
                     os.remove(filelist_path)
                 except Exception as e:
-                    self.log_output.emit(
-                        format_log(
-                            f"Warning: Could not remove temporary file list {filelist_path}: {e}",
-                            color=self.COLOR_WARNING, level="WARN"
-                        )
+                    self._log(
+                        f"Warning: Could not remove temporary file list {filelist_path}: {e}",
+                        color=self.COLOR_WARNING, level="WARN"
                     )
 
             duration = (datetime.now() - start_time).total_seconds()
             final_message = ""
             if success and self._is_running:
                 final_message = self.output_path
-                self.log_output.emit(
-                    format_log(
-                        f"Render finished successfully in {duration:.2f}s.",
-                        color=self.COLOR_SUCCESS,
-                        bold=True, level="SUCCESS"
-                    )
+                self._log(
+                    f"Render finished successfully in {duration:.2f}s.",
+                    color=self.COLOR_SUCCESS,
+                    bold=True, level="SUCCESS"
                 )
             elif not self._is_running:
                 final_message = "Cancelled"
-                self.log_output.emit(
-                    format_log(
-                        f"Render cancelled after {duration:.2f}s.",
-                        color=self.COLOR_WARNING,
-                        bold=True, level="WARN"
-                    )
+                self._log(
+                    f"Render cancelled after {duration:.2f}s.",
+                    color=self.COLOR_WARNING,
+                    bold=True, level="WARN"
                 )
                 if os.path.exists(self.output_path):
                     try:
                         os.remove(self.output_path)
-                        self.log_output.emit(
-                            format_log(
-                                f"Removed incomplete output file: {self.output_path}",
-                                color=self.COLOR_MUTED, level="DEBUG"
-                            )
+                        self._log(
+                            f"Removed incomplete output file: {self.output_path}",
+                            color=self.COLOR_MUTED, level="DEBUG"
                         )
                     except Exception as e:
-                        self.log_output.emit(
-                            format_log(
-                                f"Warning: Could not remove incomplete output {self.output_path}: {e}",
-                                color=self.COLOR_WARNING, level="WARN"
-                            )
+                        self._log(
+                            f"Warning: Could not remove incomplete output {self.output_path}: {e}",
+                            color=self.COLOR_WARNING, level="WARN"
                         )
             else:
                 final_message = "Render failed. Check log."
-                self.log_output.emit(
-                    format_log(
-                        f"Render failed after {duration:.2f}s.",
-                        color=self.COLOR_ERROR,
-                        bold=True, level="ERROR"
-                    )
+                self._log(
+                    f"Render failed after {duration:.2f}s.",
+                    color=self.COLOR_ERROR,
+                    bold=True, level="ERROR"
+                )
+
+            self.finished.emit(success and self._is_running, final_message)
+
+class StreamResolver(QObject):
+    """Resolve playable stream URLs for the embedded player off the GUI thread.
+
+    Resolved URLs are cached per video until shortly before the ``expire``
+    timestamp YouTube embeds in them, so repeated clicks start instantly.
+    ``prefetch`` warms the cache on a separate single low-priority thread
+    that never delays a lookup the user is waiting for.
+    """
+
+    resolved = Signal(str, str)
+    failed = Signal(str, str)
+
+    STREAM_FORMAT = "18/best[height<=480][ext=mp4]/best[height<=720][ext=mp4]/best"
+    RESOLVE_TIMEOUT_SECONDS = 30
+    DEFAULT_TTL_SECONDS = 3600
+    EXPIRY_MARGIN_SECONDS = 300
+    MAX_WORKERS = 2
+
+    _expire_regex = re.compile(r"[?&/]expire[=/](\d+)")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+        self.prefetch_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        # Re-entrant: cancelling a future under the lock runs its callback inline.
+        self.lock = threading.RLock()
+        self._cache = {}
+        self._inflight = {}
+        # Videos someone is waiting on; prefetches only signal for these.
+        self._wanted = set()
+        self._prefetching = {}
+        self._ydl_local = threading.local()
+
+    def cached_url(self, video_id):
+        with self.lock:
+            entry = self._cache.get(video_id)
+            if entry and entry[1] > time.time():
+                return entry[0]
+            self._cache.pop(video_id, None)
+        return None
+
+    def invalidate(self, video_id):
+        with self.lock:
+            self._cache.pop(video_id, None)
+
+    def resolve(self, video_id):
+        """Emit ``resolved`` (immediately when cached) or ``failed`` for ``video_id``."""
+        url = self.cached_url(video_id)
+        if url:
+            self.resolved.emit(video_id, url)
+            return
+        with self.lock:
+            self._wanted.add(video_id)
+            pending = self._inflight.get(video_id)
+            # A queued prefetch would wait behind other prefetches; take it over.
+            if pending is not None and not pending.cancel():
+                return
+            future = self.executor.submit(self._resolve_task, video_id)
+            self._inflight[video_id] = future
+        future.add_done_callback(lambda fut, vid=video_id: self._on_done(vid, fut))
+
+    def prefetch(self, video_ids):
+        """Resolve ``video_ids`` in the background so a later click finds them cached."""
+        for video_id in video_ids:
+            if self.cached_url(video_id):
+                continue
+            with self.lock:
+                if video_id in self._inflight:
+                    continue
+                future = self.prefetch_executor.submit(self._resolve_task, video_id)
+                self._inflight[video_id] = future
+                self._prefetching[video_id] = future
+            future.add_done_callback(lambda fut, vid=video_id: self._on_done(vid, fut))
+
+    def cancel_prefetch(self):
+        """Drop prefetches that have not started yet."""
+        with self.lock:
+            queued = list(self._prefetching.values())
+        for future in queued:
+            future.cancel()
+
+    def _on_done(self, video_id, future):
+        with self.lock:
+            if self._inflight.get(video_id) is future:
+                del self._inflight[video_id]
+            if self._prefetching.get(video_id) is future:
+                del self._prefetching[video_id]
+            if future.cancelled():
+                return
+            wanted = video_id in self._wanted
+            self._wanted.discard(video_id)
+        if not wanted:
+            return
+        try:
+            url = future.result()
+        except Exception as e:
+            self.failed.emit(video_id, str(e))
+            return
+        self.resolved.emit(video_id, url)
+
+    def _expires_at(self, url):
+        now = time.time()
+        expires_at = now + self.DEFAULT_TTL_SECONDS
+        match = self._expire_regex.search(url)
+        if match:
+            expires_at = min(expires_at, int(match.group(1)) - self.EXPIRY_MARGIN_SECONDS)
+        return expires_at
+
+    def _resolve_task(self, video_id):
+        watch_url = f"https://www.youtube.com/watch?v={video_id}"
+        module = load_ytdlp_module()
+        if module is not None:
+            ydl = getattr(self._ydl_local, "ydl", None)
+            if ydl is None:
+                ydl = module.YoutubeDL(
+                    {
+                        "format": self.STREAM_FORMAT,
+                        "quiet": True,
+                        "no_warnings": True,
+                        "noprogress": True,
+                        "skip_download": True,
+                        "socket_timeout": self.RESOLVE_TIMEOUT_SECONDS,
+                    }
                 )
+                self._ydl_local.ydl = ydl
+            info = ydl.extract_info(watch_url, download=False)
+            url = info.get("url") or next(
+                (fmt.get("url") for fmt in info.get("requested_formats") or [] if fmt.get("url")),
+                None,
+            )
+        else:
+            ytdlp_path = check_dependency("yt-dlp")
+            if not ytdlp_path:
+                raise FileNotFoundError("yt-dlp not found")
+            result = subprocess.run(
+                [ytdlp_path, "-f", self.STREAM_FORMAT, "-g", "--no-warnings", watch_url],
+                capture_output=True,
+                text=True,
+                timeout=self.RESOLVE_TIMEOUT_SECONDS,
+                creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+            )
+            if result.returncode != 0:
+                raise RuntimeError((result.stderr or "Unknown error").strip())
+            url = next((line for line in result.stdout.splitlines() if line.strip()), None)
+
+        if not url:
+            raise RuntimeError("yt-dlp returned no stream URL")
+        with self.lock:
+            self._cache[video_id] = (url, self._expires_at(url))
+        return url
 
-            self.finished.emit(success and self._is_running, final_message)
\ No newline at end of file
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.prefetch_executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,755 @@
+"""Persistent job queue: `python cli.py queue ...`.
+
+Searches are stored in a SQLite database (cache/jobs.db) and survive
+restarts. `queue run` claims jobs by priority and feeds every active job
+through one shared fetch pool, taking turns between jobs so a large channel
+search cannot starve the ones queued behind it. A transcript needed by
+several jobs is fetched once and kept in the database for later jobs.
+
+    python cli.py queue add --search-type channel --channel-id UC... --keyword python --priority 5
+    python cli.py queue list
+    python cli.py queue status 3
+    python cli.py queue cancel 3
+    python cli.py queue run --workers 10 --watch
+"""
+import argparse
+import json
+import os
+import socket
+import sqlite3
+import sys
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+
+from cli import (
+    DEFAULT_OUTPUT_DIR,
+    MAX_WORKERS,
+    PREFERENCES_FILE_PATH,
+    format_result_block,
+    get_channel_videos,
+    get_transcript,
+    get_video_details,
+    load_api_keys,
+    parse_api_keys,
+    parse_video_ids,
+    write_results,
+)
+from youtube_api import (
+    KEY_STRATEGIES,
+    KEY_STRATEGY_REMAINING,
+    ServicePool,
+    configure_api_keys,
+    get_quota_ledger,
+    set_quota_budget,
+)
+
+QUEUE_DB_PATH = os.path.join(os.path.dirname(PREFERENCES_FILE_PATH), "cache", "jobs.db")
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+STATUS_CANCELLED = "cancelled"
+
+VIDEO_PENDING = "pending"
+VIDEO_DONE = "done"
+VIDEO_FAILED = "failed"
+
+DEFAULT_MAX_ACTIVE_JOBS = 4
+POLL_INTERVAL_SECONDS = 2.0
+# Captions are occasionally edited after upload; older copies are refetched.
+TRANSCRIPT_MAX_AGE_SECONDS = 7 * 24 * 3600
+# A runner renews the lease on its jobs this often; jobs whose lease is
+# older than RUNNER_LEASE_SECONDS belong to a runner that died.
+HEARTBEAT_INTERVAL_SECONDS = 10
+RUNNER_LEASE_SECONDS = 60
+DETAILS_CACHE_SIZE = 2000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    priority INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    params TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    total INTEGER,
+    done INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    matches INTEGER NOT NULL DEFAULT 0,
+    output_path TEXT,
+    error TEXT,
+    runner TEXT,
+    heartbeat REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_by_priority ON jobs (status, priority DESC, id);
+CREATE TABLE IF NOT EXISTS job_videos (
+    job_id INTEGER NOT NULL REFERENCES jobs (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    video_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    matches INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    PRIMARY KEY (job_id, video_id)
+);
+CREATE TABLE IF NOT EXISTS transcripts (
+    video_id TEXT NOT NULL,
+    language TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    entries TEXT NOT NULL,
+    PRIMARY KEY (video_id, language)
+);
+"""
+
+class JobQueue:
+    """The jobs database. Safe to open from several processes at once."""
+
+    def __init__(self, path=QUEUE_DB_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        # WAL lets `queue list` and the GUI read while a runner is writing.
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        for column, column_type in (("runner", "TEXT"), ("heartbeat", "REAL")):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {column_type}")
+
+    def close(self):
+        self._conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    @staticmethod
+    def _job_from_row(row):
+        job = dict(row)
+        job["params"] = json.loads(job["params"])
+        return job
+
+    def submit(self, params, priority=0, video_ids=None):
+        """Queue a search and return its job ID. ``params`` mirrors the CLI options."""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "INSERT INTO jobs (priority, status, params, created_at) VALUES (?, ?, ?, ?)",
+                (priority, STATUS_QUEUED, json.dumps(params), time.time()),
+            )
+            job_id = cursor.lastrowid
+            if video_ids is not None:
+                self._insert_videos(conn, job_id, video_ids)
+        return job_id
+
+    def _insert_videos(self, conn, job_id, video_ids):
+        video_ids = list(dict.fromkeys(video_ids))
+        conn.executemany(
+            "INSERT OR IGNORE INTO job_videos (job_id, position, video_id, status) VALUES (?, ?, ?, ?)",
+            [(job_id, position, vid, VIDEO_PENDING) for position, vid in enumerate(video_ids)],
+        )
+        conn.execute("UPDATE jobs SET total = ? WHERE id = ?", (len(video_ids), job_id))
+
+    def set_videos(self, job_id, video_ids):
+        with self._transaction() as conn:
+            self._insert_videos(conn, job_id, video_ids)
+
+    def job(self, job_id):
+        row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._job_from_row(row) if row else None
+
+    def jobs(self, include_finished=False, limit=100):
+        """Running jobs first, then queued ones in the order they will be claimed."""
+        query = "SELECT * FROM jobs"
+        if not include_finished:
+            query += " WHERE status IN ('queued', 'running')"
+        query += """
+            ORDER BY CASE status WHEN 'running' THEN 0 WHEN 'queued' THEN 1 ELSE 2 END,
+                     CASE WHEN status IN ('queued', 'running') THEN -priority ELSE 0 END,
+                     CASE WHEN status IN ('queued', 'running') THEN id ELSE -id END
+            LIMIT ?"""
+        return [self._job_from_row(row) for row in self._conn.execute(query, (limit,))]
+
+    def counts(self):
+        rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status")
+        return {status: count for status, count in rows}
+
+    def status_of(self, job_id):
+        row = self._conn.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return row[0] if row else None
+
+    def owner_of(self, job_id):
+        """``(status, runner)`` for a job, or ``(None, None)`` if it doesn't exist."""
+        row = self._conn.execute("SELECT status, runner FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return (row[0], row[1]) if row else (None, None)
+
+    def cancel(self, job_id):
+        """Cancel a queued or running job; returns False if it had already finished."""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ? WHERE id = ? AND status IN (?, ?)",
+                (STATUS_CANCELLED, time.time(), job_id, STATUS_QUEUED, STATUS_RUNNING),
+            )
+        return cursor.rowcount > 0
+
+    def claim_next(self, runner_id):
+        """Mark the highest-priority queued job as running under ``runner_id`` and return it."""
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = ? ORDER BY priority DESC, id LIMIT 1",
+                (STATUS_QUEUED,),
+            ).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            started_at = row["started_at"] or now
+            conn.execute(
+                "UPDATE jobs SET status = ?, started_at = ?, runner = ?, heartbeat = ? WHERE id = ?",
+                (STATUS_RUNNING, started_at, runner_id, now, row["id"]),
+            )
+        job = self._job_from_row(row)
+        job["status"], job["started_at"], job["runner"] = STATUS_RUNNING, started_at, runner_id
+        return job
+
+    def heartbeat(self, runner_id):
+        """Renew the lease on every job ``runner_id`` is running."""
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET heartbeat = ? WHERE runner = ? AND status = ?",
+                (time.time(), runner_id, STATUS_RUNNING),
+            )
+
+    def requeue(self, job_id, runner_id):
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, runner = NULL WHERE id = ? AND status = ? AND runner = ?",
+                (STATUS_QUEUED, job_id, STATUS_RUNNING, runner_id),
+            )
+
+    def requeue_stale(self, lease_seconds=RUNNER_LEASE_SECONDS):
+        """Put jobs whose runner stopped renewing its lease back in the queue."""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, runner = NULL "
+                "WHERE status = ? AND (heartbeat IS NULL OR heartbeat < ?)",
+                (STATUS_QUEUED, STATUS_RUNNING, time.time() - lease_seconds),
+            )
+        return cursor.rowcount
+
+    def pending_videos(self, job_id):
+        rows = self._conn.execute(
+            "SELECT video_id FROM job_videos WHERE job_id = ? AND status = ? ORDER BY position",
+            (job_id, VIDEO_PENDING),
+        )
+        return [row[0] for row in rows]
+
+    def video_counts(self, job_id):
+        rows = self._conn.execute(
+            "SELECT status, COUNT(*) FROM job_videos WHERE job_id = ? GROUP BY status", (job_id,)
+        )
+        return {status: count for status, count in rows}
+
+    def record_video(self, job_id, video_id, status, matches=0, result=None, error=None):
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE job_videos SET status = ?, matches = ?, result = ?, error = ? "
+                "WHERE job_id = ? AND video_id = ? AND status = ?",
+                (status, matches, result, error, job_id, video_id, VIDEO_PENDING),
+            )
+            if cursor.rowcount:
+                conn.execute(
+                    "UPDATE jobs SET done = done + 1, failed = failed + ?, matches = matches + ? WHERE id = ?",
+                    (1 if status == VIDEO_FAILED else 0, matches, job_id),
+                )
+
+    def results(self, job_id):
+        """Result blocks of the matching videos, in the job's video order."""
+        rows = self._conn.execute(
+            "SELECT result FROM job_videos WHERE job_id = ? AND result IS NOT NULL ORDER BY position",
+            (job_id,),
+        )
+        return [row[0] for row in rows]
+
+    def finish(self, job_id, runner_id, status, output_path=None, error=None):
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, output_path = ?, error = ? "
+                "WHERE id = ? AND status = ? AND runner = ?",
+                (status, time.time(), output_path, error, job_id, STATUS_RUNNING, runner_id),
+            )
+
+    def cached_transcript(self, video_id, language):
+        row = self._conn.execute(
+            "SELECT entries FROM transcripts WHERE video_id = ? AND language = ? AND fetched_at > ?",
+            (video_id, language, time.time() - TRANSCRIPT_MAX_AGE_SECONDS),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def store_transcript(self, video_id, language, entries):
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO transcripts (video_id, language, fetched_at, entries) VALUES (?, ?, ?, ?)",
+                (video_id, language, time.time(), json.dumps(entries)),
+            )
+
+    def prune_transcripts(self):
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "DELETE FROM transcripts WHERE fetched_at <= ?",
+                (time.time() - TRANSCRIPT_MAX_AGE_SECONDS,),
+            )
+        return cursor.rowcount
+
+class _ActiveJob:
+    def __init__(self, job, pending):
+        self.id = job["id"]
+        self.priority = job["priority"]
+        self.params = job["params"]
+        self.keyword = self.params["keyword"]
+        self.language = self.params["language"]
+        self.pending = deque(pending)
+        # Videos handed to the pool whose outcome hasn't been recorded yet.
+        self.outstanding = 0
+        self.listing = False
+        self.cancelled = False
+        self.started = time.perf_counter()
+
+    @property
+    def idle(self):
+        return not self.pending and not self.outstanding and not self.listing
+
+class QueueRunner:
+    """Runs queued jobs through one shared fetch pool.
+
+    All scheduling and database writes happen on the calling thread; the
+    pool threads only fetch. Up to ``max_active_jobs`` jobs are worked on at
+    once and the pool takes one video from each in turn. Claimed jobs are
+    leased to this runner and the lease is renewed while it works, so
+    several runners can share a queue and a dead runner's jobs are picked
+    up again once its lease runs out.
+    """
+
+    def __init__(self, queue, api_keys, workers=MAX_WORKERS, max_active_jobs=DEFAULT_MAX_ACTIVE_JOBS, log=print):
+        self.queue = queue
+        self.workers = workers
+        self.max_active_jobs = max_active_jobs
+        # Keep a little work queued behind the busy threads.
+        self.max_in_flight = workers * 2
+        self._log = log
+        self.clients = ServicePool(api_keys[0], workers)
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="capscript-queue")
+        self._active = {}
+        self._turn = 0
+        self._in_flight = {}
+        self._transcript_waiters = {}
+        self._details_waiters = {}
+        self._details = OrderedDict()
+        self.runner_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._heartbeat_at = 0.0
+        self.transcripts_fetched = 0
+        self.transcripts_shared = 0
+
+    def run(self, watch=False, poll_interval=POLL_INTERVAL_SECONDS):
+        """Work until the queue is empty (or forever with ``watch``)."""
+        self.queue.prune_transcripts()
+        try:
+            while True:
+                self._renew_lease()
+                self._claim_jobs()
+                self._drop_lost_jobs()
+                self._schedule()
+                self._finish_idle_jobs()
+                if not self._in_flight:
+                    if self._active:
+                        continue
+                    self._details.clear()
+                    if not watch:
+                        held = self.queue.counts().get(STATUS_RUNNING, 0)
+                        if held:
+                            self._log(
+                                f"{held} job(s) are leased to another runner. They resume here if its "
+                                f"lease runs out ({RUNNER_LEASE_SECONDS}s); use --watch to wait for them."
+                            )
+                        return
+                    time.sleep(poll_interval)
+                    continue
+                done, _ = wait(list(self._in_flight), timeout=poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._handle(future)
+        finally:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            # Interrupted: hand unfinished jobs back so the next run resumes them.
+            for job in self._active.values():
+                if not job.cancelled:
+                    self.queue.requeue(job.id, self.runner_id)
+
+    def _renew_lease(self):
+        now = time.monotonic()
+        if now - self._heartbeat_at < HEARTBEAT_INTERVAL_SECONDS:
+            return
+        self._heartbeat_at = now
+        self.queue.heartbeat(self.runner_id)
+        resumed = self.queue.requeue_stale()
+        if resumed:
+            self._log(f"Resuming {resumed} job(s) left behind by a stopped runner.")
+
+    def _claim_jobs(self):
+        while len(self._active) < self.max_active_jobs:
+            job = self.queue.claim_next(self.runner_id)
+            if job is None:
+                return
+            active = _ActiveJob(job, self.queue.pending_videos(job["id"]))
+            self._active[active.id] = active
+            if job["total"] is None:
+                active.listing = True
+                self._submit(("videos", active.id), self._list_channel, active.params)
+                self._log(f"Job {active.id}: listing channel {active.params['channel_id']}...")
+            else:
+                self._log(f"Job {active.id}: started, {len(active.pending)} of {job['total']} video(s) to search.")
+
+    def _list_channel(self, params):
+        with self.clients.client() as youtube:
+            return get_channel_videos(
+                youtube, params["channel_id"], params["language"], params["max_results"]
+            )
+
+    def _fetch_details(self, video_id):
+        with self.clients.client() as youtube:
+            return get_video_details(youtube, video_id)
+
+    def _drop_lost_jobs(self):
+        """Stop working on jobs that were cancelled or are no longer leased to this runner."""
+        for job in list(self._active.values()):
+            status, runner = self.queue.owner_of(job.id)
+            if status == STATUS_RUNNING and runner == self.runner_id:
+                continue
+            job.cancelled = True
+            del self._active[job.id]
+            if status == STATUS_CANCELLED:
+                self._log(f"Job {job.id}: cancelled.")
+            else:
+                self._log(f"Job {job.id}: taken over by another runner; dropping it here.")
+
+    def _submit(self, key, fn, *args):
+        self._in_flight[self.executor.submit(fn, *args)] = key
+
+    def _schedule(self):
+        jobs = sorted(self._active.values(), key=lambda job: (-job.priority, job.id))
+        while jobs and len(self._in_flight) < self.max_in_flight:
+            took_any = False
+            for offset in range(len(jobs)):
+                job = jobs[(self._turn + offset) % len(jobs)]
+                if job.pending and len(self._in_flight) < self.max_in_flight:
+                    self._start_video(job, job.pending.popleft())
+                    took_any = True
+            self._turn += 1
+            if not took_any:
+                return
+
+    def _start_video(self, job, video_id):
+        job.outstanding += 1
+        key = (video_id, job.language)
+        waiters = self._transcript_waiters.get(key)
+        if waiters is not None:
+            # Another job is already fetching this transcript.
+            waiters.append((job, video_id))
+            self.transcripts_shared += 1
+            return
+        entries = self.queue.cached_transcript(video_id, job.language)
+        if entries is not None:
+            self.transcripts_shared += 1
+            self._on_transcript(job, video_id, entries)
+            return
+        self._transcript_waiters[key] = [(job, video_id)]
+        self._submit(("transcript", key), get_transcript, video_id, job.language)
+
+    def _handle(self, future):
+        kind, key = self._in_flight.pop(future)
+        try:
+            value, error = future.result(), None
+        except Exception as e:
+            value, error = None, str(e) or e.__class__.__name__
+
+        if kind == "videos":
+            job = self._active.get(key)
+            if job is None:
+                return
+            job.listing = False
+            if error is not None:
+                self._fail_job(job, f"Could not list channel videos: {error}")
+                return
+            self.queue.set_videos(job.id, value)
+            job.pending.extend(value)
+            self._log(f"Job {job.id}: {len(value)} video(s) to search.")
+        elif kind == "transcript":
+            waiters = self._transcript_waiters.pop(key)
+            if error is None:
+                self.transcripts_fetched += 1
+                self.queue.store_transcript(key[0], key[1], value)
+            for job, video_id in waiters:
+                if error is None:
+                    self._on_transcript(job, video_id, value)
+                else:
+                    self._record(job, video_id, VIDEO_FAILED, error=f"Transcript: {error}")
+        elif kind == "details":
+            waiters = self._details_waiters.pop(key)
+            if error is None:
+                self._details[key] = value
+                while len(self._details) > DETAILS_CACHE_SIZE:
+                    self._details.popitem(last=False)
+            for job, video_id, items in waiters:
+                if error is None:
+                    self._record_match(job, video_id, items, value)
+                else:
+                    self._record(job, video_id, VIDEO_FAILED, error=f"Details: {error}")
+
+    def _on_transcript(self, job, video_id, entries):
+        if job.cancelled:
+            return
+        needle = job.keyword.lower()
+        items = [item for item in entries if needle in item["text"].lower()]
+        if not items:
+            self._record(job, video_id, VIDEO_DONE)
+            return
+        details = self._details.get(video_id)
+        if details is not None:
+            self._details.move_to_end(video_id)
+            self._record_match(job, video_id, items, details)
+            return
+        waiters = self._details_waiters.get(video_id)
+        if waiters is None:
+            waiters = self._details_waiters[video_id] = []
+            self._submit(("details", video_id), self._fetch_details, video_id)
+        waiters.append((job, video_id, items))
+
+    def _record_match(self, job, video_id, items, details):
+        self._record(
+            job, video_id, VIDEO_DONE,
+            matches=len(items), result=format_result_block(video_id, details, items),
+        )
+
+    def _record(self, job, video_id, status, matches=0, result=None, error=None):
+        if job.cancelled:
+            return
+        job.outstanding -= 1
+        self.queue.record_video(job.id, video_id, status, matches=matches, result=result, error=error)
+        if error:
+            self._log(f"Job {job.id}: {video_id} failed: {error}")
+
+    def _fail_job(self, job, error):
+        self._active.pop(job.id, None)
+        self.queue.finish(job.id, self.runner_id, STATUS_FAILED, error=error)
+        self._log(f"Job {job.id}: failed. {error}")
+
+    def _finish_idle_jobs(self):
+        for job in [job for job in self._active.values() if job.idle]:
+            del self._active[job.id]
+            record = self.queue.job(job.id)
+            output_path = None
+            if record["matches"]:
+                try:
+                    # Several jobs may search for the same keyword into one folder.
+                    output_path = write_results(
+                        job.params["output_dir"], job.keyword, self.queue.results(job.id),
+                        file_prefix=f"job{job.id}_",
+                    )
+                except OSError as e:
+                    self._fail_job(job, f"Error writing output file: {e}")
+                    continue
+            self.queue.finish(job.id, self.runner_id, STATUS_DONE, output_path=output_path)
+            summary = f"{record['matches']} match(es) in {record['total']} video(s)"
+            if record["failed"]:
+                summary += f", {record['failed']} failed"
+            self._log(
+                f"Job {job.id}: done, {summary} in {time.perf_counter() - job.started:.1f}s."
+                + (f" Saved to {output_path}" if output_path else "")
+            )
+
+def describe_job(job):
+    params = job["params"]
+    if params["search_type"] == "channel":
+        target = f"channel {params['channel_id']} (max {params['max_results']})"
+    else:
+        target = f"{job['total'] or 0} video(s)"
+    return f"'{params['keyword']}' [{params['language']}] in {target}"
+
+def format_progress(job):
+    if job["total"] is None:
+        return "-"
+    return f"{job['done']}/{job['total']}"
+
+def print_jobs(jobs):
+    if not jobs:
+        print("No jobs.")
+        return
+    print(f"{'ID':>5}  {'STATUS':<10} {'PRI':>4}  {'PROGRESS':>9}  {'MATCHES':>7}  SEARCH")
+    for job in jobs:
+        print(
+            f"{job['id']:>5}  {job['status']:<10} {job['priority']:>4}  "
+            f"{format_progress(job):>9}  {job['matches']:>7}  {describe_job(job)}"
+        )
+
+def print_job(queue, job):
+    print(f"Job {job['id']}: {job['status']} (priority {job['priority']})")
+    print(f"  Search: {describe_job(job)}")
+    print(f"  Output dir: {job['params']['output_dir']}")
+    print(f"  Queued: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(job['created_at']))}")
+    if job["started_at"]:
+        print(f"  Started: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(job['started_at']))}")
+    if job["finished_at"]:
+        print(f"  Finished: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(job['finished_at']))}")
+    counts = queue.video_counts(job["id"])
+    if job["total"] is not None:
+        print(
+            f"  Videos: {job['total']} total, {counts.get(VIDEO_DONE, 0)} searched, "
+            f"{counts.get(VIDEO_FAILED, 0)} failed, {counts.get(VIDEO_PENDING, 0)} pending"
+        )
+    print(f"  Matches: {job['matches']}")
+    if job["output_path"]:
+        print(f"  Results: {job['output_path']}")
+    if job["error"]:
+        print(f"  Error: {job['error']}")
+
+def _add_run_key_arguments(parser):
+    parser.add_argument(
+        "--api-key",
+        type=str,
+        help="YouTube Data API key(s), comma-separated. Defaults to the keys in preferences.ini.",
+    )
+    parser.add_argument(
+        "--key-strategy",
+        type=str,
+        default=KEY_STRATEGY_REMAINING,
+        choices=KEY_STRATEGIES,
+        help="How to pick between several API keys (default: remaining).",
+    )
+    parser.add_argument("--quota-budget", type=int, help="Maximum Data API units to spend today.")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="cli.py queue",
+        description="Queue caption searches and run them from a persistent, prioritized job queue.",
+    )
+    parser.add_argument("--db", default=QUEUE_DB_PATH, help=f"Queue database (default: {QUEUE_DB_PATH}).")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("add", help="Queue a search.")
+    add.add_argument("--search-type", required=True, choices=["channel", "video"], help="Search by 'channel' ID or specific 'video' IDs.")
+    add.add_argument("--keyword", required=True, help="The word or phrase to search for in captions.")
+    add.add_argument("--language", default="en", help="Two-letter language code for captions (default: en).")
+    add.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help=f"Directory to save results (default: {DEFAULT_OUTPUT_DIR}).")
+    add.add_argument("--channel-id", help="The YouTube Channel ID (required if search-type is 'channel').")
+    add.add_argument("--max-results", type=int, default=10, help="Maximum number of recent videos to search in the channel (default: 10).")
+    add.add_argument("--video-ids", help="Comma-separated Video IDs or path to a file containing them (required if search-type is 'video').")
+    add.add_argument("--priority", type=int, default=0, help="Higher-priority jobs run first (default: 0).")
+
+    listing = commands.add_parser("list", help="Show queued and running jobs.")
+    listing.add_argument("--all", action="store_true", help="Include finished, failed and cancelled jobs.")
+
+    status = commands.add_parser("status", help="Show one job in detail.")
+    status.add_argument("job_id", type=int)
+
+    cancel = commands.add_parser("cancel", help="Cancel a queued or running job.")
+    cancel.add_argument("job_id", type=int)
+
+    run = commands.add_parser("run", help="Work through the queue.")
+    run.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_WORKERS,
+        help=f"Concurrent fetches shared by all jobs (default: {MAX_WORKERS}).",
+    )
+    run.add_argument(
+        "--max-active-jobs",
+        type=int,
+        default=DEFAULT_MAX_ACTIVE_JOBS,
+        help=f"Jobs worked on at the same time (default: {DEFAULT_MAX_ACTIVE_JOBS}).",
+    )
+    run.add_argument("--watch", action="store_true", help="Keep running and pick up new jobs as they are queued.")
+    _add_run_key_arguments(run)
+
+    args = parser.parse_args(argv)
+    queue = JobQueue(args.db)
+    try:
+        if args.command == "add":
+            params = {
+                "search_type": args.search_type,
+                "keyword": args.keyword,
+                "language": args.language,
+                "output_dir": args.output_dir,
+                "channel_id": args.channel_id,
+                "max_results": args.max_results,
+            }
+            video_ids = None
+            if args.search_type == "channel":
+                if not args.channel_id:
+                    parser.error("--channel-id is required when --search-type is 'channel'")
+                if args.max_results <= 0:
+                    parser.error("--max-results must be a positive integer.")
+            else:
+                if not args.video_ids:
+                    parser.error("--video-ids is required when --search-type is 'video'")
+                video_ids = parse_video_ids(args.video_ids)
+                if not video_ids:
+                    sys.exit(1)
+            job_id = queue.submit(params, priority=args.priority, video_ids=video_ids)
+            print(f"Queued job {job_id} (priority {args.priority}). Run 'cli.py queue run' to process the queue.")
+        elif args.command == "list":
+            print_jobs(queue.jobs(include_finished=args.all))
+        elif args.command == "status":
+            job = queue.job(args.job_id)
+            if job is None:
+                print(f"Error: No job with ID {args.job_id}.")
+                sys.exit(1)
+            print_job(queue, job)
+        elif args.command == "cancel":
+            if queue.cancel(args.job_id):
+                print(f"Cancelled job {args.job_id}.")
+            else:
+                print(f"Error: Job {args.job_id} does not exist or has already finished.")
+                sys.exit(1)
+        elif args.command == "run":
+            api_keys = parse_api_keys(args.api_key) if args.api_key else load_api_keys()
+            if not api_keys:
+                print(
+                    f"Error: YouTube Data API key not found. Please provide one using --api-key or ensure it's in {PREFERENCES_FILE_PATH}."
+                )
+                sys.exit(1)
+            configure_api_keys(api_keys, args.key_strategy)
+            if args.quota_budget is not None:
+                set_quota_budget(args.quota_budget)
+
+            runner = QueueRunner(
+                queue,
+                api_keys,
+                workers=max(1, args.workers),
+                max_active_jobs=max(1, args.max_active_jobs),
+            )
+            print(f"Running the job queue with {runner.workers} worker(s) ({len(api_keys)} API key(s)).")
+            if args.watch:
+                print("Waiting for new jobs. Press Ctrl+C to stop.")
+            try:
+                runner.run(watch=args.watch)
+            except KeyboardInterrupt:
+                print("\nStopped; unfinished jobs will resume on the next run.")
+            print(
+                f"Transcripts fetched: {runner.transcripts_fetched}, reused: {runner.transcripts_shared}. "
+                f"Quota used today: {get_quota_ledger().used_today()} units."
+            )
+    finally:
+        queue.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,413 @@
+"""Local search server: `python cli.py serve`.
+
+Keeps the API clients, transcript and metadata caches and the fetch pool
+alive between searches. Jobs are POSTed as JSON to /search and results are
+streamed back as they are found, either as Server-Sent Events (when the
+client sends ``Accept: text/event-stream`` or ``?format=sse``) or as
+newline-delimited JSON.
+
+    POST /search  {"keywords": ["python"], "channel_id": "UC...", "max_results": 20}
+    POST /search  {"keyword": "python", "video_ids": ["id1", "id2"], "language": "en"}
+    GET  /health
+    GET  /stats
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from cli import (
+    MAX_WORKERS,
+    PREFERENCES_FILE_PATH,
+    format_time,
+    get_channel_videos,
+    get_transcript,
+    get_video_details,
+    load_api_keys,
+    parse_api_keys,
+)
+from youtube_api import (
+    KEY_STRATEGIES,
+    KEY_STRATEGY_REMAINING,
+    ServicePool,
+    configure_api_keys,
+    get_quota_ledger,
+    set_quota_budget,
+)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_REQUEST_BYTES = 1024 * 1024
+MAX_JOB_VIDEOS = 500
+
+_MISSING = object()
+
+class TTLCache:
+    """Thread-safe LRU mapping whose entries expire after ``ttl`` seconds (None: never)."""
+
+    def __init__(self, max_entries, ttl=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            value, stored_at = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+def parse_job(payload):
+    """Validate a /search body; returns a normalized job dict or raises ValueError."""
+    if not isinstance(payload, dict):
+        raise ValueError("Request body must be a JSON object.")
+
+    keywords = payload.get("keywords") or []
+    if isinstance(keywords, str):
+        keywords = [keywords]
+    if payload.get("keyword"):
+        keywords = [payload["keyword"]] + list(keywords)
+    keywords = [k.strip() for k in keywords if isinstance(k, str) and k.strip()]
+    if not keywords:
+        raise ValueError("'keyword' or 'keywords' is required.")
+
+    video_ids = payload.get("video_ids") or []
+    if isinstance(video_ids, str):
+        video_ids = [vid.strip() for vid in video_ids.split(",")]
+    video_ids = list(dict.fromkeys(vid for vid in video_ids if isinstance(vid, str) and vid))
+    channel_id = payload.get("channel_id")
+    if bool(video_ids) == bool(channel_id):
+        raise ValueError("Provide exactly one of 'channel_id' or 'video_ids'.")
+    if len(video_ids) > MAX_JOB_VIDEOS:
+        raise ValueError(f"At most {MAX_JOB_VIDEOS} video IDs per job.")
+
+    try:
+        max_results = int(payload.get("max_results", 10))
+    except (TypeError, ValueError):
+        raise ValueError("'max_results' must be an integer.")
+    if channel_id and not 0 < max_results <= MAX_JOB_VIDEOS:
+        raise ValueError(f"'max_results' must be between 1 and {MAX_JOB_VIDEOS}.")
+
+    return {
+        "keywords": keywords,
+        "language": payload.get("language") or "en",
+        "channel_id": channel_id,
+        "max_results": max_results,
+        "video_ids": video_ids,
+    }
+
+class SearchService:
+    """State kept warm between requests: API clients, caches and the fetch pool."""
+
+    TRANSCRIPT_CACHE_SIZE = 2000
+    DETAILS_CACHE_SIZE = 10000
+    CHANNEL_CACHE_SIZE = 200
+    # Channel listings change as videos are uploaded; transcripts and
+    # titles are treated as stable for the life of the server.
+    CHANNEL_CACHE_TTL = 600
+
+    def __init__(self, api_keys, max_workers=MAX_WORKERS):
+        self.api_key = api_keys[0]
+        self.clients = ServicePool(self.api_key, max_workers)
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="capscript-fetch"
+        )
+        self.transcripts = TTLCache(self.TRANSCRIPT_CACHE_SIZE)
+        self.details = TTLCache(self.DETAILS_CACHE_SIZE)
+        self.channels = TTLCache(self.CHANNEL_CACHE_SIZE, ttl=self.CHANNEL_CACHE_TTL)
+        self.started_at = time.time()
+        self._stats_lock = threading.Lock()
+        self.jobs_served = 0
+        self.jobs_running = 0
+
+    def transcript(self, video_id, language):
+        key = (video_id, language)
+        transcript = self.transcripts.get(key)
+        if transcript is None:
+            transcript = get_transcript(video_id, language)
+            self.transcripts.put(key, transcript)
+        return transcript
+
+    def video_details(self, video_id):
+        details = self.details.get(video_id)
+        if details is None:
+            with self.clients.client() as youtube:
+                details = get_video_details(youtube, video_id)
+            self.details.put(video_id, details)
+        return details
+
+    def channel_videos(self, channel_id, language, max_results):
+        key = (channel_id, language, max_results)
+        video_ids = self.channels.get(key)
+        if video_ids is None:
+            with self.clients.client() as youtube:
+                video_ids = get_channel_videos(youtube, channel_id, language, max_results)
+            self.channels.put(key, video_ids)
+        return video_ids
+
+    def search_video(self, video_id, language, keywords):
+        """Matches for all ``keywords`` in one video, or None if there are none."""
+        lowered = [(keyword, keyword.lower()) for keyword in keywords]
+        matches = []
+        for item in self.transcript(video_id, language):
+            text = item["text"].lower()
+            for keyword, needle in lowered:
+                if needle in text:
+                    matches.append({
+                        "keyword": keyword,
+                        "start": item["start"],
+                        "timestamp": format_time(item["start"]),
+                        "text": item["text"],
+                    })
+        if not matches:
+            return None
+
+        title, channel_title, channel_id, date_uploaded, views = self.video_details(video_id)
+        return {
+            "video_id": video_id,
+            "title": title,
+            "channel_title": channel_title,
+            "channel_id": channel_id,
+            "date_uploaded": date_uploaded,
+            "views": views,
+            "url": f"https://www.youtube.com/watch?v={video_id}",
+            "matches": matches,
+        }
+
+    def run_job(self, job):
+        """Yield ``(event, payload)`` pairs for a job as results come in."""
+        with self._stats_lock:
+            self.jobs_running += 1
+        started = time.perf_counter()
+        futures = {}
+        try:
+            video_ids = job["video_ids"]
+            if job["channel_id"]:
+                # A thread of its own already; blocking here is fine.
+                video_ids = self.channel_videos(
+                    job["channel_id"], job["language"], job["max_results"]
+                )
+            total = len(video_ids)
+            yield "job", {"videos": total, "keywords": job["keywords"]}
+
+            futures = {
+                self.executor.submit(self.search_video, vid, job["language"], job["keywords"]): vid
+                for vid in video_ids
+            }
+            match_count = 0
+            for done, future in enumerate(as_completed(futures), 1):
+                video_id = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    yield "error", {"video_id": video_id, "error": str(e)}
+                else:
+                    if result:
+                        match_count += len(result["matches"])
+                        yield "result", result
+                yield "progress", {"done": done, "total": total}
+
+            yield "done", {
+                "videos": total,
+                "matches": match_count,
+                "seconds": round(time.perf_counter() - started, 3),
+            }
+        finally:
+            # The client went away (or the job failed): drop queued fetches.
+            for future in futures:
+                future.cancel()
+            with self._stats_lock:
+                self.jobs_running -= 1
+                self.jobs_served += 1
+
+    def stats(self):
+        ledger = get_quota_ledger()
+        with self._stats_lock:
+            jobs_served, jobs_running = self.jobs_served, self.jobs_running
+        return {
+            "uptime_seconds": round(time.time() - self.started_at),
+            "jobs_served": jobs_served,
+            "jobs_running": jobs_running,
+            "cached_transcripts": len(self.transcripts),
+            "cached_details": len(self.details),
+            "cached_channels": len(self.channels),
+            "quota_used_today": ledger.used_today(),
+            "quota_by_method": ledger.usage(),
+        }
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+class SearchRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "CapScript"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _write_chunk(self, data):
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/health":
+            self._send_json(200, {"status": "ok"})
+        elif path == "/stats":
+            self._send_json(200, self.server.service.stats())
+        else:
+            self._send_json(404, {"error": f"Unknown path: {path}"})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != "/search":
+            self._send_json(404, {"error": f"Unknown path: {url.path}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if not 0 < length <= MAX_REQUEST_BYTES:
+            self._send_json(400, {"error": "A JSON body of at most 1 MB is required."})
+            return
+        try:
+            job = parse_job(json.loads(self.rfile.read(length)))
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+
+        query = parse_qs(url.query)
+        use_sse = (
+            query.get("format", [""])[0] == "sse"
+            or "text/event-stream" in self.headers.get("Accept", "")
+        )
+        self.send_response(200)
+        self.send_header(
+            "Content-Type", "text/event-stream" if use_sse else "application/x-ndjson"
+        )
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        events = self.server.service.run_job(job)
+        try:
+            for event, payload in events:
+                self._write_event(event, payload, use_sse)
+            self._write_chunk(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+        except Exception as e:
+            # Headers are already out; report the failure in-stream.
+            try:
+                self._write_event("error", {"error": str(e)}, use_sse)
+                self._write_chunk(b"")
+            except OSError:
+                self.close_connection = True
+        finally:
+            events.close()
+
+    def _write_event(self, event, payload, use_sse):
+        if use_sse:
+            message = f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+        else:
+            message = json.dumps({"event": event, "data": payload}) + "\n"
+        self._write_chunk(message.encode("utf-8"))
+
+class SearchServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, service, verbose=False):
+        super().__init__(address, SearchRequestHandler)
+        self.service = service
+        self.verbose = verbose
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="cli.py serve",
+        description="Run a local HTTP/JSON caption search server with warm clients and caches.",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Interface to bind (default: {DEFAULT_HOST}).")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port to listen on (default: {DEFAULT_PORT}).")
+    parser.add_argument(
+        "--api-key",
+        type=str,
+        help="YouTube Data API key(s), comma-separated. Defaults to the keys in preferences.ini.",
+    )
+    parser.add_argument(
+        "--key-strategy",
+        type=str,
+        default=KEY_STRATEGY_REMAINING,
+        choices=KEY_STRATEGIES,
+        help="How to pick between several API keys (default: remaining).",
+    )
+    parser.add_argument("--quota-budget", type=int, help="Maximum Data API units to spend today.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_WORKERS,
+        help=f"Concurrent transcript/metadata fetches shared by all jobs (default: {MAX_WORKERS}).",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Log every HTTP request.")
+    args = parser.parse_args(argv)
+
+    api_keys = parse_api_keys(args.api_key) if args.api_key else load_api_keys()
+    if not api_keys:
+        print(
+            f"Error: YouTube Data API key not found. Please provide one using --api-key or ensure it's in {PREFERENCES_FILE_PATH}."
+        )
+        sys.exit(1)
+    configure_api_keys(api_keys, args.key_strategy)
+    if args.quota_budget is not None:
+        set_quota_budget(args.quota_budget)
+
+    service = SearchService(api_keys, max_workers=max(1, args.workers))
+    try:
+        server = SearchServer((args.host, args.port), service, verbose=args.verbose)
+    except OSError as e:
+        print(f"Error: Could not listen on {args.host}:{args.port}: {e}")
+        sys.exit(1)
+
+    print(f"CapScript search server listening on http://{args.host}:{args.port} ({len(api_keys)} API key(s)).")
+    print("Press Ctrl+C to stop.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down...")
+    finally:
+        server.server_close()
+        service.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,498 @@
+import atexit
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# googleapiclient and requests are imported where they are used: the CLI
+# imports this module for argument parsing and quota planning, which must
+# stay fast.
+
+try:
+    from zoneinfo import ZoneInfo
+    QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+except Exception:
+    # No tz database (e.g. Windows without tzdata); PST is close enough.
+    QUOTA_TIMEZONE = timezone(timedelta(hours=-8))
+
+API_SERVICE_NAME = "youtube"
+API_VERSION = "v3"
+DISCOVERY_URL = "https://www.googleapis.com/discovery/v1/apis/youtube/v3/rest"
+
+def _get_application_root_path():
+    if getattr(sys, "frozen", False):
+        return os.path.dirname(sys.executable)
+    else:
+        return os.path.dirname(os.path.abspath(__file__))
+
+DISCOVERY_CACHE_PATH = os.path.join(
+    _get_application_root_path(), "cache", f"{API_SERVICE_NAME}.{API_VERSION}.json"
+)
+QUOTA_LEDGER_PATH = os.path.join(_get_application_root_path(), "cache", "quota.db")
+
+DAILY_QUOTA = 10000
+# Units charged per call, from the Data API quota calculator. Anything not
+# listed is a 1-unit read.
+QUOTA_COSTS = {
+    "search.list": 100,
+    "videos.list": 1,
+    "channels.list": 1,
+    "playlistItems.list": 1,
+}
+
+_discovery_lock = threading.Lock()
+_discovery_document = None
+_local = threading.local()
+
+def _read_discovery_document():
+    """Return the discovery document text, preferring local copies over the network."""
+    if os.path.isfile(DISCOVERY_CACHE_PATH):
+        try:
+            with open(DISCOVERY_CACHE_PATH, "r", encoding="utf-8") as f:
+                return f.read()
+        except IOError as e:
+            print(f"Warning: Could not read cached discovery document: {e}")
+
+    # google-api-python-client ships the document, but PyInstaller bundles
+    # do not always include its data files.
+    try:
+        from googleapiclient.discovery_cache import get_static_doc
+    except ImportError:
+        get_static_doc = None
+    if get_static_doc is not None:
+        content = get_static_doc(API_SERVICE_NAME, API_VERSION)
+        if content:
+            return content
+
+    import requests
+
+    response = requests.get(DISCOVERY_URL, timeout=30)
+    response.raise_for_status()
+    content = response.text
+    try:
+        os.makedirs(os.path.dirname(DISCOVERY_CACHE_PATH), exist_ok=True)
+        with open(DISCOVERY_CACHE_PATH, "w", encoding="utf-8") as f:
+            f.write(content)
+    except IOError as e:
+        print(f"Warning: Could not cache discovery document: {e}")
+    return content
+
+def get_discovery_document():
+    """The parsed YouTube Data API discovery document, loaded once per process."""
+    global _discovery_document
+    with _discovery_lock:
+        if _discovery_document is None:
+            _discovery_document = json.loads(_read_discovery_document())
+        return _discovery_document
+
+class QuotaBudgetExceeded(Exception):
+    pass
+
+class QuotaLedger:
+    """Data API units spent per method and per key each day, shared between processes.
+
+    Days follow Pacific time, which is when Google resets the quota. With a
+    ``budget`` set, ``charge`` refuses calls that would take the day's total
+    over it. Keys are recorded by fingerprint, never in clear.
+
+    Usage lives in a SQLite database so the GUI, the CLI, ``serve`` and
+    ``queue run`` can all add to it at once. Charges are buffered and written
+    (and other processes' usage read back) every ``FLUSH_INTERVAL_SECONDS``,
+    so the budget may be overshot by what other processes spent in that
+    window.
+    """
+
+    KEEP_DAYS = 7
+    FLUSH_INTERVAL_SECONDS = 2.0
+
+    def __init__(self, path=QUOTA_LEDGER_PATH, budget=None):
+        self.path = path
+        self.budget = budget
+        self._lock = threading.Lock()
+        # (day, method, key fingerprint or "") -> units not yet written.
+        self._pending = {}
+        # day -> {"methods": {...}, "keys": {...}} as last read from the database.
+        self._days = {}
+        self._synced_at = None
+        self._conn = None
+        atexit.register(self.flush)
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(
+                self.path, timeout=10, isolation_level=None, check_same_thread=False
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS usage ("
+                " day TEXT NOT NULL, method TEXT NOT NULL, key TEXT NOT NULL,"
+                " units INTEGER NOT NULL, PRIMARY KEY (day, method, key))"
+            )
+            self._import_json_ledger()
+        return self._conn
+
+    def _import_json_ledger(self):
+        """Carry over the quota.json ledger written by earlier versions."""
+        legacy_path = os.path.splitext(self.path)[0] + ".json"
+        try:
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                days = json.load(f)
+        except (IOError, ValueError):
+            return
+        rows = []
+        for day, entry in days.items():
+            methods = entry.get("methods", entry)
+            rows += [(day, method, "", units) for method, units in methods.items()]
+            rows += [(day, "", fingerprint, units) for fingerprint, units in entry.get("keys", {}).items()]
+        self._conn.execute("BEGIN IMMEDIATE")
+        self._conn.executemany("INSERT OR IGNORE INTO usage VALUES (?, ?, ?, ?)", rows)
+        self._conn.execute("COMMIT")
+        try:
+            os.replace(legacy_path, legacy_path + ".imported")
+        except OSError:
+            pass
+
+    def _sync(self, force=False):
+        """Write pending charges and re-read today's totals; call with the lock held."""
+        now = time.monotonic()
+        if not force and self._synced_at is not None and now - self._synced_at < self.FLUSH_INTERVAL_SECONDS:
+            return
+        self._synced_at = now
+        try:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(
+                    "INSERT INTO usage VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (day, method, key) DO UPDATE SET units = units + excluded.units",
+                    [(*key, units) for key, units in self._pending.items()],
+                )
+                oldest = (datetime.now(QUOTA_TIMEZONE) - timedelta(days=self.KEEP_DAYS)).strftime("%Y-%m-%d")
+                conn.execute("DELETE FROM usage WHERE day < ?", (oldest,))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            self._pending = {}
+            day = self.today()
+            entry = {"methods": {}, "keys": {}}
+            for method, key, units in conn.execute(
+                "SELECT method, key, units FROM usage WHERE day = ?", (day,)
+            ):
+                if key:
+                    entry["keys"][key] = units
+                else:
+                    entry["methods"][method] = units
+            self._days = {day: entry}
+        except sqlite3.Error as e:
+            print(f"Warning: Could not update quota ledger: {e}")
+
+    def flush(self):
+        with self._lock:
+            if self._pending:
+                self._sync(force=True)
+
+    def _totals(self, day):
+        """Methods and keys for ``day``: the last database read plus pending charges."""
+        entry = self._days.get(day, {"methods": {}, "keys": {}})
+        methods = dict(entry["methods"])
+        keys = dict(entry["keys"])
+        for (pending_day, method, key), units in self._pending.items():
+            if pending_day != day:
+                continue
+            target, name = (keys, key) if key else (methods, method)
+            target[name] = target.get(name, 0) + units
+        return methods, keys
+
+    @staticmethod
+    def today():
+        return datetime.now(QUOTA_TIMEZONE).strftime("%Y-%m-%d")
+
+    @staticmethod
+    def cost_of(method):
+        return QUOTA_COSTS.get(method, 1)
+
+    @staticmethod
+    def fingerprint(api_key):
+        return hashlib.sha1(api_key.encode("utf-8")).hexdigest()[:12]
+
+    def usage(self, day=None):
+        with self._lock:
+            self._sync()
+            return self._totals(day or self.today())[0]
+
+    def used_today(self):
+        return sum(self.usage().values())
+
+    def used_by_key(self, api_key):
+        with self._lock:
+            self._sync()
+            return self._totals(self.today())[1].get(self.fingerprint(api_key), 0)
+
+    def remaining(self, key_count=1):
+        limit = DAILY_QUOTA * max(1, key_count)
+        if self.budget is not None:
+            limit = min(self.budget, limit)
+        return max(0, limit - self.used_today())
+
+    def charge(self, method, api_key=None):
+        units = self.cost_of(method)
+        day = self.today()
+        with self._lock:
+            self._sync()
+            total = sum(self._totals(day)[0].values())
+            if self.budget is not None and total + units > self.budget:
+                raise QuotaBudgetExceeded(
+                    f"{method} needs {units} units but only {max(0, self.budget - total)} of the {self.budget}-unit budget are left today."
+                )
+            self._pending[(day, method, "")] = self._pending.get((day, method, ""), 0) + units
+            if api_key:
+                key = (day, "", self.fingerprint(api_key))
+                self._pending[key] = self._pending.get(key, 0) + units
+        return units
+
+_ledger = None
+_ledger_lock = threading.Lock()
+
+def get_quota_ledger():
+    global _ledger
+    with _ledger_lock:
+        if _ledger is None:
+            _ledger = QuotaLedger()
+        return _ledger
+
+def set_quota_budget(units):
+    get_quota_ledger().budget = units
+
+KEY_STRATEGY_REMAINING = "remaining"
+KEY_STRATEGY_ROUND_ROBIN = "round-robin"
+KEY_STRATEGIES = (KEY_STRATEGY_REMAINING, KEY_STRATEGY_ROUND_ROBIN)
+
+class KeyPool:
+    """Several API keys used as one, skipping keys whose daily quota is spent.
+
+    ``remaining`` picks the key with the fewest units booked today;
+    ``round-robin`` cycles through them in order.
+    """
+
+    def __init__(self, keys, strategy=KEY_STRATEGY_REMAINING):
+        self.keys = list(dict.fromkeys(key for key in keys if key))
+        self.strategy = strategy
+        self._lock = threading.Lock()
+        self._next = 0
+        self._exhausted = {}
+
+    def _available(self):
+        today = QuotaLedger.today()
+        return [key for key in self.keys if self._exhausted.get(key) != today]
+
+    def has_available(self):
+        with self._lock:
+            return bool(self._available())
+
+    def select(self, ledger):
+        """The key for the next request, or None if every key is exhausted."""
+        with self._lock:
+            available = self._available()
+            if not available:
+                return None
+            if self.strategy == KEY_STRATEGY_ROUND_ROBIN:
+                key = available[self._next % len(available)]
+                self._next += 1
+                return key
+        return min(available, key=ledger.used_by_key)
+
+    def mark_exhausted(self, api_key):
+        with self._lock:
+            self._exhausted[api_key] = QuotaLedger.today()
+
+_key_pool = None
+
+def configure_api_keys(keys, strategy=KEY_STRATEGY_REMAINING):
+    """Route every Data API request through a pool of ``keys``.
+
+    With a single key (or none) requests keep the key their client was
+    built with.
+    """
+    global _key_pool
+    keys = [key for key in keys if key]
+    _key_pool = KeyPool(keys, strategy) if len(keys) > 1 else None
+
+def get_key_pool():
+    return _key_pool
+
+def describe_key(api_key):
+    return f"{api_key[:4]}...{api_key[-4:]}"
+
+def _is_quota_error(error):
+    if error.resp.status != 403:
+        return False
+    try:
+        details = json.loads(error.content.decode("utf-8"))["error"]["errors"]
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return False
+    return any(
+        detail.get("reason") in ("quotaExceeded", "dailyLimitExceeded")
+        for detail in details
+    )
+
+def _with_key(uri, api_key):
+    parts = urlsplit(uri)
+    query = [(name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True) if name != "key"]
+    query.append(("key", api_key))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+def _key_of(uri):
+    return dict(parse_qsl(urlsplit(uri).query)).get("key")
+
+_metered_request_classes = None
+
+def _get_metered_request_class(rotate_keys=True):
+    global _metered_request_classes
+    if _metered_request_classes is not None:
+        return _metered_request_classes[rotate_keys]
+
+    from googleapiclient.errors import HttpError
+    from googleapiclient.http import HttpRequest
+
+    class MeteredHttpRequest(HttpRequest):
+        """HttpRequest that books its quota cost before it is sent.
+
+        When a key pool is configured the request is sent with the pool's
+        choice of key, and moves on to the next key if Google reports that
+        key's quota as exhausted.
+        """
+
+        rotate_keys = True
+
+        def execute(self, *args, **kwargs):
+            # methodId is e.g. "youtube.search.list".
+            method = self.methodId.split(".", 1)[-1] if self.methodId else "unknown"
+            ledger = get_quota_ledger()
+            pool = get_key_pool() if self.rotate_keys else None
+            while True:
+                api_key = pool.select(ledger) if pool else None
+                if api_key:
+                    self.uri = _with_key(self.uri, api_key)
+                else:
+                    api_key = _key_of(self.uri)
+                ledger.charge(method, api_key)
+                try:
+                    return super().execute(*args, **kwargs)
+                except HttpError as e:
+                    if pool is None or not api_key or not _is_quota_error(e):
+                        raise
+                    pool.mark_exhausted(api_key)
+                    if not pool.has_available():
+                        raise
+                    print(f"Quota exhausted for API key {describe_key(api_key)}; switching to the next key.")
+
+    class PinnedKeyHttpRequest(MeteredHttpRequest):
+        """Metered, but always sent with the client's own key."""
+
+        rotate_keys = False
+
+    _metered_request_classes = {True: MeteredHttpRequest, False: PinnedKeyHttpRequest}
+    return _metered_request_classes[rotate_keys]
+
+def build_service(api_key, rotate_keys=True):
+    """Build a new YouTube Data API client from the shared discovery document.
+
+    With ``rotate_keys=False`` requests ignore the configured key pool, which
+    is what checking one particular key needs.
+    """
+    from googleapiclient.discovery import build_from_document
+
+    return build_from_document(
+        get_discovery_document(),
+        developerKey=api_key,
+        requestBuilder=_get_metered_request_class(rotate_keys),
+    )
+
+def get_service(api_key):
+    """Return this thread's client for ``api_key``, building it on first use.
+
+    Service objects sit on top of httplib2, which is not thread-safe, so each
+    thread gets its own instance.
+    """
+    services = getattr(_local, "services", None)
+    if services is None:
+        services = _local.services = {}
+    service = services.get(api_key)
+    if service is None:
+        service = services[api_key] = build_service(api_key)
+    return service
+
+class ServicePool:
+    """Clients for one API key that concurrent threads check out one at a time.
+
+    Each client owns its own HTTP connection, so requests issued from
+    different threads never share httplib2 state. Clients are built lazily
+    and reused; at most ``size`` exist at once.
+    """
+
+    DEFAULT_SIZE = 8
+
+    def __init__(self, api_key, size=DEFAULT_SIZE):
+        self.api_key = api_key
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._idle = []
+
+    @contextmanager
+    def client(self):
+        self._slots.acquire()
+        try:
+            with self._lock:
+                service = self._idle.pop() if self._idle else None
+            if service is None:
+                service = build_service(self.api_key)
+            try:
+                yield service
+            finally:
+                with self._lock:
+                    self._idle.append(service)
+        finally:
+            self._slots.release()
+
+def get_uploads_playlist_id(youtube, channel_id):
+    """The channel's uploads playlist, or None if the channel has none."""
+    response = youtube.channels().list(part="contentDetails", id=channel_id).execute()
+    items = response.get("items", [])
+    if not items:
+        return None
+    return items[0].get("contentDetails", {}).get("relatedPlaylists", {}).get("uploads")
+
+def iter_uploads(youtube, playlist_id, page_size=50):
+    """Yield ``(video_id, published_at, title)`` from an uploads playlist, newest first.
+
+    Pages cost 1 unit each against 100 for the equivalent ``search.list``
+    with ``order="date"``.
+    """
+    page_token = None
+    while True:
+        response = youtube.playlistItems().list(
+            part="snippet,contentDetails",
+            playlistId=playlist_id,
+            maxResults=page_size,
+            pageToken=page_token,
+        ).execute()
+        for item in response.get("items", []):
+            details = item.get("contentDetails", {})
+            video_id = details.get("videoId")
+            if video_id:
+                yield (
+                    video_id,
+                    details.get("videoPublishedAt", ""),
+                    item.get("snippet", {}).get("title", ""),
+                )
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            return